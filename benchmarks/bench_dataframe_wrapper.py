@@ -0,0 +1,78 @@
+"""Compare the backend-native filter, sort and select of the dataframe wrappers with
+the generic path that goes through `to_dict` and `from_dict`.
+
+Usage: python benchmarks/bench_dataframe_wrapper.py [num_rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from timeit import repeat
+
+import numpy as np
+
+from himena.data_wrappers import wrap_dataframe
+from himena.data_wrappers._dataframe import DataFrameWrapper
+
+
+def _make_data(num_rows: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    data = {f"f{i}": rng.normal(size=num_rows) for i in range(8)}
+    data["i"] = rng.integers(0, 100, size=num_rows)
+    data["s"] = rng.choice(["a", "b", "c"], size=num_rows).astype(object)
+    return data
+
+
+def _make_frame(backend: str, data: dict[str, np.ndarray]):
+    if backend == "pandas":
+        import pandas as pd
+
+        return pd.DataFrame(data)
+    elif backend == "polars":
+        import polars as pl
+
+        return pl.DataFrame(data)
+    elif backend == "pyarrow":
+        import pyarrow as pa
+
+        return pa.table(data)
+    raise ValueError(backend)
+
+
+def _best_ms(func, number: int = 5) -> float:
+    return min(repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def main(num_rows: int = 1_000_000):
+    data = _make_data(num_rows)
+    mask = np.arange(num_rows) % 3 == 0
+    print(f"{num_rows} rows, time in ms (native / generic)")
+    for backend in ["pandas", "polars", "pyarrow"]:
+        try:
+            df = wrap_dataframe(_make_frame(backend, data))
+        except ImportError:
+            print(f"{backend}: not installed")
+            continue
+        cases = {
+            "filter": (
+                lambda: df.filter(mask),
+                lambda: DataFrameWrapper.filter(df, mask),
+            ),
+            "sort": (
+                lambda: df.sort("f0", descending=True),
+                lambda: DataFrameWrapper.sort(df, "f0", descending=True),
+            ),
+            "select": (
+                lambda: df.select(["f0", "s"]),
+                lambda: DataFrameWrapper.select(df, ["f0", "s"]),
+            ),
+        }
+        for name, (native, generic) in cases.items():
+            print(
+                f"{backend:>8} {name:>7}: "
+                f"{_best_ms(native):9.2f} / {_best_ms(generic):9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
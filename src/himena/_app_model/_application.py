@@ -82,6 +82,8 @@ class HimenaApplication(Application):
             and all(isinstance(m, WidgetDataModel) for m in result)
             and info is not None
         ):
+            if info.streamed:
+                return None  # already added as each model was ready
             add_data_model_func = _add_data_model_func(ui, info)
             if ui._instructions.process_model_output:
                 for model in result:
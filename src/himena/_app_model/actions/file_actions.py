@@ -342,7 +342,7 @@ def load_session_from_dialog(ui: MainWindow) -> None:
     """Load a application session from a file."""
     if path := ui.exec_file_dialog(
         mode="r",
-        allowed_extensions=[".session.zip"],
+        allowed_extensions=[".session.zip", ".himena-session"],
         group="session",
     ):
         ui.load_session(path)
@@ -371,7 +371,11 @@ def save_session(ui: MainWindow) -> Parametric:
     @configure_gui(
         save_path={
             "mode": "w",
-            "filter": "Session file (*.session.zip);;Session directory (*.session;*)",
+            "filter": (
+                "Session file (*.session.zip);;"
+                "Binary session file (*.himena-session);;"
+                "Session directory (*.session;*)"
+            ),
             "value": f"himena-{datetime_str}.session.zip",
         },
         allow_calculate={"choices": choices, "widget_type": "Select"},
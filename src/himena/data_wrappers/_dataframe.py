@@ -167,6 +167,18 @@ class DataFrameWrapper(ABC):
     def get_subset(self, r: slice | np.ndarray, c: slice) -> DataFrameWrapper:
         """Return a subset of the dataframe by slicing at df.iloc[r, c]."""
 
+    def get_column_slice(
+        self, index: int, rows: slice | NDArray[np.integer]
+    ) -> np.ndarray:
+        """Return the values of a column at the given rows as a 1D numpy array.
+
+        Unlike `column_to_array`, only the requested rows are converted, and missing
+        values and non-numeric scalars are returned as the same objects as
+        `get_item`.
+        """
+        cname = self.column_names()[index]
+        return self.column_to_array(cname)[rows]
+
     @abstractmethod
     def num_rows(self) -> int:
         """Return the number of rows in the dataframe."""
@@ -243,20 +255,26 @@ class DataFrameWrapper(ABC):
         return self.from_dict(dict_filt)
 
     def sort(self, key: str, *, descending: bool = False) -> Self:
-        """Sort the dataframe by the given key."""
+        """Sort the dataframe by the given key.
+
+        The sort is stable in both directions, and null values are placed last.
+        """
         d = self.to_dict()
-        order = np.argsort(d[key])
-        if descending:
-            order = len(order) - 1 - order
+        order = _stable_argsort(d[key], descending=descending)
         dict_sorted = {k: v[order] for k, v in d.items()}
         return self.from_dict(dict_sorted)
 
     def select(self, columns: list[str]) -> Self:
         """Select columns by name."""
-        dict_new = {k: v for k, v in self.to_dict().items() if k in columns}
+        dict_new = {k: self.column_to_array(k) for k in self._columns_in_order(columns)}
         df_new = self.from_dict(dict_new)
         return df_new
 
+    def _columns_in_order(self, columns: list[str]) -> list[str]:
+        """Return the given columns in the order of this dataframe."""
+        columns = set(columns)
+        return [k for k in self.column_names() if k in columns]
+
 
 class DictWrapper(DataFrameWrapper):
     def __init__(self, df: Mapping[str, np.ndarray]):
@@ -371,6 +389,12 @@ class PandasWrapper(DataFrameWrapper):
     def get_subset(self, r, c) -> PandasWrapper:
         return PandasWrapper(self._df.iloc[r, c])
 
+    def get_column_slice(self, index, rows) -> np.ndarray:
+        series = self._df.iloc[rows, index]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufc":
+            return series.to_numpy()
+        return _object_array(series.tolist())
+
     def num_rows(self) -> int:
         return self._df.shape[0]
 
@@ -409,6 +433,19 @@ class PandasWrapper(DataFrameWrapper):
         df_new = self._df.assign(**data)
         return PandasWrapper(df_new)
 
+    def filter(self, array: NDArray[np.bool_] | Sequence[int]) -> PandasWrapper:
+        return PandasWrapper(self._df.iloc[_as_row_selector(array)])
+
+    def sort(self, key: str, *, descending: bool = False) -> PandasWrapper:
+        return PandasWrapper(
+            self._df.sort_values(
+                key, ascending=not descending, kind="stable", na_position="last"
+            )
+        )
+
+    def select(self, columns: list[str]) -> PandasWrapper:
+        return PandasWrapper(self._df[self._columns_in_order(columns)])
+
     @classmethod
     def from_dict(cls, data: dict) -> DataFrameWrapper:
         import pandas as pd
@@ -451,6 +488,12 @@ class PolarsWrapper(DataFrameWrapper):
     def get_subset(self, r, c) -> PolarsWrapper:
         return PolarsWrapper(self._df[r, c])
 
+    def get_column_slice(self, index, rows) -> np.ndarray:
+        series = self._df.to_series(index)[rows]
+        if series.dtype.is_numeric() and series.null_count() == 0:
+            return series.to_numpy()
+        return _object_array(series.to_list())
+
     def num_rows(self) -> int:
         return self._df.shape[0]
 
@@ -511,6 +554,29 @@ class PolarsWrapper(DataFrameWrapper):
         df_new = self._df.with_columns(**data)
         return PolarsWrapper(df_new)
 
+    def filter(self, array: NDArray[np.bool_] | Sequence[int]) -> PolarsWrapper:
+        import polars as pl
+
+        array = _as_row_selector(array)
+        if array.dtype.kind == "b":
+            return PolarsWrapper(self._df.filter(pl.Series(array)))
+        return PolarsWrapper(self._df[array])
+
+    def sort(self, key: str, *, descending: bool = False) -> PolarsWrapper:
+        import polars as pl
+
+        by = pl.col(key)
+        if self._df[key].dtype.is_float():
+            by = by.fill_nan(None)  # NaN is the largest value in polars
+        return PolarsWrapper(
+            self._df.sort(
+                by, descending=descending, nulls_last=True, maintain_order=True
+            )
+        )
+
+    def select(self, columns: list[str]) -> PolarsWrapper:
+        return PolarsWrapper(self._df.select(self._columns_in_order(columns)))
+
     @classmethod
     def from_dict(cls, data: dict) -> DataFrameWrapper:
         import polars as pl
@@ -553,6 +619,26 @@ class PyarrowWrapper(DataFrameWrapper):
             df_sub = self._df.select(self._df.column_names[c]).take(pa.array(r))
         return PyarrowWrapper(df_sub)
 
+    def get_column_slice(self, index, rows) -> np.ndarray:
+        import pyarrow as pa
+
+        column = self._df.column(index)
+        if isinstance(rows, slice) and rows.step in (None, 1):
+            start, stop, _ = rows.indices(len(column))
+            column = column.slice(start, max(stop - start, 0))
+        else:
+            if isinstance(rows, slice):
+                rows = np.arange(len(column))[rows]
+            column = column.take(pa.array(rows))
+        ptype = column.type
+        if (
+            pa.types.is_integer(ptype)
+            or pa.types.is_floating(ptype)
+            or pa.types.is_boolean(ptype)
+        ) and column.null_count == 0:
+            return column.to_numpy()
+        return _object_array(column.to_pylist())
+
     def num_rows(self) -> int:
         return self._df.num_rows
 
@@ -626,6 +712,21 @@ class PyarrowWrapper(DataFrameWrapper):
             new_table = new_table.append_column(name, pa.array(data[name]))
         return PyarrowWrapper(new_table)
 
+    def filter(self, array: NDArray[np.bool_] | Sequence[int]) -> PyarrowWrapper:
+        import pyarrow as pa
+
+        array = _as_row_selector(array)
+        if array.dtype.kind == "b":
+            return PyarrowWrapper(self._df.filter(pa.array(array)))
+        return PyarrowWrapper(self._df.take(pa.array(array)))
+
+    def sort(self, key: str, *, descending: bool = False) -> PyarrowWrapper:
+        order = "descending" if descending else "ascending"
+        return PyarrowWrapper(self._df.sort_by([(key, order)], null_placement="at_end"))
+
+    def select(self, columns: list[str]) -> PyarrowWrapper:
+        return PyarrowWrapper(self._df.select(self._columns_in_order(columns)))
+
     @classmethod
     def from_dict(cls, data: dict) -> DataFrameWrapper:
         import pyarrow as pa
@@ -655,6 +756,47 @@ class PyarrowWrapper(DataFrameWrapper):
             )
 
 
+def _as_row_selector(array: NDArray[np.bool_] | Sequence[int]) -> np.ndarray:
+    """Normalize a boolean mask or a sequence of row indices to an array."""
+    array = np.asarray(array)
+    if array.dtype.kind != "b":
+        array = array.astype(np.intp, copy=False)
+    return array
+
+
+def _null_mask(arr: np.ndarray) -> NDArray[np.bool_]:
+    """Return the mask of None, NaN and NaT values."""
+    if arr.dtype.kind in "fc":
+        return np.isnan(arr)
+    if arr.dtype.kind in "mM":
+        return np.isnat(arr)
+    if arr.dtype.kind == "O":
+        return np.fromiter((v is None or v != v for v in arr), bool, len(arr))
+    return np.zeros(len(arr), dtype=bool)
+
+
+def _stable_argsort(arr: np.ndarray, descending: bool = False) -> NDArray[np.intp]:
+    """Stable argsort in both directions, with null values placed last."""
+    arr = np.asarray(arr)
+    null = _null_mask(arr)
+    (valid,) = np.nonzero(~null)
+    values = arr[valid]
+    if descending:
+        # stable ascending sort of the reversed array, reversed back
+        order = len(values) - 1 - np.argsort(values[::-1], kind="stable")[::-1]
+    else:
+        order = np.argsort(values, kind="stable")
+    return np.concatenate([valid[order], np.nonzero(null)[0]])
+
+
+def _object_array(values: list[Any]) -> NDArray[np.object_]:
+    """Convert a list to a 1D object array without broadcasting nested sequences."""
+    out = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        out[i] = value
+    return out
+
+
 class DtypeTuple(NamedTuple):
     """Normalized dtype description."""
 
@@ -20,8 +20,16 @@ def test_read_csv(mod: str, sample_dir: Path, tmpdir):
     assert df.dtypes[1].kind == "f"
     df_filt = df.filter(np.array([True, False, True, False, True]))
     assert df_filt.shape == (3, 3)
-    df.sort("b")
-    df.sort("a", descending=True)
+    assert type(df_filt) is type(df)
+    assert df_filt["a"].tolist() == [1, 4, 8]
+    assert df.filter([4, 0])["a"].tolist() == [8, 1]
+    assert df.filter([]).shape == (0, 3)
+    assert df.sort("b")["a"].tolist() == [4, 6, 1, 8, 3]
+    assert df.sort("a", descending=True)["a"].tolist() == [8, 6, 4, 3, 1]
+    df_sel = df.select(["c", "a"])
+    assert type(df_sel) is type(df)
+    assert df_sel.column_names() == ["a", "c"]
+    assert df_sel["c"].tolist() == ["X", "Y", "X", "X", "Y"]
 
     df_cycled_csv = df.from_csv_string(df.to_csv_string())
     assert type(df_cycled_csv) is type(df)
@@ -45,6 +53,26 @@ def test_read_csv(mod: str, sample_dir: Path, tmpdir):
     df.write(save_dir / "table.txt")
     df.write(save_dir / "table.tsv")
 
+@pytest.mark.parametrize("mod", ["dict", "pandas", "polars", "pyarrow"])
+def test_sort_stable_nulls_last(mod: str):
+    data = {"a": [2.0, np.nan, 1.0, 2.0, 1.0], "b": [0, 1, 2, 3, 4]}
+    if mod == "dict":
+        df = wrap_dataframe(data)
+    elif mod == "pandas":
+        import pandas as pd
+
+        df = wrap_dataframe(pd.DataFrame(data))
+    elif mod == "polars":
+        import polars as pl
+
+        df = wrap_dataframe(pl.DataFrame(data))
+    elif mod == "pyarrow":
+        import pyarrow as pa
+
+        df = wrap_dataframe(pa.table(data))
+    assert df.sort("a")["b"].tolist() == [2, 4, 0, 3, 1]
+    assert df.sort("a", descending=True)["b"].tolist() == [0, 3, 2, 4, 1]
+
 def test_narwhals():
     import narwhals
 
@@ -55,6 +83,16 @@ def test_narwhals():
     wrap_dataframe(WidgetDataModel(value=df, type="dataframe"))
     wrap_dataframe(wrap_dataframe(df))
 
+def test_pandas_keeps_index():
+    import pandas as pd
+
+    df = wrap_dataframe(
+        pd.DataFrame({"a": [3, 1, 2], "b": ["x", "y", "z"]}, index=["p", "q", "r"])
+    )
+    assert df.sort("a").unwrap().index.tolist() == ["q", "r", "p"]
+    assert df.filter([False, True, True]).unwrap().index.tolist() == ["q", "r"]
+    assert df.select(["b"]).unwrap().index.tolist() == ["p", "q", "r"]
+
 def test_write_pandas(tmpdir):
     import pandas as pd
 
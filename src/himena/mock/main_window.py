@@ -396,6 +396,9 @@ class MockBackend(BackendMainWindow):
     def _add_job_progress(self, future: Future, desc: str, total: int = 0) -> None:
         """Add a job to the job stack."""
 
+    def _process_events(self) -> None:
+        """Process the pending GUI events, so that the changes are shown."""
+
     def _add_whats_this(
         self,
         text: str,
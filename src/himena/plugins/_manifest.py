@@ -0,0 +1,339 @@
+"""Cache of the actions contributed by plugins, used to import plugins lazily.
+
+When a plugin is imported, the actions it registered are recorded in a manifest file
+in the user data directory. On the next launch, a plugin that only contributes
+actions (no readers, writers, widget classes, configs, startup callbacks etc.) is not
+imported. Its actions are registered from the manifest, with a callback that imports
+the plugin when one of the commands is called for the first time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from functools import cache
+import importlib.metadata
+import importlib.util
+import json
+import logging
+from pathlib import Path
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+from app_model import Action
+from app_model.expressions import Expr
+
+from himena.consts import NO_RECORDING_FIELD
+from himena.profile import data_dir
+
+if TYPE_CHECKING:
+    from himena._app_model import HimenaApplication
+    from himena.plugins.actions import AppActionRegistry
+    from himena.plugins.install import PluginInstallResult
+    from himena.widgets import MainWindow
+
+_LOGGER = logging.getLogger(__name__)
+_MANIFEST_FILE = "plugin_manifest.json"
+
+
+@dataclass
+class PluginManifest:
+    """Actions and submenus contributed by a plugin."""
+
+    key: str
+    lazy: bool = False
+    actions: list[dict[str, Any]] = field(default_factory=list)
+    submenu_titles: dict[str, str] = field(default_factory=dict)
+    submenu_groups: dict[str, str] = field(default_factory=dict)
+    submenu_order: dict[str, int] = field(default_factory=dict)
+
+
+class PluginManifestCache:
+    """The manifest file of all the plugins."""
+
+    def __init__(self, path: Path, manifests: dict[str, dict[str, Any]]):
+        self._path = path
+        self._manifests = manifests
+        self._changed = False
+
+    @classmethod
+    def load(cls) -> PluginManifestCache:
+        path = data_dir() / _MANIFEST_FILE
+        manifests = {}
+        if path.exists():
+            try:
+                with path.open("r") as f:
+                    manifests = json.load(f)
+            except Exception as e:
+                _LOGGER.warning("Failed to load plugin manifest %s: %r", path, e)
+        return cls(path, manifests)
+
+    def get(self, name: str, key: str | None) -> PluginManifest | None:
+        """Return the manifest of the plugin if it is up to date."""
+        if key is None or (entry := self._manifests.get(name)) is None:
+            return None
+        try:
+            manifest = PluginManifest(**entry)
+        except TypeError:
+            return None
+        if manifest.key != key:
+            return None
+        return manifest
+
+    def set(self, name: str, manifest: PluginManifest) -> None:
+        if (entry := asdict(manifest)) != self._manifests.get(name):
+            self._manifests[name] = entry
+            self._changed = True
+
+    def save(self) -> None:
+        """Save the manifests to the file if any of them is updated."""
+        if not self._changed:
+            return
+        try:
+            with self._path.open("w") as f:
+                json.dump(self._manifests, f)
+        except Exception as e:
+            _LOGGER.warning("Failed to save plugin manifest %s: %r", self._path, e)
+        else:
+            self._changed = False
+
+
+def plugin_key(name: str) -> str | None:
+    """Key that changes when himena or the plugin is updated, without importing it.
+
+    All the source files of the package of the plugin are considered, because the
+    plugin module usually imports other modules of the same package.
+    """
+    if name.endswith(".py"):
+        stamp = _source_stamp((Path(name),))
+    else:
+        stamp = _package_stamp(name)
+    if stamp is None:
+        return None
+    parts = [_dist_version("himena"), stamp]
+    if not name.endswith(".py"):
+        parts.append(_dist_version(name.split(".")[0]))
+    return ":".join(parts)
+
+
+def import_and_record(
+    reg: AppActionRegistry,
+    name: str,
+    key: str | None,
+    install: Callable[[], PluginInstallResult | None],
+) -> tuple[PluginInstallResult | None, PluginManifest | None]:
+    """Install the plugin and return the manifest of what it registered.
+
+    The manifest is None if the registrations cannot be attributed to the plugin,
+    such as when the plugin module is already imported.
+    """
+    if key is None or name in sys.modules:
+        return install(), None
+    counts = _registration_counts(reg)
+    action_ids = set(reg._actions)
+    titles = reg._submenu_titles.copy()
+    groups = reg._submenu_groups.copy()
+    orders = reg._submenu_order.copy()
+    result = install()
+    if result is None or result.error is not None:
+        return result, None
+    manifest = PluginManifest(
+        key=key,
+        submenu_titles=_new_items(reg._submenu_titles, titles),
+        submenu_groups=_new_items(reg._submenu_groups, groups),
+        submenu_order=_new_items(reg._submenu_order, orders),
+    )
+    if (
+        _registration_counts(reg) == counts
+        and result.startup is None
+        and result.teardown is None
+    ):
+        new_ids = [id_ for id_ in reg._actions if id_ not in action_ids]
+        try:
+            manifest.actions = [_action_to_dict(reg, reg._actions[i]) for i in new_ids]
+        except TypeError as e:
+            _LOGGER.debug("Actions of plugin %s are not serializable: %r", name, e)
+        else:
+            manifest.lazy = True
+    return result, manifest
+
+
+def add_lazy_plugin(
+    reg: AppActionRegistry,
+    name: str,
+    manifest: PluginManifest,
+) -> bool:
+    """Register the actions of the plugin from the manifest without importing it.
+
+    Returns False if the plugin has to be imported instead.
+    """
+    if not manifest.lazy:
+        return False
+    try:
+        actions = [
+            (_action_from_dict(name, each), each["dynamic"])
+            for each in manifest.actions
+        ]
+    except Exception as e:
+        _LOGGER.warning("Invalid manifest of plugin %s: %r", name, e)
+        return False
+    if any(action.id in reg._actions for action, _ in actions):
+        return False
+    for action, is_dynamic in actions:
+        reg.add_action(action, is_dynamic=is_dynamic)
+    reg._submenu_titles.update(manifest.submenu_titles)
+    reg._submenu_groups.update(manifest.submenu_groups)
+    reg._submenu_order.update(manifest.submenu_order)
+    reg._lazy_plugins[name] = [action.id for action, _ in actions]
+    return True
+
+
+def load_lazy_plugin(app: HimenaApplication, name: str) -> None:
+    """Import the plugin that was installed lazily and register its actions."""
+    from himena.plugins.actions import AppActionRegistry
+    from himena.plugins.install import _install_one
+
+    reg = AppActionRegistry.instance()
+    if (command_ids := reg._lazy_plugins.pop(name, None)) is None:
+        return
+    for id_ in command_ids:
+        # actions may be replaced by the real ones if other plugins imported this one
+        if (action := reg._actions.get(id_)) and is_lazy_command(action):
+            reg._actions.pop(id_)
+            reg._actions_dynamic.discard(id_)
+    _LOGGER.info("Importing plugin %s", name)
+    manifests = PluginManifestCache.load()
+    _, manifest = import_and_record(
+        reg, name, plugin_key(name), lambda: _install_one(name, False)
+    )
+    if manifest is not None:
+        manifests.set(name, manifest)
+        manifests.save()
+    # commands newly added to the plugin are registered here
+    reg.install_to(app)
+
+
+def is_lazy_command(action: Action) -> bool:
+    """True if the action is registered from a manifest and not imported yet."""
+    return isinstance(action.callback, LazyPluginCommand)
+
+
+class LazyPluginCommand:
+    """Command callback that imports the plugin when it is called for the first time."""
+
+    def __init__(self, plugin: str, command_id: str):
+        self._plugin = plugin
+        self._command_id = command_id
+
+    def __call__(self, ui: MainWindow):
+        from himena.plugins.actions import AppActionRegistry
+
+        load_lazy_plugin(ui.model_app, self._plugin)
+        action = AppActionRegistry.instance()._actions.get(self._command_id)
+        if action is None or is_lazy_command(action):
+            raise ValueError(
+                f"Command {self._command_id!r} is not provided by the plugin "
+                f"{self._plugin!r} anymore."
+            )
+        store = ui.model_app.injection_store
+        return store.inject(action.callback, processors=True)()
+
+
+def _action_to_dict(reg: AppActionRegistry, action: Action) -> dict[str, Any]:
+    out = _to_jsonable(action.model_dump(exclude={"callback"}, exclude_defaults=True))
+    json.dumps(out)  # raises TypeError if not serializable
+    return {
+        "action": out,
+        "dynamic": action.id in reg._actions_dynamic,
+        "no_recording": getattr(action.callback, NO_RECORDING_FIELD, False),
+    }
+
+
+def _action_from_dict(plugin: str, each: dict[str, Any]) -> Action:
+    callback = LazyPluginCommand(plugin, each["action"]["id"])
+    if each.get("no_recording", False):
+        setattr(callback, NO_RECORDING_FIELD, True)
+    return Action.model_validate({**each["action"], "callback": callback})
+
+
+def _to_jsonable(obj: Any) -> Any:
+    if isinstance(obj, Expr):
+        return str(obj)  # parsed back by the app-model validator
+    if isinstance(obj, dict):
+        return {k: _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_jsonable(v) for v in obj]
+    return obj
+
+
+def _registration_counts(reg: AppActionRegistry) -> tuple[int, ...]:
+    """Number of registered objects that cannot be restored from a manifest."""
+    from himena._providers import ClipboardReaderStore, ReaderStore, WriterStore
+    from himena.plugins.widget_class import _WIDGET_ID_TO_WIDGET_CLASS
+
+    num_qt_widgets = 0
+    if qt_registry := sys.modules.get("himena.qt.registry._api"):
+        num_qt_widgets = sum(len(v) for v in qt_registry._APP_TYPE_TO_QWIDGET.values())
+    return (
+        len(ReaderStore.instance()._plugin_items),
+        len(WriterStore.instance()._plugin_items),
+        len(ClipboardReaderStore.instance()._plugin_items),
+        len(_WIDGET_ID_TO_WIDGET_CLASS),
+        num_qt_widgets,
+        len(reg._plugin_default_configs),
+        len(reg._modification_trackers),
+        len(reg._app_tips),
+        sum(1 for _ in reg._action_hint_reg.iter_all()),
+    )
+
+
+def _new_items(current: dict[str, Any], old: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in current.items() if k not in old or old[k] != v}
+
+
+def _package_stamp(name: str) -> str | None:
+    """Stamp of the source files of the plugin package, found without importing."""
+    top, *rest = name.split(".")
+    try:
+        spec = importlib.util.find_spec(top)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    if not spec.submodule_search_locations:
+        if rest or not spec.has_location:
+            return None
+        return _source_stamp((Path(spec.origin),))
+    locations = tuple(spec.submodule_search_locations)
+    for location in locations:
+        path = Path(location, *rest)
+        if path.with_suffix(".py").exists() or path.joinpath("__init__.py").exists():
+            return _package_sources_stamp(locations)
+    return None
+
+
+@cache
+def _package_sources_stamp(locations: tuple[str, ...]) -> str | None:
+    # cached because all the submodules of a package share the same stamp
+    return _source_stamp(
+        sorted(path for loc in locations for path in Path(loc).rglob("*.py"))
+    )
+
+
+def _source_stamp(sources: Sequence[Path]) -> str | None:
+    try:
+        stats = [source.stat() for source in sources]
+    except OSError:
+        return None
+    if not stats:
+        return None
+    mtime = max(stat.st_mtime_ns for stat in stats)
+    size = sum(stat.st_size for stat in stats)
+    return f"{len(stats)}-{mtime}-{size}"
+
+
+@cache
+def _dist_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
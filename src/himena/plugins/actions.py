@@ -32,6 +32,7 @@ from himena import _utils
 from himena.types import WidgetDataModel
 from himena.utils.collections import OrderedSet
 from himena.plugins import _utils as _plugins_utils
+from himena.plugins._manifest import is_lazy_command
 from himena.workflow import ActionHintRegistry
 
 if TYPE_CHECKING:
@@ -127,6 +128,8 @@ class AppActionRegistry:
         }
         self._submenu_order: dict[str, int] = {}
         self._installed_plugins: list[str] = []
+        # plugins installed from the manifest cache and not imported yet
+        self._lazy_plugins: dict[str, list[str]] = {}
         self._plugin_default_configs: dict[str, PluginConfigTuple] = {}
         self._modification_trackers: dict[str, Callable[[_T, _T], ReproduceArgs]] = {}
         self._app_tips: list[AppTip] = []
@@ -165,7 +168,8 @@ class AppActionRegistry:
     def add_action(self, action: Action, is_dynamic: bool = False) -> None:
         """Add an action to the registry."""
         id_ = action.id
-        if id_ in self._actions:
+        if (existing := self._actions.get(id_)) and not is_lazy_command(existing):
+            # lazy command is replaced if its plugin is imported from other plugins
             raise ValueError(f"Action ID {id_} already exists.")
         self._actions[id_] = action
         if is_dynamic:
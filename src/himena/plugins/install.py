@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 import logging
 import traceback
 from importlib import import_module
@@ -24,9 +25,16 @@ def install_plugins(
 ) -> list[PluginInstallResult]:
     """Install plugins to the application."""
     from himena.plugins import AppActionRegistry
+    from himena.plugins._manifest import (
+        PluginManifestCache,
+        add_lazy_plugin,
+        import_and_record,
+        plugin_key,
+    )
     from himena.profile import load_app_profile
 
     reg = AppActionRegistry.instance()
+    manifests = PluginManifestCache.load()
     results = []
     show_import_time = app.attributes.get("print_import_time", False)
     if show_import_time:
@@ -36,14 +44,30 @@ def install_plugins(
     for name in plugins:
         if name in reg._installed_plugins:
             continue
-        if install_result := _install_one(name, show_import_time):
+        key = plugin_key(name)
+        manifest = manifests.get(name, key)
+        if manifest is not None and add_lazy_plugin(reg, name, manifest):
+            # the plugin is imported when one of its commands is called
+            if show_import_time:
+                print(f"{name}\tdeferred")
+            results.append(PluginInstallResult(name))
+            continue
+        install_result, manifest = import_and_record(
+            reg, name, key, partial(_install_one, name, show_import_time)
+        )
+        if install_result:
             results.append(install_result)
+        if manifest is not None:
+            manifests.set(name, manifest)
+    manifests.save()
     reg.install_to(app)
     reg._installed_plugins.extend(plugins)
     prof = load_app_profile(app.name)
 
+    plugin_configs_old = prof.plugin_configs.copy()
     _resolve_config_conflict(prof.plugin_configs, reg._plugin_default_configs)
-    prof.save()
+    if prof.plugin_configs != plugin_configs_old:
+        prof.save()
     return results
 
 
@@ -170,13 +170,20 @@ class WriterPlugin(_IOPluginBase):
         *,
         priority: int = 100,
         module: str | None = None,
+        thread_safe: bool = False,
     ):
         super().__init__(writer, matcher, priority=priority, module=module)
+        self._thread_safe = thread_safe
         if arg := get_widget_data_model_type_arg(writer):
             self._value_type_filter = arg
         else:
             self._value_type_filter = None
 
+    @property
+    def thread_safe(self) -> bool:
+        """True if the writer can be called from other threads."""
+        return self._thread_safe
+
     def write(self, model: WidgetDataModel, path: Path) -> None:
         _LOGGER.info("Writing file using writer plugin: %s", self)
         return self._func(model, path)
@@ -317,16 +324,20 @@ def register_writer_plugin(
     *,
     priority: int = 100,
     module: str | None = None,
+    thread_safe: bool = False,
 ) -> WriterPlugin: ...
 @overload
 def register_writer_plugin(
     *,
     priority: int = 100,
     module: str | None = None,
+    thread_safe: bool = False,
 ) -> Callable[[Callable[[WidgetDataModel, Path], Any]], WriterPlugin]: ...
 
 
-def register_writer_plugin(writer=None, *, priority=100, module=None):
+def register_writer_plugin(
+    writer=None, *, priority=100, module=None, thread_safe=False
+):
     """Register a writer plugin function.
 
     Decorate a function to register it as a writer plugin. The function should take a
@@ -364,6 +375,9 @@ def register_writer_plugin(writer=None, *, priority=100, module=None):
     module : str | None, default None
         The module name override. This is usefule when you want to register a reader
         function in the upper scope to simplify the plugin info display.
+    thread_safe : bool, default False
+        If True, the writer may be called from other threads, such as when a session
+        is saved. Writers that use Qt or other GUI libraries must not set this.
     """
 
     def _inner(func):
@@ -371,7 +385,9 @@ def register_writer_plugin(writer=None, *, priority=100, module=None):
             raise ValueError("Writer plugin must be callable.")
         ins = WriterStore().instance()
 
-        writer_plugin = WriterPlugin(func, priority=priority, module=module)
+        writer_plugin = WriterPlugin(
+            func, priority=priority, module=module, thread_safe=thread_safe
+        )
         ins.add_writer(writer_plugin)
         return writer_plugin
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import logging
+from collections import defaultdict
 from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Iterable, cast, Callable
 
@@ -93,7 +94,7 @@ class QCommandPaletteBase(QtW.QFrame):
 
     def update_context(self, parent: QMainWindow) -> None:
         """Update the context of the palette."""
-        self._list._app_model_context = parent._himena_main_window._ctx_keys.dict()
+        self._list.set_context(parent._himena_main_window._ctx_keys.dict())
 
     def show(self) -> None:
         if self._need_initialize:
@@ -244,6 +245,7 @@ class QCommandPalette(QCommandPaletteBase):
         for elem in palette_menu_commands:
             if elem in added:
                 self._list.all_commands.append(elem)
+        self._list._on_commands_changed()
 
 
 class QCommandLineEdit(QtW.QLineEdit):
@@ -422,6 +424,8 @@ class QCommandListBase(QtW.QListView):
 
         self._match_color = "#468cc6"
         self._app_model_context: dict[str, Any] = {}
+        # enablement of commands for the current context, keyed by command ID
+        self._enabled_cache: dict[str, bool] = {}
 
     def _on_clicked(self, index: QtCore.QModelIndex) -> None:
         if index.isValid():
@@ -458,6 +462,22 @@ class QCommandListBase(QtW.QListView):
     def extend_command(self, commands: Iterable[Action]) -> None:
         """Extend the list of commands."""
         self.all_commands.extend(commands)
+        self._on_commands_changed()
+
+    def _on_commands_changed(self) -> None:
+        """Called when the list of commands is changed."""
+
+    def set_context(self, context: dict[str, Any]) -> None:
+        """Set the app-model context used to evaluate the command enablement."""
+        self._app_model_context = context
+        self._enabled_cache.clear()
+
+    def _is_enabled(self, command: CommandRule) -> bool:
+        """Return true if the command is enabled, cached for the current context."""
+        if (enabled := self._enabled_cache.get(command.id)) is None:
+            enabled = _enabled(command, self._app_model_context)
+            self._enabled_cache[command.id] = enabled
+        return enabled
 
     def command_at(self, index: int) -> CommandRule | None:
         if index_widget := self.widget_at(index - self._index_offset):
@@ -474,6 +494,7 @@ class QCommandListBase(QtW.QListView):
             # move to the top
             self.all_commands.remove(command)
             self.all_commands.insert(0, command)
+            self._on_commands_changed()
 
     def can_execute(self) -> bool:
         """Return true if the command can be executed."""
@@ -481,7 +502,7 @@ class QCommandListBase(QtW.QListView):
         command = self.command_at(index)
         if command is None:
             return False
-        return _enabled(command, self._app_model_context)
+        return self._is_enabled(command)
 
     def widget_at(self, index: int) -> QCommandLabel | None:
         """Return the label widget at the given index."""
@@ -514,6 +535,18 @@ class QCommandListBase(QtW.QListView):
 
 
 class QCommandList(QCommandListBase):
+    def __init__(self, formatter: Callable[[Action], str]):
+        super().__init__(formatter)
+        self._index: _CommandIndex | None = None
+
+    def _on_commands_changed(self) -> None:
+        self._index = None  # rebuilt on the next search
+
+    def _search_index(self) -> _CommandIndex:
+        if self._index is None:
+            self._index = _CommandIndex(self.all_commands, self._formatter)
+        return self._index
+
     def update_for_text(self, input_text: str) -> None:
         """Update the list to match the input text."""
         self._selected_index = 0
@@ -526,7 +559,7 @@ class QCommandList(QCommandListBase):
                 self._current_max_index = row
                 break
             lw.set_command(action, self._formatter(action))
-            if _enabled(action, self._app_model_context):
+            if self._is_enabled(action):
                 lw.set_disabled(False)
                 lw.set_text_colors(input_text, color=self._match_color)
             else:
@@ -544,17 +577,19 @@ class QCommandList(QCommandListBase):
         self.update_selection()
 
     def iter_top_hits(self, input_text: str) -> Iterator[CommandRule]:
-        """Iterate over the top hits for the input text"""
-        commands: list[tuple[float, CommandRule]] = []
-        for command in self.all_commands:
-            score = _match_score(self._formatter(command), input_text)
-            if score > 0.0:
-                if _enabled(command, self._app_model_context):
-                    score += 10.0
-                commands.append((score, command))
-        commands.sort(key=lambda x: x[0], reverse=True)
-        for _, command in commands:
-            yield command
+        """Iterate over the top hits for the input text.
+
+        Enabled commands come first. Because the enablement is evaluated lazily,
+        stopping the iteration after the displayed rows avoids evaluating the
+        enablement of all the matched commands.
+        """
+        disabled: list[CommandRule] = []
+        for command in self._search_index().search(input_text):
+            if self._is_enabled(command):
+                yield command
+            else:
+                disabled.append(command)
+        yield from disabled
 
     def sizeHint(self) -> QtCore.QSize:
         return QtCore.QSize(600, 360)
@@ -581,11 +616,64 @@ def _enabled(action: CommandRule, context: Mapping[str, Any]) -> bool:
         return False
 
 
-def _match_score(command_text: str, input_text: str) -> float:
-    """Return a match score (between 0 and 1) for the input text."""
-    name = command_text.lower()
-    if all(word in name for word in input_text.lower().split(" ")):
-        return 1.0
-    if len(input_text) < 4 and all(char in name for char in input_text.lower()):
-        return 0.7
-    return 0.0
+class _CommandIndex:
+    """Search index of the commands in the palette.
+
+    Normalized command texts and the trigram table are built once per command list.
+    Matches of the last query are kept, so that a query that extends the last one
+    (such as the next keystroke) only checks the commands matched last time.
+    """
+
+    def __init__(
+        self,
+        commands: Iterable[CommandRule],
+        formatter: Callable[[Action], str],
+    ):
+        self._commands = list(commands)
+        self._texts = [formatter(cmd).lower() for cmd in self._commands]
+        self._trigrams: defaultdict[str, set[int]] = defaultdict(set)
+        for i, text in enumerate(self._texts):
+            for start in range(len(text) - 2):
+                self._trigrams[text[start : start + 3]].add(i)
+        self._last_query: str | None = None
+        self._last_hits: list[int] = []
+
+    def search(self, input_text: str) -> list[CommandRule]:
+        """Return the matched commands.
+
+        Commands that contain all the words come first, then those that contain
+        all the characters (only for short inputs). The original order of the
+        commands is kept within each group.
+        """
+        query = input_text.lower()
+        if self._last_query is not None and query.startswith(self._last_query):
+            candidates: Iterable[int] = self._last_hits
+        else:
+            candidates = range(len(self._texts))
+        words = query.split(" ")
+        match_chars = len(input_text) < 4
+        if not match_chars and (allowed := self._trigram_candidates(words)) is not None:
+            candidates = sorted(allowed.intersection(candidates))
+
+        word_hits: list[int] = []
+        char_hits: list[int] = []
+        for i in candidates:
+            text = self._texts[i]
+            if all(word in text for word in words):
+                word_hits.append(i)
+            elif match_chars and all(char in text for char in query):
+                char_hits.append(i)
+        self._last_query = query
+        self._last_hits = sorted(word_hits + char_hits)
+        return [self._commands[i] for i in word_hits + char_hits]
+
+    def _trigram_candidates(self, words: list[str]) -> set[int] | None:
+        """Commands that contain all the trigrams of the words, if any trigram."""
+        out: set[int] | None = None
+        for word in words:
+            for start in range(len(word) - 2):
+                ids = self._trigrams.get(word[start : start + 3], set())
+                out = ids.copy() if out is None else out & ids
+                if not out:
+                    return out
+        return out
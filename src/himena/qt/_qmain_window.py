@@ -941,6 +941,13 @@ class QMainWindow(QModelMainWindow, widgets.BackendMainWindow[QtW.QWidget]):
     def _add_job_progress(self, future: Future, desc: str, total: int = 0) -> None:
         self._job_stack.add_future(future, desc, total)
 
+    def _process_events(self) -> None:
+        # user inputs are kept in the queue, otherwise windows could be closed or
+        # another session could be loaded while a session is being loaded
+        QtW.QApplication.processEvents(
+            QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents
+        )
+
     def _add_whats_this(
         self,
         text: str,
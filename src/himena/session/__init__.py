@@ -7,6 +7,7 @@ from ._api import (
     dump_tab_to_directory,
     dump_tab_to_zip,
 )
+from ._binary import BINARY_SESSION_SUFFIX, update_from_binary, dump_binary
 
 __all__ = [
     "AppSession",
@@ -17,4 +18,7 @@ __all__ = [
     "dump_zip",
     "dump_tab_to_directory",
     "dump_tab_to_zip",
+    "update_from_binary",
+    "dump_binary",
+    "BINARY_SESSION_SUFFIX",
 ]
@@ -1,36 +1,61 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, Sequence
-from pathlib import Path
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Sequence
+from pathlib import Path, PurePosixPath
+import threading
 import warnings
 import yaml
 import zipfile
 import tempfile
-from himena.session._session import AppSession, TabSession
+from himena.session._session import AppSession, TabSession, WindowDescription
 from himena.session._utils import (
     write_model_by_title,
     write_metadata_by_title,
     replace_invalid_characters,
+    pack_workflows,
+    unpack_workflows,
+    writer_is_thread_safe,
 )
 from himena.standards import read_metadata
 from himena.widgets._wrapper import ParametricWindow
-from himena.workflow import LocalReaderMethod
+from himena.types import WidgetDataModel
+from himena.workflow import LocalReaderMethod, Workflow
+from himena.workflow._reader import RuntimeInputBound
 from himena.workflow._command import CommandExecution
 
 if TYPE_CHECKING:
     from uuid import UUID
-    from himena.widgets import MainWindow, TabArea
+    from himena.widgets import MainWindow, SubWindow, TabArea
 
 _SESSION_YAML = "session.yaml"
+_MAX_WRITE_WORKERS = 4  # number of files written at the same time
 
 
 def update_from_directory(ui: MainWindow, path: str | Path) -> None:
     """Update GUI from a session directory."""
-    dirpath = Path(path)
+    _update_from_directory(ui, Path(path))
+
+
+def _update_from_directory(
+    ui: MainWindow,
+    dirpath: Path,
+    bound_values: Mapping[tuple[int, int], Any] = {},
+) -> None:
+    """Update GUI from a session directory.
+
+    `bound_values` maps (tab index, window index) to the value of the window that is
+    already loaded, such as a memory-mapped array. Tab index is ignored for a tab
+    session.
+    """
     with dirpath.joinpath(_SESSION_YAML).open("r") as f:
         yml = yaml.load(f, Loader=yaml.Loader)
     if not (isinstance(yml, dict) and "session" in yml):
         raise ValueError("Invalid session file.")
+    yml = unpack_workflows(yml)
     wf_overrides = {}
     if yml.pop("session") == "main":
         session = AppSession.model_validate(yml)
@@ -40,13 +65,24 @@ def update_from_directory(ui: MainWindow, path: str | Path) -> None:
             ith = int(tab_dir.stem.split("_")[0])
             for uuid, meth in _iter_reader_method(tab_dir, session.tabs[ith]):
                 wf_overrides[uuid] = meth
+        for (i_tab, i_win), value in bound_values.items():
+            win_sess = session.tabs[i_tab].windows[i_win]
+            wf_overrides[win_sess.id] = _bound_value_workflow(win_sess, value)
         session.update_gui(ui, workflow_override=wf_overrides, dirpath=dirpath)
     else:
         session = TabSession.model_validate(yml)
         wf_overrides = dict(_iter_reader_method(dirpath, session))
+        for (_, i_win), value in bound_values.items():
+            win_sess = session.windows[i_win]
+            wf_overrides[win_sess.id] = _bound_value_workflow(win_sess, value)
         session.update_gui(ui, workflow_override=wf_overrides, dirpath=dirpath)
 
 
+def _bound_value_workflow(win_sess: WindowDescription, value: Any) -> Workflow:
+    model = WidgetDataModel(value=value, type=win_sess.model_type, title=win_sess.title)
+    return RuntimeInputBound(bound_value=model).construct_workflow()
+
+
 def _iter_reader_method(
     dirpath: Path,
     tab_session: TabSession,
@@ -90,13 +126,7 @@ def dump_tab_to_directory(
 ):
     path = Path(path)
     path.mkdir(exist_ok=True)
-    session = TabSession.from_gui(tab, allow_calculate=True)
-    cmd_id_allowed = set(allow_calculate)
-    with open(path / _SESSION_YAML, "w") as f:
-        js = session.model_dump(mode="json")
-        js = {"session": "tab", **js}
-        yaml.dump(js, f, sort_keys=False)
-    _dump_tab_to_directory_impl(tab, path, save_copies, cmd_id_allowed)
+    _dump_tab(tab, _DirectorySink(path), save_copies, allow_calculate)
 
 
 def dump_tab_to_zip(
@@ -105,39 +135,176 @@ def dump_tab_to_zip(
     save_copies: bool = False,
     allow_calculate: Sequence[str] = (),
 ):
-    path = Path(path)
-    with tempfile.TemporaryDirectory() as tmpdir, zipfile.ZipFile(path, "w") as z:
-        tmpdir = Path(tmpdir)
-        dump_tab_to_directory(
-            tab, tmpdir, save_copies=save_copies, allow_calculate=allow_calculate
+    with zipfile.ZipFile(path, "w") as z:
+        _dump_tab(tab, _ZipSink(z), save_copies, allow_calculate)
+
+
+def _dump_tab(
+    tab: TabArea,
+    sink: _SessionSink,
+    save_copies: bool,
+    allow_calculate: Sequence[str],
+):
+    get_model = _model_getter()
+    session = TabSession.from_gui(tab, allow_calculate=True, get_model=get_model)
+    js = {"session": "tab", **session.model_dump(mode="json")}
+    sink.write_text(_SESSION_YAML, yaml.dump(pack_workflows(js), sort_keys=False))
+    main_thread_tasks: list[Callable[[], None]] = []
+    with ThreadPoolExecutor(max_workers=_MAX_WRITE_WORKERS) as executor:
+        futures = _submit_tab(
+            executor,
+            tab,
+            sink,
+            "",
+            get_model,
+            save_copies,
+            set(allow_calculate),
+            main_thread_tasks,
         )
-        for file in tmpdir.rglob("*"):
-            z.write(file, file.relative_to(tmpdir))
+        for task in main_thread_tasks:
+            task()
+    for future in futures:
+        future.result()
 
 
-def _dump_tab_to_directory_impl(
+def _submit_tab(
+    executor: ThreadPoolExecutor,
     tab: TabArea,
-    dirname: Path,
+    sink: _SessionSink,
+    dirname: str,
+    get_model: Callable[[SubWindow], WidgetDataModel],
     save_copies: bool,
     cmd_id_allowed: set[str],
-):
+    main_thread_tasks: list[Callable[[], None]],
+) -> list[Future[None]]:
+    """Submit the tasks to write the files of all the windows in the tab.
+
+    Models are exported in the main thread, and only writing them to the files is
+    done in the executor. Models whose writers are not thread-safe are added to
+    `main_thread_tasks` instead.
+    """
+    futures: list[Future[None]] = []
     for i, win in enumerate(tab):
         if isinstance(win, ParametricWindow):
             continue
         prefix = str(i)
         read_from = win._determine_read_from()
         if read_from is not None and isinstance(read_from[0], Path) and not save_copies:
-            write_metadata_by_title(win, dirname, prefix)
+            save_model = False
         elif (
             isinstance(step := win._widget_workflow.last(), CommandExecution)
             and step.command_id in cmd_id_allowed
         ):
-            write_metadata_by_title(win, dirname, prefix)
+            save_model = False
         elif win.supports_to_model and win.supports_update_model:
-            write_model_by_title(win, dirname, prefix=prefix)
+            save_model = True
         else:
             # Cannot read or write the window state, must rely on command execution
-            write_metadata_by_title(win, dirname, prefix)
+            save_model = False
+        model = get_model(win)
+        task = partial(
+            _write_window, sink, dirname, model, win.title, prefix, save_model
+        )
+        if save_model and not writer_is_thread_safe(model):
+            main_thread_tasks.append(task)
+        else:
+            futures.append(executor.submit(task))
+    return futures
+
+
+def _write_window(
+    sink: _SessionSink,
+    dirname: str,
+    model: WidgetDataModel,
+    title: str,
+    prefix: str,
+    save_model: bool,
+) -> None:
+    if save_model:
+        sink.write_model(dirname, model, title, prefix)
+    else:
+        sink.write_metadata(dirname, model, title, prefix)
+
+
+def _model_getter() -> Callable[[SubWindow], WidgetDataModel]:
+    """Return a function that calls `to_model` only once for each window."""
+    models: dict[int, WidgetDataModel] = {}
+
+    def _get_model(win: SubWindow) -> WidgetDataModel:
+        if (model := models.get(id(win))) is None:
+            model = models[id(win)] = win.to_model()
+        return model
+
+    return _get_model
+
+
+class _SessionSink(ABC):
+    """Destination of the session files."""
+
+    @abstractmethod
+    def write_text(self, name: str, text: str) -> None:
+        """Write a text file at the relative path."""
+
+    @abstractmethod
+    def staging(self, dirname: str) -> AbstractContextManager[Path]:
+        """Context manager that provides a real directory to write files in.
+
+        Files written in the directory are stored under `dirname` of the sink on exit.
+        """
+
+    def write_model(
+        self, dirname: str, model: WidgetDataModel, title: str, prefix: str
+    ) -> None:
+        """Write the model and its metadata under `dirname`."""
+        with self.staging(dirname) as path:
+            write_model_by_title(model, title, path, prefix=prefix)
+
+    def write_metadata(
+        self, dirname: str, model: WidgetDataModel, title: str, prefix: str
+    ) -> None:
+        """Write only the metadata of the model under `dirname`."""
+        with self.staging(dirname) as path:
+            write_metadata_by_title(model, title, path, prefix)
+
+
+class _DirectorySink(_SessionSink):
+    def __init__(self, root: Path):
+        self._root = root
+
+    def write_text(self, name: str, text: str) -> None:
+        self._root.joinpath(name).write_text(text)
+
+    @contextmanager
+    def staging(self, dirname: str) -> Iterator[Path]:
+        path = self._root.joinpath(dirname)
+        path.mkdir(parents=True, exist_ok=True)
+        yield path
+
+
+class _ZipSink(_SessionSink):
+    """Write files directly into a zip file.
+
+    Readers and writers need real file paths, so that each window is written to its
+    own temporary directory, moved to the zip file and deleted immediately.
+    """
+
+    def __init__(self, z: zipfile.ZipFile):
+        self._zip = z
+        self._lock = threading.Lock()
+
+    def write_text(self, name: str, text: str) -> None:
+        with self._lock:
+            self._zip.writestr(name, text)
+
+    @contextmanager
+    def staging(self, dirname: str) -> Iterator[Path]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            yield tmpdir
+            with self._lock:
+                for file in tmpdir.rglob("*"):
+                    arcname = PurePosixPath(dirname, *file.relative_to(tmpdir).parts)
+                    self._zip.write(file, str(arcname))
 
 
 def dump_directory(
@@ -160,17 +327,7 @@ def dump_directory(
     """
     path = Path(path)
     path.mkdir(exist_ok=True)
-    session = AppSession.from_gui(ui, allow_calculate=True)
-    cmd_id_allowed = set(allow_calculate)
-    with open(path / _SESSION_YAML, "w") as f:
-        js = session.model_dump(mode="json")
-        js = {"session": "main", **js}
-        yaml.dump(js, f, sort_keys=False)
-    for i_tab, tab in enumerate(ui.tabs):
-        tab_title = replace_invalid_characters(tab.title)
-        dirname = path / f"{i_tab}_{tab_title}"
-        dirname.mkdir()
-        _dump_tab_to_directory_impl(tab, dirname, save_copies, cmd_id_allowed)
+    _dump_app(ui, _DirectorySink(path), save_copies, allow_calculate)
 
 
 def dump_zip(
@@ -191,11 +348,41 @@ def dump_zip(
             :
     ```
     """
-    path = Path(path)
-    with tempfile.TemporaryDirectory() as tmpdir, zipfile.ZipFile(path, "w") as z:
-        tmpdir = Path(tmpdir)
-        dump_directory(
-            ui, tmpdir, save_copies=save_copies, allow_calculate=allow_calculate
-        )
-        for file in tmpdir.rglob("*"):
-            z.write(file, file.relative_to(tmpdir))
+    with zipfile.ZipFile(path, "w") as z:
+        _dump_app(ui, _ZipSink(z), save_copies, allow_calculate)
+
+
+def _dump_app(
+    ui: MainWindow,
+    sink: _SessionSink,
+    save_copies: bool,
+    allow_calculate: Sequence[str],
+):
+    get_model = _model_getter()
+    session = AppSession.from_gui(ui, allow_calculate=True, get_model=get_model)
+    js = {"session": "main", **session.model_dump(mode="json")}
+    sink.write_text(_SESSION_YAML, yaml.dump(pack_workflows(js), sort_keys=False))
+    cmd_id_allowed = set(allow_calculate)
+    futures: list[Future[None]] = []
+    main_thread_tasks: list[Callable[[], None]] = []
+    with ThreadPoolExecutor(max_workers=_MAX_WRITE_WORKERS) as executor:
+        for i_tab, tab in enumerate(ui.tabs):
+            tab_title = replace_invalid_characters(tab.title)
+            dirname = f"{i_tab}_{tab_title}"
+            futures.extend(
+                _submit_tab(
+                    executor,
+                    tab,
+                    sink,
+                    dirname,
+                    get_model,
+                    save_copies,
+                    cmd_id_allowed,
+                    main_thread_tasks,
+                )
+            )
+        # run while the thread-safe writers are running in the executor
+        for task in main_thread_tasks:
+            task()
+    for future in futures:
+        future.result()
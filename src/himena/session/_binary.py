@@ -0,0 +1,147 @@
+"""Binary session container with memory-mapped array payloads.
+
+A binary session is an uncompressed zip file with the same layout as a session zip
+file, but the windows whose values are numeric arrays are stored as `.npy` members
+aligned to 64 bytes. On loading, these members are memory-mapped directly from the
+container instead of being read by the file readers, so that restoring a session
+with large images does not read the pixels until they are needed.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path, PurePosixPath
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Sequence
+import zipfile
+
+import numpy as np
+
+from himena.session._api import _dump_app, _update_from_directory, _ZipSink
+from himena.session._utils import replace_invalid_characters
+
+if TYPE_CHECKING:
+    from himena.types import WidgetDataModel
+    from himena.widgets import MainWindow
+
+BINARY_SESSION_SUFFIX = ".himena-session"
+
+_ALIGNMENT = 64  # same as the alignment of the array data in a .npy file
+_ZIP_LOCAL_HEADER_SIZE = 30
+_ZIP64_EXTRA_SIZE = 20
+_PADDING_HEADER_ID = 0xD935  # header ID of the extra field used by zipalign
+
+
+def dump_binary(
+    ui: MainWindow,
+    path: str | Path,
+    save_copies: bool = False,
+    allow_calculate: Sequence[str] = (),
+):
+    """Dump the main window state as a binary session file.
+
+    The file is written to a temporary file and then moved to the path, because the
+    arrays of the current windows may be memory-mapped from the file at the path.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_STORED) as z:
+            _dump_app(ui, _BinarySink(z), save_copies, allow_calculate)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def update_from_binary(ui: MainWindow, path: str | Path) -> None:
+    """Update GUI from a binary session file.
+
+    Array payloads are memory-mapped in the copy-on-write mode. Other files are
+    extracted to a temporary directory and read by the file readers.
+    """
+    path = Path(path)
+    bound_values: dict[tuple[int, int], np.ndarray] = {}
+    with (
+        zipfile.ZipFile(path) as z,
+        tempfile.TemporaryDirectory() as tmpdir,
+    ):
+        for info in z.infolist():
+            if (arr := _memmap_member(path, info)) is None:
+                z.extract(info, tmpdir)
+                continue
+            parts = PurePosixPath(info.filename).parts
+            i_tab = int(parts[0].split("_", 1)[0]) if len(parts) > 1 else 0
+            i_win = int(parts[-1].split("_", 1)[0])
+            bound_values[(i_tab, i_win)] = arr
+        _update_from_directory(ui, Path(tmpdir), bound_values)
+
+
+class _BinarySink(_ZipSink):
+    def write_model(
+        self, dirname: str, model: WidgetDataModel, title: str, prefix: str
+    ) -> None:
+        if not _is_memmappable(arr := model.value):
+            return super().write_model(dirname, model, title, prefix)
+        filename = replace_invalid_characters(f"{prefix}_{title}.npy")
+        arcname = str(PurePosixPath(dirname, filename))
+        with self._lock:
+            _write_aligned_npy(self._zip, arcname, arr)
+        return self.write_metadata(dirname, model, title, prefix)
+
+
+def _is_memmappable(value) -> bool:
+    return (
+        isinstance(value, np.ndarray)
+        and not value.dtype.hasobject
+        and value.dtype.kind != "T"  # StringDType
+    )
+
+
+def _write_aligned_npy(z: zipfile.ZipFile, arcname: str, arr: np.ndarray) -> None:
+    """Write an array as an uncompressed .npy member whose data start is aligned."""
+    zinfo = zipfile.ZipInfo(arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zip64 = arr.nbytes + 1024 > zipfile.ZIP64_LIMIT
+    # the member data starts after the local file header and the extra field
+    data_start = (
+        z.fp.tell()
+        + _ZIP_LOCAL_HEADER_SIZE
+        + len(arcname.encode("utf-8"))
+        + 4  # header of the padding field
+        + (_ZIP64_EXTRA_SIZE if zip64 else 0)
+    )
+    padding = -data_start % _ALIGNMENT
+    zinfo.extra = struct.pack("<HH", _PADDING_HEADER_ID, padding) + b"\0" * padding
+    with z.open(zinfo, "w", force_zip64=zip64) as f:
+        np.lib.format.write_array(f, arr, allow_pickle=False)
+
+
+def _memmap_member(path: Path, info: zipfile.ZipInfo) -> np.ndarray | None:
+    """Memory-map the .npy member of the zip file, or return None if impossible."""
+    if not info.filename.endswith(".npy") or info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with path.open("rb") as f:
+        f.seek(info.header_offset)
+        header = f.read(_ZIP_LOCAL_HEADER_SIZE)
+        if header[:4] != b"PK\x03\x04":
+            return None
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        f.seek(info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        offset = f.tell()
+    if dtype.hasobject:
+        return None
+    order = "F" if fortran_order else "C"
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype, order=order)
+    return np.memmap(
+        path, dtype=dtype, mode="c", offset=offset, shape=shape, order=order
+    )
@@ -1,7 +1,7 @@
 from contextlib import suppress
 import importlib
 from pathlib import Path
-from typing import Any, Mapping, TypeVar, TYPE_CHECKING
+from typing import Any, Callable, Mapping, TypeVar, TYPE_CHECKING
 import uuid
 import warnings
 from pydantic import BaseModel, Field
@@ -44,8 +44,13 @@ class WindowDescription(BaseModel):
         window: "SubWindow",
         *,
         allow_calculate: bool = False,
+        model: "WidgetDataModel | None" = None,
     ) -> "WindowDescription":
-        """Construct a WindowDescription from a SubWindow instance."""
+        """Construct a WindowDescription from a SubWindow instance.
+
+        If the model of the window is already exported, it can be given as `model` to
+        avoid calling `to_model` again.
+        """
         read_from = window._determine_read_from()
         if read_from is None:
             if allow_calculate:
@@ -57,7 +62,8 @@ class WindowDescription(BaseModel):
                 path=read_from[0],
                 plugin=read_from[1],
             )
-        model = window.to_model()
+        if model is None:
+            model = window.to_model()
         return WindowDescription(
             title=window.title,
             rect=window.rect,
@@ -132,7 +138,10 @@ class TabSession(BaseModel):
         tab: "TabArea[_W]",
         *,
         allow_calculate: bool = False,
+        get_model: "Callable[[SubWindow], WidgetDataModel] | None" = None,
     ) -> "TabSession":
+        if get_model is None:
+            get_model = _to_model
         layouts: list[dict] = []
         for ly in tab.layouts:
             if ly is tab._minimized_window_stack_layout:
@@ -141,7 +150,9 @@ class TabSession(BaseModel):
         return TabSession(
             name=tab.name,
             windows=[
-                WindowDescription.from_gui(window, allow_calculate=allow_calculate)
+                WindowDescription.from_gui(
+                    window, allow_calculate=allow_calculate, model=get_model(window)
+                )
                 for window in tab
                 if not isinstance(window, ParametricWindow)
             ],
@@ -166,13 +177,14 @@ class TabSession(BaseModel):
             wf = window_session.prep_workflow(workflow_override)
             _pending_workflows.append(wf)
 
-        models = compute(_pending_workflows)
         _failed_sessions: list[tuple[WindowDescription, Exception]] = []
         _id_to_win: dict[uuid.UUID, "SubWindow"] = {}
-        for (i_win_sess, _win_sess), model_or_exc in zip(_win_sessions, models):
+
+        def _add_window(i: int, model_or_exc: "WidgetDataModel | Exception"):
+            i_win_sess, _win_sess = _win_sessions[i]
             if isinstance(model_or_exc, Exception):
                 _failed_sessions.append((_win_sess, model_or_exc))
-                continue
+                return
             # look for the metadata
             meta_path = dirpath / f"{i_win_sess}_{_win_sess.title}.himena-meta"
             if meta_path.exists():
@@ -184,8 +196,9 @@ class TabSession(BaseModel):
                         RuntimeWarning,
                         stacklevel=2,
                     )
-            _win = _win_sess.process_model(self, model_or_exc)
-            _id_to_win[_win_sess.id] = _win
+            _id_to_win[_win_sess.id] = _win_sess.process_model(area, model_or_exc)
+
+        _compute_progressively(main, _pending_workflows, None, _add_window)
 
         if 0 <= cur_index < len(area):
             area.current_index = cur_index
@@ -233,6 +246,7 @@ class AppSession(BaseModel):
         main: "MainWindow[_W]",
         *,
         allow_calculate: bool = False,
+        get_model: "Callable[[SubWindow], WidgetDataModel] | None" = None,
     ) -> "AppSession":
         app_prof = main.app_profile
         profile = AppProfileInfo(
@@ -243,7 +257,9 @@ class AppSession(BaseModel):
         return AppSession(
             profile=profile,
             tabs=[
-                TabSession.from_gui(tab, allow_calculate=allow_calculate)
+                TabSession.from_gui(
+                    tab, allow_calculate=allow_calculate, get_model=get_model
+                )
                 for tab in main.tabs
             ],
             current_index=main.tabs.current_index,
@@ -292,17 +308,19 @@ class AppSession(BaseModel):
                         stacklevel=2,
                     )
             all_metadata.append(meta)
-        models = compute(_pending_workflows, all_metadata)
         _failed_sessions: list[tuple[WindowDescription, Exception]] = []
         _id_to_win: dict[uuid.UUID, "SubWindow"] = {}
-        for (i_win, _win_sess), (i_tab, _tab_area), model_or_exc in zip(
-            _win_sessions, _target_areas, models
-        ):
+
+        def _add_window(i: int, model_or_exc: "WidgetDataModel | Exception"):
+            _win_sess = _win_sessions[i][1]
             if isinstance(model_or_exc, Exception):
                 _failed_sessions.append((_win_sess, model_or_exc))
-                continue
+                return
+            _tab_area = _target_areas[i][1]
             _id_to_win[_win_sess.id] = _win_sess.process_model(_tab_area, model_or_exc)
 
+        _compute_progressively(main, _pending_workflows, all_metadata, _add_window)
+
         # Update current active window for each tab
         for (_, tab_session), (_, area) in zip(_tab_sessions, _target_areas):
             cur_tab_index = tab_session.current_index
@@ -320,6 +338,38 @@ class AppSession(BaseModel):
                 _id_to_win[_win_sess.id]._child_windows.add(_id_to_win[child_id])
 
 
+def _compute_progressively(
+    main: "MainWindow[_W]",
+    workflows: list[Workflow],
+    metadata_overrides: list | None,
+    add_window: "Callable[[int, WidgetDataModel | Exception], None]",
+) -> None:
+    """Compute the workflows in parallel and add the windows as soon as possible.
+
+    Windows are added in the original order, each one as soon as its model and all
+    the preceding ones are ready. GUI events are processed in between, so that the
+    windows appear one by one instead of all at once after everything is read.
+    """
+    ready: dict[int, WidgetDataModel | Exception] = {}
+    next_index = 0
+
+    def _on_computed(i: int, model_or_exc: "WidgetDataModel | Exception"):
+        nonlocal next_index
+        ready[i] = model_or_exc
+        if next_index not in ready:
+            return
+        while next_index in ready:
+            add_window(next_index, ready.pop(next_index))
+            next_index += 1
+        main._backend_main_window._process_events()
+
+    compute(workflows, metadata_overrides, parallel=True, callback=_on_computed)
+
+
+def _to_model(window: "SubWindow") -> "WidgetDataModel":
+    return window.to_model()
+
+
 def _raise_failed(failed: list[tuple[WindowDescription, Exception]]) -> None:
     if len(failed) > 0:
         msg = "Could not load the following windows:\n"
@@ -1,19 +1,20 @@
 from pathlib import Path
+from typing import Any, Iterator
 from himena import io_utils
+from himena._providers import WriterStore
 from himena.standards import BaseMetadata, write_metadata
 from himena.types import WidgetDataModel
-from himena.widgets import SubWindow
 import re
 
 
 def write_model_by_title(
-    win: SubWindow,
+    model: WidgetDataModel,
+    title: str,
     dirname: str | Path,
     plugin: str | None = None,
     prefix: str = "",
 ) -> Path:
     """Write the widget data to a file, return the saved file."""
-    model = win.to_model()
     dirname = Path(dirname)
     save_path = _get_save_path(model, dirname, prefix)
 
@@ -22,10 +23,21 @@ def write_model_by_title(
     io_utils.write(model, save_path, plugin=plugin)
 
     i_win = int(save_path.name.split("_", 1)[0])
-    _save_metadata(model.metadata, dirname, f"{i_win}_{win.title}")
+    _save_metadata(model.metadata, dirname, f"{i_win}_{title}")
     return save_path
 
 
+def writer_is_thread_safe(model: WidgetDataModel) -> bool:
+    """True if the writer used by `write_model_by_title` can run in another thread."""
+    try:
+        path = _get_save_path(model, Path(), "0")
+        min_priority = -float("inf") if path.suffix == ".pickle" else 0
+        writer = WriterStore.instance().pick(model, path, min_priority=min_priority)
+    except Exception:
+        return False  # the error will be raised again in the main thread
+    return writer.thread_safe
+
+
 def _get_save_path(model: WidgetDataModel, dirname: Path, prefix: str = "") -> Path:
     title = model.title or "Untitled"
     if Path(title).suffix in model.extensions:
@@ -49,14 +61,14 @@ def _get_save_path(model: WidgetDataModel, dirname: Path, prefix: str = "") -> P
 
 
 def write_metadata_by_title(
-    win: SubWindow,
+    model: WidgetDataModel,
+    title: str,
     dirname: str | Path,
     prefix: str = "",
 ) -> None:
     """Write model metadata to the default place."""
-    model = win.to_model()
     dirname = Path(dirname)
-    return _save_metadata(model.metadata, dirname, f"{prefix}_{win.title}")
+    return _save_metadata(model.metadata, dirname, f"{prefix}_{title}")
 
 
 def _save_metadata(metadata, dirname: Path, title: str):
@@ -72,3 +84,50 @@ PATTERN_NOT_ALLOWED = re.compile(r"[\\/:*?\"<>|]")
 
 def replace_invalid_characters(title: str) -> str:
     return PATTERN_NOT_ALLOWED.sub("_", title)
+
+
+# Workflows of windows usually share many steps. In the session file, each step is
+# stored once in the top-level step table and the windows refer to them by their IDs.
+_STEP_TABLE_KEY = "workflow_steps"
+# Version of the layout of the session file. Sessions without this key are version 1,
+# where the workflows are stored in each window.
+_FORMAT_KEY = "session_format"
+SESSION_FORMAT = 2
+
+
+def pack_workflows(js: dict[str, Any]) -> dict[str, Any]:
+    """Move the workflow steps of all the windows into a shared step table."""
+    table: dict[str, dict[str, Any]] = {}
+    for window in _iter_window_dicts(js):
+        if not isinstance(wf := window.get("workflow"), dict):
+            continue
+        steps: list[dict[str, Any]] = wf.get("steps", [])
+        if any(table.get(str(step["id"]), step) != step for step in steps):
+            continue  # conflicting step IDs, keep the workflow as is
+        for step in steps:
+            table.setdefault(str(step["id"]), step)
+        window["workflow"] = [str(step["id"]) for step in steps]
+    return {**js, _FORMAT_KEY: SESSION_FORMAT, _STEP_TABLE_KEY: table}
+
+
+def unpack_workflows(js: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of `pack_workflows`. Sessions without a step table are returned as is."""
+    if (version := js.pop(_FORMAT_KEY, 1)) > SESSION_FORMAT:
+        raise ValueError(
+            f"Session file format {version} is not supported by this version of "
+            f"himena (supports up to {SESSION_FORMAT}). Please update himena."
+        )
+    if (table := js.pop(_STEP_TABLE_KEY, None)) is None:
+        return js
+    for window in _iter_window_dicts(js):
+        if isinstance(step_ids := window.get("workflow"), list):
+            window["workflow"] = {"steps": [table[str(id_)] for id_ in step_ids]}
+    return js
+
+
+def _iter_window_dicts(js: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    if "tabs" in js:
+        for tab in js["tabs"]:
+            yield from tab.get("windows", [])
+    else:
+        yield from js.get("windows", [])
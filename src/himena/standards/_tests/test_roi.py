@@ -103,3 +103,55 @@ def test_points_roi_2d():
     assert r0.bbox().width == pytest.approx(0.6, rel=1e-5)
     assert r0.bbox().height == pytest.approx(1.2, rel=1e-5)
     assert r0.to_mask((5, 5)).sum() == 2
+
+def test_polygon_mask_same_as_ray_casting():
+    import numpy as np
+    from himena.standards.roi._utils import points_in_poly
+
+    rng = np.random.default_rng(0)
+    shape = (30, 40)
+    for _ in range(10):
+        vertices = rng.uniform(-5, 45, size=(7, 2))
+        r0 = roi.PolygonRoi(xs=vertices[:, 1], ys=vertices[:, 0])
+        yy, xx = np.indices(shape)
+        points = np.column_stack([yy.ravel(), xx.ravel()])
+        expected = points_in_poly(points, vertices).reshape(shape)
+        assert (r0.to_mask(shape) == expected).all()
+    square = roi.PolygonRoi(xs=[2, 6, 6, 2], ys=[1, 1, 4, 4])
+    assert square.to_mask((10, 10)).sum() == 4 * 3
+
+@pytest.mark.parametrize(
+    "r",
+    [
+        roi.RectangleRoi(x=3.2, y=4, width=10, height=5),
+        roi.EllipseRoi(x=3, y=4, width=10, height=5),
+        roi.CircleRoi(x=8, y=7, radius=4),
+        roi.RotatedRectangleRoi(start=(3, 3), end=(12, 9), width=4),
+        roi.RotatedEllipseRoi(start=(3, 3), end=(12, 9), width=4),
+        roi.PolygonRoi(xs=[2, 10, 6], ys=[3, 5, 14]),
+        roi.PointsRoi2D(xs=[2, 10, 6], ys=[3, 5, 14]),
+        roi.LineRoi(start=(2, 3), end=(10, 8)),
+        roi.SegmentedLineRoi(xs=[2, 10, 6], ys=[3, 5, 14]),
+    ],
+)
+def test_local_mask(r: roi.Roi2D):
+    import numpy as np
+
+    shape = (3, 20, 25)
+    mask = r.to_mask(shape)
+    assert mask.shape == shape
+    local = r.to_local_mask()
+    assert local.count() == mask[0].sum() > 0
+    assert (local.to_full(shape) == mask).all()
+    ysl, xsl = local.slices()
+    assert not np.any(mask[0, :ysl.start]) and not np.any(mask[0, :, :xsl.start])
+    clipped = r.to_local_mask((8, 9))
+    assert clipped.top + clipped.height <= 8 and clipped.left + clipped.width <= 9
+    assert (clipped.to_full((8, 9)) == mask[0, :8, :9]).all()
+
+def test_rotated_ellipse_mask():
+    r0 = roi.RotatedEllipseRoi(start=(2, 2), end=(12, 12), width=2)
+    mask = r0.to_mask((15, 15))
+    assert mask[7, 7] and mask[3, 3] and mask[11, 11]
+    assert not mask[3, 11] and not mask[11, 3]
+    assert abs(mask.sum() - r0.area()) < r0.area() * 0.5
@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 from typing import Any, TYPE_CHECKING, Callable, Literal
 import warnings
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from himena.consts import StandardType
 from himena.standards import roi
 from himena.standards._base import BaseMetadata, _META_NAME
@@ -51,6 +51,8 @@ class TableMeta(BaseMetadata):
         description="Table selections in the format of ((row_start, row_end), (col_start, col_end)), where the end index is exclusive, as is always the case for the Python indexing.",
     )
     separator: str | None = Field(None, description="Separator of the table.")
+    # float64 columns of the table parsed by the widget (`TypedColumns`)
+    _typed_columns: Any = PrivateAttr(default=None)
 
     def expected_type(self):
         return StandardType.TABLE
@@ -26,6 +26,7 @@ from himena.standards.roi.core import (
     SplineRoi,
 )
 from himena.standards.roi._list import RoiListModel
+from himena.standards.roi._utils import LocalMask
 
 __all__ = [
     "RoiModel",
@@ -47,6 +48,7 @@ __all__ = [
     "LineRoi",
     "SplineRoi",
     "RoiListModel",
+    "LocalMask",
     "default_roi_label",
     "pick_roi_model",
 ]
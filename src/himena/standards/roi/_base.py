@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from typing import Self
     import numpy as np
     from numpy.typing import NDArray
+    from himena.standards.roi._utils import LocalMask
 
 
 class RoiModel(BaseModel):
@@ -64,6 +65,18 @@ class Roi2D(RoiModel):
         """Return the bounding box of the ROI."""
         raise NotImplementedError
 
+    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
+        """Return the binary mask of the ROI in the last two dimensions of `shape`."""
+        return self.to_local_mask(shape).to_full(shape)
+
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> LocalMask:
+        """Return the binary mask of the ROI inside its bounding box.
+
+        This is much cheaper than `to_mask` for small ROIs in a large image. If
+        `shape` is given, the bounding box is clipped to the last two dimensions.
+        """
+        raise NotImplementedError
+
     def shifted(self, dx: float, dy: float) -> Self:
         """Return a new 2D ROI translated by the given amount."""
         raise NotImplementedError
@@ -1,8 +1,108 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import math
 import numpy as np
 from numpy.typing import NDArray
+from himena.types import Rect
+
+
+@dataclass(frozen=True)
+class LocalMask:
+    """Binary mask of a ROI inside its bounding box.
+
+    Pixel `(y, x)` of the full-size mask corresponds to
+    `mask[y - top, x - left]` if it is inside the bounding box, otherwise it is False.
+    """
+
+    top: int
+    left: int
+    mask: NDArray[np.bool_]
+
+    @property
+    def height(self) -> int:
+        return self.mask.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.mask.shape[1]
+
+    def bbox(self) -> Rect[int]:
+        """Return the bounding box of the local mask."""
+        return Rect(self.left, self.top, self.width, self.height)
+
+    def slices(self) -> tuple[slice, slice]:
+        """Return the (y, x) slices of the bounding box in the full-size mask."""
+        return (
+            slice(self.top, self.top + self.height),
+            slice(self.left, self.left + self.width),
+        )
+
+    def count(self) -> int:
+        """Number of pixels in the mask."""
+        return int(np.count_nonzero(self.mask))
+
+    def to_full(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
+        """Create the full-size mask of the given shape.
+
+        The local mask is put in the last two dimensions and broadcast to the others.
+        """
+        out = np.zeros(shape, dtype=bool)
+        bottom = min(self.top + self.height, shape[-2])
+        right = min(self.left + self.width, shape[-1])
+        if bottom > self.top and right > self.left:
+            out[..., self.top : bottom, self.left : right] = self.mask[
+                : bottom - self.top, : right - self.left
+            ]
+        return out
+
+
+def pixel_grid(
+    bbox: Rect[float],
+    shape: tuple[int, ...] | None = None,
+) -> tuple[int, int, NDArray[np.intp], NDArray[np.intp]]:
+    """Return the (top, left, yy, xx) of all the pixels in the bounding box.
+
+    `yy` and `xx` are (N, 1) and (1, M) arrays so that they can be broadcast. Pixels
+    on the bottom/right edges are included, and the box is clipped to `shape`.
+    """
+    top = max(int(math.floor(bbox.top)), 0)
+    left = max(int(math.floor(bbox.left)), 0)
+    bottom = int(math.floor(bbox.bottom)) + 1
+    right = int(math.floor(bbox.right)) + 1
+    if shape is not None:
+        bottom = min(bottom, shape[-2])
+        right = min(right, shape[-1])
+    bottom = max(bottom, top)
+    right = max(right, left)
+    yy = np.arange(top, bottom)[:, np.newaxis]
+    xx = np.arange(left, right)[np.newaxis, :]
+    return top, left, yy, xx
+
+
+def local_mask_from_grid(
+    top: int, left: int, mask: NDArray[np.bool_], shape: tuple[int, int]
+) -> LocalMask:
+    """Create a local mask from a (possibly broadcastable) boolean array."""
+    return LocalMask(top, left, np.broadcast_to(mask, shape).copy())
+
+
+def points_mask(
+    ys: NDArray[np.integer],
+    xs: NDArray[np.integer],
+    shape: tuple[int, ...] | None = None,
+) -> LocalMask:
+    """Create a local mask where pixels at (ys, xs) are True."""
+    ok = (ys >= 0) & (xs >= 0)
+    if shape is not None:
+        ok &= (ys < shape[-2]) & (xs < shape[-1])
+    ys, xs = ys[ok], xs[ok]
+    if ys.size == 0:
+        return LocalMask(0, 0, np.zeros((0, 0), dtype=bool))
+    top, left = int(ys.min()), int(xs.min())
+    mask = np.zeros((int(ys.max()) - top + 1, int(xs.max()) - left + 1), dtype=bool)
+    mask[ys - top, xs - left] = True
+    return LocalMask(top, left, mask)
 
 
 def polygon_mask(
@@ -22,10 +122,60 @@ def polygon_mask(
     mask : np.ndarray
         Binary mask of the polygon.
     """
-    x, y = np.indices(shape)
-    points = np.vstack((x.ravel(), y.ravel())).T
-    mask = points_in_poly(points, vertices).reshape(shape)
-    return mask
+    return polygon_mask_local(vertices, shape).to_full(shape)
+
+
+def polygon_mask_local(
+    vertices: NDArray[np.number],
+    shape: tuple[int, ...] | None = None,
+) -> LocalMask:
+    """Create a binary mask of a polygon inside its bounding box.
+
+    The result is same as `points_in_poly` for all the pixels, but the polygon is
+    filled by scanlines so that the cost is proportional to the area of the bounding
+    box and the perimeter.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Nx2 array of the (y, x) vertices of the polygon.
+    shape : tuple of int, optional
+        If given, the mask is clipped to the last two dimensions of this shape.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if vertices.shape[0] == 0:
+        return LocalMask(0, 0, np.zeros((0, 0), dtype=bool))
+    ymin, xmin = vertices.min(axis=0)
+    ymax, xmax = vertices.max(axis=0)
+    top, left, yy, xx = pixel_grid(Rect(xmin, ymin, xmax - xmin, ymax - ymin), shape)
+    height, width = yy.shape[0], xx.shape[1]
+    if height == 0 or width == 0:
+        return LocalMask(top, left, np.zeros((height, width), dtype=bool))
+
+    # edges from vertices[i] to vertices[i - 1], same as `points_in_poly`
+    v_i = vertices
+    d = np.roll(vertices, 1, axis=0) - v_i
+    d[np.abs(d) < 1e-12] = 0
+    v_i, d = v_i[d[:, 1] != 0], d[d[:, 1] != 0]
+    # each edge crosses the columns `x` that satisfy min(x_i, x_j) <= x < max(...)
+    xstart = np.ceil(np.minimum(v_i[:, 1], v_i[:, 1] + d[:, 1]))
+    xstop = np.ceil(np.maximum(v_i[:, 1], v_i[:, 1] + d[:, 1]))
+    xstart = np.maximum(xstart, left).astype(np.intp)
+    xstop = np.minimum(xstop, left + width).astype(np.intp)
+    ncross = np.maximum(xstop - xstart, 0)
+    edge_id = np.repeat(np.arange(ncross.size), ncross)
+    offsets = np.cumsum(ncross) - ncross
+    cols = xstart[edge_id] + np.arange(edge_id.size) - offsets[edge_id]
+    v_i, d = v_i[edge_id], d[edge_id]
+    ycross = d[:, 0] * (cols - v_i[:, 1]) / d[:, 1] + v_i[:, 0]
+
+    # a pixel (y, x) is inside if the column x is crossed odd times at rows > y.
+    irow = np.clip(np.ceil(ycross) - top, 0, height).astype(np.intp)
+    ncrossings = np.bincount(
+        irow * width + (cols - left), minlength=(height + 1) * width
+    ).reshape(height + 1, width)
+    ncrossings_below = np.cumsum(ncrossings[::-1], axis=0)[::-1]
+    return LocalMask(top, left, (ncrossings_below[1:] & 1).astype(bool))
 
 
 # This function is copied from https://github.com/napari/napari/blob/main/napari/layers/shapes/_shapes_utils.py
@@ -75,11 +75,14 @@ class RectangleRoi(Roi2D):
         """Return the bounding box of the rectangle."""
         return Rect(self.x, self.y, self.width, self.height)
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
         bb = self.bbox().adjust_to_int("inner")
-        arr = np.zeros(shape, dtype=bool)
-        arr[..., bb.top : bb.bottom, bb.left : bb.right] = True
-        return arr
+        top, left = max(bb.top, 0), max(bb.left, 0)
+        bottom, right = bb.bottom, bb.right
+        if shape is not None:
+            bottom, right = min(bottom, shape[-2]), min(right, shape[-1])
+        size = (max(bottom - top, 0), max(right - left, 0))
+        return _utils.LocalMask(top, left, np.ones(size, dtype=bool))
 
 
 class RotatedRoi2D(Roi2D):
@@ -140,9 +143,9 @@ class RotatedRectangleRoi(RotatedRoi2D):
         p11 = center + vx / 2 + vy / 2
         return p00, p01, p11, p10
 
-    def to_mask(self, shape: tuple[int, ...]):
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
         vertices = np.stack(self._get_vertices(), axis=0)
-        return _utils.polygon_mask(shape, vertices[:, ::-1])
+        return _utils.polygon_mask_local(vertices[:, ::-1], shape)
 
 
 class EllipseRoi(Roi2D):
@@ -169,14 +172,15 @@ class EllipseRoi(Roi2D):
     def bbox(self) -> Rect[float]:
         return Rect(self.x, self.y, self.width, self.height)
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        _yy, _xx = np.indices(shape[-2:])
-        cx, cy = self.center()
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
+        top, left, _yy, _xx = _utils.pixel_grid(self.bbox(), shape)
+        size = (_yy.shape[0], _xx.shape[1])
         if self.height == 0 or self.width == 0:
-            return np.zeros(shape, dtype=bool)
+            return _utils.LocalMask(top, left, np.zeros(size, dtype=bool))
+        cx, cy = self.center()
         comp_a = (_yy - cy) / self.height * 2
         comp_b = (_xx - cx) / self.width * 2
-        return comp_a**2 + comp_b**2 <= 1
+        return _utils.local_mask_from_grid(top, left, comp_a**2 + comp_b**2 <= 1, size)
 
 
 class RotatedEllipseRoi(RotatedRoi2D):
@@ -185,20 +189,34 @@ class RotatedEllipseRoi(RotatedRoi2D):
     def area(self) -> float:
         return self.length() * self.width * math.pi / 4
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        _yy, _xx = np.indices(shape[-2:])
+    def bbox(self) -> Rect[float]:
         start_x, start_y = self.start
         end_x, end_y = self.end
-        length = math.hypot(end_x - start_x, end_y - start_y)
+        length = self.length()
+        a, b = length / 2, self.width / 2
+        if length > 0:
+            cos, sin = (end_x - start_x) / length, (end_y - start_y) / length
+        else:
+            cos, sin = 1.0, 0.0
+        half_w = math.hypot(a * cos, b * sin)
+        half_h = math.hypot(a * sin, b * cos)
         cx, cy = (start_x + end_x) / 2, (start_y + end_y) / 2
-        angle = self.angle_radian()
-        comp_a = (_yy - cy) / length * 2
-        comp_b = (_xx - cx) / self.width * 2
-        comp_a, comp_b = (
-            comp_a * math.cos(angle) - comp_b * math.sin(angle),
-            comp_a * math.sin(angle) + comp_b * math.cos(angle),
-        )
-        return comp_a**2 + comp_b**2 <= 1
+        return Rect(cx - half_w, cy - half_h, half_w * 2, half_h * 2)
+
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
+        top, left, _yy, _xx = _utils.pixel_grid(self.bbox(), shape)
+        size = (_yy.shape[0], _xx.shape[1])
+        length = self.length()
+        if length == 0 or self.width == 0:
+            return _utils.LocalMask(top, left, np.zeros(size, dtype=bool))
+        start_x, start_y = self.start
+        end_x, end_y = self.end
+        cx, cy = (start_x + end_x) / 2, (start_y + end_y) / 2
+        cos, sin = (end_x - start_x) / length, (end_y - start_y) / length
+        # coordinates along the long axis and the short axis
+        comp_a = ((_xx - cx) * cos + (_yy - cy) * sin) / length * 2
+        comp_b = ((_yy - cy) * cos - (_xx - cx) * sin) / self.width * 2
+        return _utils.local_mask_from_grid(top, left, comp_a**2 + comp_b**2 <= 1, size)
 
     def eccentricity(self) -> float:
         """Eccentricity of the ellipse."""
@@ -217,10 +235,10 @@ class PointRoi2D(Roi2D):
     def bbox(self) -> Rect[float]:
         return Rect(self.x, self.y, 0, 0)
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        arr = np.zeros(shape, dtype=bool)
-        arr[..., int(round(self.y)), int(round(self.x))] = True
-        return arr
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
+        ys = np.array([round(self.y)], dtype=np.intp)
+        xs = np.array([round(self.x)], dtype=np.intp)
+        return _utils.points_mask(ys, xs, shape)
 
 
 class PointsRoi2D(Roi2D):
@@ -250,12 +268,10 @@ class PointsRoi2D(Roi2D):
         ymin, ymax = np.min(self.ys), np.max(self.ys)
         return Rect(xmin, ymin, xmax - xmin, ymax - ymin)
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        arr = np.zeros(shape, dtype=bool)
-        xs = np.asarray(self.xs).round().astype(int)
-        ys = np.asarray(self.ys).round().astype(int)
-        arr[..., ys, xs] = True
-        return arr
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
+        xs = np.asarray(self.xs).round().astype(np.intp)
+        ys = np.asarray(self.ys).round().astype(np.intp)
+        return _utils.points_mask(ys, xs, shape)
 
 
 class CircleRoi(Roi2D):
@@ -282,11 +298,14 @@ class CircleRoi(Roi2D):
             2 * self.radius,
         )
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        _yy, _xx = np.indices(shape[-2:])
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
+        top, left, _yy, _xx = _utils.pixel_grid(self.bbox(), shape)
+        size = (_yy.shape[0], _xx.shape[1])
+        if self.radius == 0:
+            return _utils.LocalMask(top, left, np.zeros(size, dtype=bool))
         comp_a = (_yy - self.y) / self.radius
         comp_b = (_xx - self.x) / self.radius
-        return comp_a**2 + comp_b**2 <= 1
+        return _utils.local_mask_from_grid(top, left, comp_a**2 + comp_b**2 <= 1, size)
 
 
 class LineRoi(Roi2D):
@@ -355,13 +374,11 @@ class LineRoi(Roi2D):
         ymin, ymax = min(self.y1, self.y2), max(self.y1, self.y2)
         return Rect(xmin, ymin, xmax - xmin, ymax - ymin)
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        arr = np.zeros(shape, dtype=bool)
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
         xs, ys = self.linspace(int(self.length() + 1))
-        xs = xs.round().astype(int)
-        ys = ys.round().astype(int)
-        arr[ys, xs] = True
-        return arr
+        xs = xs.round().astype(np.intp)
+        ys = ys.round().astype(np.intp)
+        return _utils.points_mask(ys, xs, shape)
 
 
 class SegmentedLineRoi(PointsRoi2D):
@@ -392,20 +409,19 @@ class SegmentedLineRoi(PointsRoi2D):
         yi = np.interp(teval, tnots, self.ys)
         return xi, yi
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        arr = np.zeros(shape, dtype=bool)
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
         xs, ys = self.linspace(int(math.ceil(self.length())))
-        xs = xs.round().astype(int)
-        ys = ys.round().astype(int)
-        arr[ys, xs] = True
-        return arr
+        xs = xs.round().astype(np.intp)
+        ys = ys.round().astype(np.intp)
+        return _utils.points_mask(ys, xs, shape)
 
 
 class PolygonRoi(SegmentedLineRoi):
     """ROI that represents a closed polygon."""
 
-    def to_mask(self, shape: tuple[int, ...]) -> NDArray[np.bool_]:
-        return _utils.polygon_mask(shape, np.column_stack((self.ys, self.xs)))
+    def to_local_mask(self, shape: tuple[int, ...] | None = None) -> _utils.LocalMask:
+        vertices = np.column_stack((self.ys, self.xs))
+        return _utils.polygon_mask_local(vertices, shape)
 
     def area(self) -> float:
         dot_xy = np.dot(self.xs, np.roll(self.ys, 1))
@@ -727,6 +727,8 @@ class FutureInfo(_HasDynamicAttribute):
     """Size of the output widget."""
     tab_hash: Hashable | None = None
     """The hash of the tab where the resulting WidgetDataModel will be added."""
+    streamed: bool = False
+    """True if the resulting models are added to the main window one by one."""
 
     def resolve_type_hint(self, ns: dict[str, Any]) -> "FutureInfo":
         if isinstance(self.type_hint, str):
@@ -743,6 +745,7 @@ class FutureInfo(_HasDynamicAttribute):
             top_left=self.top_left,
             size=self.size,
             tab_hash=self.tab_hash,
+            streamed=self.streamed,
         )
 
 
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 from typing import (
+    Callable,
     Generic,
     Hashable,
     Iterable,
     Iterator,
+    Mapping,
     MutableSet,
     Sequence,
     TypeVar,
 )
 
 _T = TypeVar("_T", bound=Hashable)
+_V = TypeVar("_V")
 
 
 class OrderedSet(MutableSet[_T]):
@@ -58,6 +61,46 @@ class FrozenList(Sequence[_T]):
         yield from self._list
 
 
+class LazyDict(Mapping[_T, _V]):
+    """A read-only dict whose values are loaded on the first access.
+
+    >>> d = LazyDict(["a", "b"], loader=lambda key: key * 2)
+    >>> d.is_loaded("a")
+    False
+    >>> d["a"]
+    'aa'
+    """
+
+    def __init__(self, keys: Iterable[_T], loader: Callable[[_T], _V]):
+        self._keys = list(keys)
+        self._loader = loader
+        self._loaded: dict[_T, _V] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._keys!r})"
+
+    def __getitem__(self, key: _T) -> _V:
+        if key in self._loaded:
+            return self._loaded[key]
+        if key not in self._keys:
+            raise KeyError(key)
+        value = self._loaded[key] = self._loader(key)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[_T]:
+        yield from self._keys
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def is_loaded(self, key: _T) -> bool:
+        """True if the value of the key is already loaded."""
+        return key in self._loaded
+
+
 class UndoRedoStack(Generic[_T]):
     """A simple undo/redo stack to store the history."""
 
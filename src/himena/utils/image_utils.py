@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+from typing import TYPE_CHECKING, Sequence
+import numpy as np
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
     import himena.standards.roi as _roi
     from himena.types import Rect
     from himena.standards.model_meta import ImageMeta
@@ -37,3 +40,155 @@ def slice_shape(arr: ArrayWrapper, is_rgb: bool = False) -> tuple[int, int]:
     if is_rgb:
         return arr.shape[-2], arr.shape[-3]
     return arr.shape[-1], arr.shape[-2]
+
+
+MEASUREMENTS = ("area", "mean", "std", "sum", "min", "max")
+
+
+def measure_rois(
+    arr: ArrayWrapper,
+    rois: _roi.RoiListModel,
+    metrics: Sequence[str] = ("area", "mean", "std"),
+) -> dict[str, NDArray]:
+    """Measure pixel values inside all the 2D ROIs in all the slices they belong to.
+
+    The mask of each ROI is built only once (inside its bounding box) and reused for
+    all the slices. For each slice, values of all the ROIs are reduced at once. Slices
+    are loaded one by one, so this also works for lazy arrays.
+
+    Parameters
+    ----------
+    arr : ArrayWrapper
+        The (non-RGB) image array. The last two dimensions are (y, x).
+    rois : RoiListModel
+        The ROIs. Its indices are matched to the leading dimensions of the array,
+        and negative indices mean the ROI belongs to all the slices along the axis.
+    metrics : sequence of str
+        Metrics to measure, any of "area", "mean", "std", "sum", "min" and "max".
+
+    Returns
+    -------
+    dict of arrays
+        Columns of the leading indices, "roi" (index of the ROI in the list) and the
+        metrics. Each row is a pair of a ROI and a slice.
+    """
+    from himena.standards.roi import Roi2D
+
+    for metric in metrics:
+        if metric not in MEASUREMENTS:
+            raise ValueError(
+                f"Unknown metric {metric!r}, must be one of {MEASUREMENTS}"
+            )
+    nlead = arr.ndim - 2
+    if nlead < 0:
+        raise ValueError("Image must be at least 2D.")
+    lead_shape = arr.shape[:nlead]
+    shape_2d = arr.shape[nlead:]
+    indices = _roi_indices_for_array(rois, nlead)
+    is_2d = np.array([isinstance(r, Roi2D) for r in rois], dtype=bool)
+
+    # flattened pixel indices of each ROI in a 2D slice
+    pixels: list[NDArray[np.intp] | None] = []
+    for r, ok in zip(rois, is_2d):
+        if not ok:
+            pixels.append(None)
+            continue
+        local = r.to_local_mask(shape_2d)
+        yy, xx = np.nonzero(local.mask)
+        pixels.append((yy + local.top) * shape_2d[1] + (xx + local.left))
+
+    slice_keys: set[tuple[int, ...]] = set()
+    for row in {tuple(row) for row in indices[is_2d].tolist()}:
+        ranges = [
+            range(size) if i < 0 else (range(i, i + 1) if i < size else range(0))
+            for i, size in zip(row, lead_shape)
+        ]
+        slice_keys.update(itertools.product(*ranges))
+
+    columns: dict[str, list[NDArray]] = {"roi": []}
+    columns.update({f"axis-{i}": [] for i in range(nlead)})
+    columns.update({metric: [] for metric in metrics})
+    last_selection = None
+    for key in sorted(slice_keys):
+        matched = np.all((indices == key) | (indices < 0), axis=1) & is_2d
+        selection = np.flatnonzero(matched)
+        if selection.size == 0:
+            continue
+        if last_selection is None or not np.array_equal(selection, last_selection):
+            # pixels and labels are reused if the ROIs are the same as the last slice
+            counts = np.array([pixels[i].size for i in selection], dtype=np.intp)
+            pixel_indices = np.concatenate([pixels[i] for i in selection])
+            labels = np.repeat(np.arange(selection.size), counts)
+            last_selection = selection
+        plane = arr.get_slice(key).ravel()
+        values = plane[pixel_indices].astype(np.float64, copy=False)
+        stats = _reduce_labeled(values, labels, counts, metrics)
+        columns["roi"].append(selection)
+        for i, index in enumerate(key):
+            columns[f"axis-{i}"].append(np.full(selection.size, index))
+        for metric in metrics:
+            columns[metric].append(stats[metric])
+
+    out: dict[str, NDArray] = {}
+    axis_names = rois.axis_names if len(rois.axis_names) == nlead else []
+    for i in range(nlead):
+        name = axis_names[i] if axis_names else f"axis-{i}"
+        out[name] = _concat(columns.pop(f"axis-{i}"), np.intp)
+    out["roi"] = _concat(columns.pop("roi"), np.intp)
+    for metric in metrics:
+        out[metric] = _concat(columns[metric], np.float64)
+    return out
+
+
+def _roi_indices_for_array(rois: _roi.RoiListModel, nlead: int) -> NDArray[np.intp]:
+    """ROI indices aligned to the leading dimensions of the array."""
+    indices = np.asarray(rois.indices, dtype=np.intp)
+    if indices.shape[1] > nlead:
+        raise ValueError(
+            f"ROIs have {indices.shape[1]} indices but the image only has {nlead} "
+            "non-spatial dimensions."
+        )
+    # missing leading dimensions are considered as "all slices"
+    pad = np.full((indices.shape[0], nlead - indices.shape[1]), -1, dtype=np.intp)
+    return np.concatenate([pad, indices], axis=1)
+
+
+def _reduce_labeled(
+    values: NDArray[np.float64],
+    labels: NDArray[np.intp],
+    counts: NDArray[np.intp],
+    metrics: Sequence[str],
+) -> dict[str, NDArray[np.float64]]:
+    """Reduce the values of each label."""
+    nlabels = counts.size
+    out: dict[str, NDArray[np.float64]] = {}
+    sums = np.bincount(labels, weights=values, minlength=nlabels)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = sums / counts
+        if "std" in metrics:
+            sqsums = np.bincount(labels, weights=values**2, minlength=nlabels)
+            stds = np.sqrt(np.maximum(sqsums / counts - means**2, 0))
+    nonempty = counts > 0
+    for metric in metrics:
+        if metric == "area":
+            out[metric] = counts.astype(np.float64)
+        elif metric == "sum":
+            out[metric] = sums
+        elif metric == "mean":
+            out[metric] = means
+        elif metric == "std":
+            out[metric] = stds
+        else:
+            ufunc = np.minimum if metric == "min" else np.maximum
+            result = np.full(nlabels, np.nan)
+            if values.size > 0:
+                starts = (np.cumsum(counts) - counts)[nonempty]
+                result[nonempty] = ufunc.reduceat(values, starts)
+            out[metric] = result
+    return out
+
+
+def _concat(arrays: list[NDArray], dtype) -> NDArray:
+    if len(arrays) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
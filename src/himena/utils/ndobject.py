@@ -20,6 +20,19 @@ def _indices_factory():
     return np.empty((0, 0), dtype=np.int32)
 
 
+def _grown_capacity(size: int) -> int:
+    return max(16, 1 << (size - 1).bit_length())
+
+
+def _is_prefix_of(arr: np.ndarray, buf: np.ndarray) -> bool:
+    """True if `arr` is `buf[:n]` for some `n`."""
+    return (
+        arr.base is buf
+        and arr.ctypes.data == buf.ctypes.data
+        and arr.strides == buf.strides
+    )
+
+
 @dataclass
 class NDObjectCollection(Generic[_T]):
     """List of nd objects, with useful methods."""
@@ -27,6 +40,14 @@ class NDObjectCollection(Generic[_T]):
     items: NDArray[np.object_] = field(default_factory=_item_factory)
     indices: NDArray[np.int32] = field(default_factory=_indices_factory)
     axis_names: list[str] = field(default_factory=list)
+    # Preallocated buffers that `items` and `indices` are views of, so that appending
+    # items does not copy the whole arrays every time.
+    _items_buf: NDArray[np.object_] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indices_buf: NDArray[np.int32] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if not isinstance(self.items, np.ndarray):
@@ -114,9 +135,41 @@ class NDObjectCollection(Generic[_T]):
 
     def add_item(self, indices, item: _T) -> None:
         """Add item at the given indice"""
-        self.items = np.append(self.items, item)
         indices = np.atleast_2d(indices)
-        self.indices = np.append(self.indices, indices, axis=0)
+        if indices.shape[0] != 1:
+            raise ValueError(f"Expected indices of a single item, got {indices!r}")
+        size = len(self.items)
+        self._reserve(size + 1, indices.shape[1])
+        self._items_buf[size] = item
+        self._indices_buf[size] = indices[0]
+        self._set_size(size + 1)
+
+    def extend_from_arrays(self, items, indices) -> None:
+        """Add many items at once.
+
+        Parameters
+        ----------
+        items : sequence of objects
+            Items to be added.
+        indices : (N, ndim) array-like
+            Indices of each item.
+        """
+        if not (isinstance(items, np.ndarray) and items.dtype == np.object_):
+            items = np.fromiter(items, dtype=np.object_, count=len(items))
+        indices = np.asarray(indices, dtype=np.int32)
+        if indices.ndim == 1 and indices.size == 0:
+            indices = indices.reshape(len(items), 0)
+        if indices.ndim != 2 or indices.shape[0] != len(items):
+            raise ValueError(
+                f"Indices must be a 2D array with {len(items)} rows, got shape "
+                f"{indices.shape}."
+            )
+        size = len(self.items)
+        size_new = size + len(items)
+        self._reserve(size_new, indices.shape[1])
+        self._items_buf[size:size_new] = items
+        self._indices_buf[size:size_new] = indices
+        self._set_size(size_new)
 
     def extend(self, other: Self) -> None:
         if len(self) > 0:
@@ -126,8 +179,33 @@ class NDObjectCollection(Generic[_T]):
             self.items = other.items.copy()
             self.indices = other.indices.copy()
         else:
-            self.items = np.concatenate([self.items, other.items], axis=0)
-            self.indices = np.concatenate([self.indices, other.indices], axis=0)
+            self.extend_from_arrays(other.items, other.indices)
+
+    def _reserve(self, size: int, ndim: int) -> None:
+        """Make sure that the buffers can store `size` items."""
+        items_buf, indices_buf = self._items_buf, self._indices_buf
+        owns_buffer = (
+            items_buf is not None
+            and _is_prefix_of(self.items, items_buf)
+            and _is_prefix_of(self.indices, indices_buf)
+            and indices_buf.shape[1] == ndim
+        )
+        if owns_buffer and items_buf.shape[0] >= size:
+            return None
+        # `items` or `indices` may be replaced by other arrays, copy them to new buffers
+        if len(self.items) > 0 and self.indices.shape[1] != ndim:
+            raise ValueError(f"Expected {self.ndim} indices, got {ndim}.")
+        capacity = _grown_capacity(size)
+        nitems = len(self.items)
+        self._items_buf = np.empty(capacity, dtype=np.object_)
+        self._items_buf[:nitems] = self.items
+        self._indices_buf = np.empty((capacity, ndim), dtype=np.int32)
+        self._indices_buf[:nitems] = self.indices
+        return None
+
+    def _set_size(self, size: int) -> None:
+        self.items = self._items_buf[:size]
+        self.indices = self._indices_buf[:size]
 
     def pop(self, index: int) -> _T:
         item = self.items[index]
@@ -138,6 +216,7 @@ class NDObjectCollection(Generic[_T]):
     def clear(self) -> None:
         self.items = _item_factory()
         self.indices = _indices_factory()
+        self._items_buf = self._indices_buf = None
 
     def copy(self) -> Self:
         return self.__class__(
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import overload
+from typing import TYPE_CHECKING, Callable, overload
 import numpy as np
 from himena.data_wrappers import DataFrameWrapper
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    ColumnPredicate = Callable[[np.ndarray], NDArray[np.bool_]]
+    ColumnGetter = Callable[[int], np.ndarray]
+    _Index = int | slice | NDArray[np.integer]
+
 
 class TableProxy(ABC):
     """Abstract base class for table proxies."""
@@ -18,6 +25,37 @@ class TableProxy(ABC):
     def map(self, index: int) -> int:
         """Map the given index to another index."""
 
+    def num_rows(self, nrows: int) -> int:
+        """Number of rows shown for a table with `nrows` rows."""
+        return nrows
+
+    def depends_on(self, column: _Index) -> bool:
+        """True if the mapping depends on the values of the given column(s)."""
+        return False
+
+    def recalculate(
+        self,
+        get_column: ColumnGetter,
+        nrows: int,
+        rows: _Index | None = None,
+    ) -> TableProxy:
+        """Return a proxy updated for the current table values.
+
+        Parameters
+        ----------
+        get_column : callable
+            Function that returns all the values of the column at the given index.
+        nrows : int
+            Number of rows in the table.
+        rows : int, slice or array of int, optional
+            If given, only the values of these (source) rows were changed. Filters
+            with an elementwise predicate only evaluate the predicate for these rows.
+        """
+        return self
+
+    def remap_columns(self, func: Callable[[int], int]) -> None:
+        """Update the column indices in place after columns are inserted or removed."""
+
 
 class IdentityProxy(TableProxy):
     def map(self, index):
@@ -45,7 +83,7 @@ class SortProxy(TableProxy):
     ) -> SortProxy:
         index = int(index)
         arr1d = arr[:, index]
-        sorted_indices = np.argsort(arr1d)
+        sorted_indices = np.argsort(arr1d, kind="stable")
         return cls(index, sorted_indices, ascending=ascending)
 
     @classmethod
@@ -58,7 +96,7 @@ class SortProxy(TableProxy):
         index = int(index)
         column_name = df.column_names()[index]
         ser = df.column_to_array(column_name)
-        sorted_indices = np.argsort(ser)
+        sorted_indices = np.argsort(ser, kind="stable")
         return cls(index, sorted_indices, ascending=ascending)
 
     def map(self, index):
@@ -77,3 +115,261 @@ class SortProxy(TableProxy):
         mapping = self._mapping[::-1]
         ascending = not self._ascending
         return SortProxy(self._index, mapping, ascending)
+
+    def depends_on(self, column: _Index) -> bool:
+        return _index_contains(column, self._index)
+
+    def remap_columns(self, func: Callable[[int], int]) -> None:
+        self._index = func(self._index)
+
+    def recalculate(self, get_column, nrows, rows=None) -> SortProxy:
+        mapping = np.argsort(get_column(self._index), kind="stable")
+        if not self._ascending:
+            mapping = mapping[::-1]
+        return SortProxy(self._index, mapping, self._ascending)
+
+
+class FilterProxy(TableProxy):
+    """Proxy that only shows the rows whose values in a column satisfy a predicate.
+
+    The predicate receives all the values of the column, so it does not have to be
+    elementwise (such as `x > x.mean()`), and the mask is recomputed for the whole
+    column whenever the table values are changed. If `elementwise` is true, the
+    predicate is only evaluated for the edited rows.
+
+    Rows after the last matched row are mapped to the rows after the end of the
+    table, so that the table can still be expanded.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        predicate: ColumnPredicate,
+        mask: NDArray[np.bool_],
+        elementwise: bool = False,
+    ):
+        self._index = index
+        self._predicate = predicate
+        self._mask = mask
+        self._rows = np.flatnonzero(mask)
+        self._elementwise = elementwise
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def predicate(self) -> ColumnPredicate:
+        return self._predicate
+
+    @property
+    def elementwise(self) -> bool:
+        """True if the predicate of each row only depends on the value of the row."""
+        return self._elementwise
+
+    @property
+    def rows(self) -> NDArray[np.intp]:
+        """Indices of the rows that satisfy the predicate."""
+        return self._rows
+
+    @classmethod
+    def from_values(
+        cls,
+        index: int,
+        values: np.ndarray,
+        predicate: ColumnPredicate,
+        elementwise: bool = False,
+    ) -> FilterProxy:
+        mask = _eval_predicate(predicate, values)
+        return cls(int(index), predicate, mask, elementwise=elementwise)
+
+    @classmethod
+    def from_array(
+        cls,
+        index: int,
+        arr: np.ndarray,
+        predicate: ColumnPredicate,
+        elementwise: bool = False,
+    ) -> FilterProxy:
+        return cls.from_values(index, arr[:, index], predicate, elementwise)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        index: int,
+        df: DataFrameWrapper,
+        predicate: ColumnPredicate,
+        elementwise: bool = False,
+    ) -> FilterProxy:
+        column_name = df.column_names()[index]
+        values = df.column_to_array(column_name)
+        return cls.from_values(index, values, predicate, elementwise)
+
+    def map(self, index):
+        nrows = self._rows.size
+        if isinstance(index, np.ndarray):
+            sl_in_range = index < nrows
+            result = index - nrows + self._mask.size
+            result[sl_in_range] = self._rows[index[sl_in_range]]
+        else:
+            if index >= nrows:
+                result = index - nrows + self._mask.size
+            else:
+                result = self._rows[index]
+        return result
+
+    def num_rows(self, nrows: int) -> int:
+        return self._rows.size
+
+    def depends_on(self, column: _Index) -> bool:
+        return _index_contains(column, self._index)
+
+    def remap_columns(self, func: Callable[[int], int]) -> None:
+        self._index = func(self._index)
+
+    def recalculate(self, get_column, nrows, rows=None) -> FilterProxy:
+        values = get_column(self._index)
+        if not self._elementwise or rows is None or nrows != self._mask.size:
+            return self.from_values(
+                self._index, values, self._predicate, self._elementwise
+            )
+        if isinstance(rows, (int, np.integer)):
+            rows = slice(rows, rows + 1)
+        mask = self._mask.copy()
+        mask[rows] = _eval_predicate(self._predicate, values[rows])
+        return FilterProxy(self._index, self._predicate, mask, elementwise=True)
+
+
+class SortFilterProxy(SortProxy):
+    """Proxy that sorts the rows filtered by a `FilterProxy`."""
+
+    def __init__(
+        self,
+        index: int,
+        mapping: np.ndarray,
+        filter_proxy: FilterProxy,
+        ascending: bool = True,
+    ):
+        super().__init__(index, mapping, ascending)
+        self._filter = filter_proxy
+
+    @property
+    def filter(self) -> FilterProxy:
+        return self._filter
+
+    @classmethod
+    def from_filter(
+        cls,
+        index: int,
+        values: np.ndarray,
+        filter_proxy: FilterProxy,
+        ascending: bool = True,
+    ) -> SortFilterProxy:
+        rows = filter_proxy.rows
+        mapping = rows[np.argsort(values[rows], kind="stable")]
+        if not ascending:
+            mapping = mapping[::-1]
+        return cls(int(index), mapping, filter_proxy, ascending=ascending)
+
+    def map(self, index):
+        if isinstance(index, np.ndarray):
+            sl_in_range = index < self._mapping.size
+            result = self._filter.map(index)
+            result[sl_in_range] = self._mapping[index[sl_in_range]]
+        else:
+            if index >= self._mapping.size:
+                result = self._filter.map(index)
+            else:
+                result = self._mapping[index]
+        return result
+
+    def num_rows(self, nrows: int) -> int:
+        return self._filter.num_rows(nrows)
+
+    def switch_ascending(self) -> SortFilterProxy:
+        mapping = self._mapping[::-1]
+        return SortFilterProxy(
+            self._index, mapping, self._filter, ascending=not self._ascending
+        )
+
+    def depends_on(self, column: _Index) -> bool:
+        return super().depends_on(column) or self._filter.depends_on(column)
+
+    def remap_columns(self, func: Callable[[int], int]) -> None:
+        super().remap_columns(func)
+        self._filter.remap_columns(func)
+
+    def recalculate(self, get_column, nrows, rows=None) -> SortFilterProxy:
+        filt = self._filter.recalculate(get_column, nrows, rows)
+        return self.from_filter(
+            self._index, get_column(self._index), filt, ascending=self._ascending
+        )
+
+
+def toggle_sort(prx: TableProxy, index: int, get_column: ColumnGetter) -> TableProxy:
+    """Return the proxy after the sort button is clicked on the column.
+
+    The sort order cycles in ascending, descending and unsorted. Row filters are
+    kept.
+    """
+    filt = base_filter(prx)
+    if isinstance(prx, SortProxy) and prx.index == index:
+        if prx.ascending:
+            return prx.switch_ascending()
+        return filt or IdentityProxy()
+    values = get_column(index)
+    if filt is not None:
+        return SortFilterProxy.from_filter(index, values, filt)
+    return SortProxy(int(index), np.argsort(values, kind="stable"))
+
+
+def with_filter(
+    prx: TableProxy, filt: FilterProxy | None, get_column: ColumnGetter
+) -> TableProxy:
+    """Return the proxy with its row filter replaced by `filt` (None to remove).
+
+    The current sort order is kept and applied to the newly filtered rows.
+    """
+    if isinstance(prx, SortProxy):
+        values = get_column(prx.index)
+        if filt is not None:
+            return SortFilterProxy.from_filter(
+                prx.index, values, filt, ascending=prx.ascending
+            )
+        mapping = np.argsort(values, kind="stable")
+        if not prx.ascending:
+            mapping = mapping[::-1]
+        return SortProxy(prx.index, mapping, ascending=prx.ascending)
+    if filt is not None:
+        return filt
+    return IdentityProxy()
+
+
+def base_filter(prx: TableProxy) -> FilterProxy | None:
+    """Return the row filter of the proxy, if exists."""
+    if isinstance(prx, FilterProxy):
+        return prx
+    if isinstance(prx, SortFilterProxy):
+        return prx.filter
+    return None
+
+
+def _eval_predicate(
+    predicate: ColumnPredicate, values: np.ndarray
+) -> NDArray[np.bool_]:
+    mask = np.asarray(predicate(values), dtype=bool)
+    if mask.shape != values.shape[:1]:
+        raise ValueError(
+            f"Predicate returned an array of shape {mask.shape} for a column of "
+            f"{values.shape[0]} rows."
+        )
+    return mask
+
+
+def _index_contains(c: _Index, idx: int) -> bool:
+    if isinstance(c, slice):
+        return c.start <= idx < c.stop
+    elif isinstance(c, np.ndarray):
+        return idx in c
+    else:
+        return c == idx
@@ -5,6 +5,7 @@ from himena.consts import StandardType
 import numpy as np
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
     from himena.types import WidgetDataModel
     from himena.widgets import SubWindow
     from himena.qt.magicgui import SelectionEdit
@@ -69,7 +70,12 @@ def model_to_xy_arrays(
         raise ValueError("The y value must be given.")
     if model.is_subtype_of(StandardType.TABLE):
         x_out, ys = table_to_xy_arrays(
-            model.value, x, y, allow_multiple_y=allow_multiple_y, same_size=same_size
+            model.value,
+            x,
+            y,
+            allow_multiple_y=allow_multiple_y,
+            same_size=same_size,
+            typed=_typed_columns_of(model),
         )
     elif model.is_subtype_of(StandardType.DATAFRAME):
         df = wrap_dataframe(model.value)
@@ -144,7 +150,9 @@ def model_to_col_val_arrays(
     from himena.standards.model_meta import DictMeta
 
     if model.is_subtype_of(StandardType.TABLE):
-        x_out, y_out = table_to_col_val_arrays(model.value, col, val)
+        x_out, y_out = table_to_col_val_arrays(
+            model.value, col, val, typed=_typed_columns_of(model)
+        )
     elif model.is_subtype_of(StandardType.DATAFRAME):
         df = wrap_dataframe(model.value)
         i_col = _to_single_column_slice(col)
@@ -170,17 +178,20 @@ def table_to_xy_arrays(
     allow_empty_x: bool = True,
     allow_multiple_y: bool = True,
     same_size: bool = True,
+    typed: TypedColumns | None = None,
 ) -> tuple[NamedArray, list[tuple[NamedArray]]]:
     if x is None and not allow_empty_x:
         raise ValueError("The x value must be given.")
     ysl = slice(y[0][0], y[0][1]), slice(y[1][0], y[1][1])
-    parser = TableValueParser.from_array(value[ysl])
+    parser = TableValueParser.from_array(value[ysl], _column_reader(typed, value, ysl))
     if x is None:
         xarr = np.arange(parser.n_samples, dtype=np.float64)
         xlabel = None
     else:
         xsl = slice(x[0][0], x[0][1]), slice(x[1][0], x[1][1])
-        xlabel, xarr = parser.norm_x_value(value[xsl], same_size=same_size)
+        xlabel, xarr = parser.norm_x_value(
+            value[xsl], same_size=same_size, reader=_column_reader(typed, value, xsl)
+        )
     if not allow_multiple_y and parser.n_components > 1:
         raise ValueError("Multiple Y values are not allowed.")
     return NamedArray(xlabel, xarr), parser.named_arrays
@@ -190,16 +201,22 @@ def table_to_col_val_arrays(
     value: np.ndarray,
     col: SelectionType,
     val: SelectionType,
+    typed: TypedColumns | None = None,
 ) -> tuple[NamedArray, NamedArray]:
     col_sl = slice(col[0][0], col[0][1]), slice(col[1][0], col[1][1])
     val_sl = slice(val[0][0], val[0][1]), slice(val[1][0], val[1][1])
-    parser = TableValueParser.from_array(value[val_sl])
+    reader = _column_reader(typed, value, val_sl)
+    parser = TableValueParser.from_array(value[val_sl], reader)
     if parser.n_components != 1:
         raise ValueError("Multiple Y values are not allowed.")
     col_arr = parser.norm_col_value(value[col_sl])
     return col_arr, parser.named_arrays[0]
 
 
+# (column index, start row, stop row) -> float64 values, relative to a selection
+ColumnReader = Callable[[int, int, int], "NDArray[np.float64]"]
+
+
 class TableValueParser:
     def __init__(
         self,
@@ -214,19 +231,26 @@ class TableValueParser:
         return self._label_and_values
 
     @classmethod
-    def from_columns(cls, value: np.ndarray) -> TableValueParser:
+    def from_columns(
+        cls, value: np.ndarray, reader: ColumnReader | None = None
+    ) -> TableValueParser:
         nr, nc = value.shape
+        if reader is None:
+
+            def reader(i: int, start: int, stop: int):
+                return as_f64(value[start:stop, i])
+
         if nr == 1:
-            return cls([NamedArray(None, as_f64(value[:, i])) for i in range(nc)])
+            return cls([NamedArray(None, reader(i, 0, 1)) for i in range(nc)])
         try:
             as_f64(value[0, :])  # try to cast to float
         except ValueError:
             # The first row is not numerical. Use it as labels.
             return cls(
-                [NamedArray(str(value[0, i]), as_f64(value[1:, i])) for i in range(nc)]
+                [NamedArray(str(value[0, i]), reader(i, 1, nr)) for i in range(nc)]
             )
         else:
-            return cls([NamedArray(None, as_f64(value[:, i])) for i in range(nc)])
+            return cls([NamedArray(None, reader(i, 0, nr)) for i in range(nc)])
 
     @classmethod
     def from_rows(cls, value: np.ndarray) -> TableValueParser:
@@ -235,9 +259,11 @@ class TableValueParser:
         return self
 
     @classmethod
-    def from_array(cls, value: np.ndarray) -> TableValueParser:
+    def from_array(
+        cls, value: np.ndarray, reader: ColumnReader | None = None
+    ) -> TableValueParser:
         try:
-            return cls.from_columns(value)
+            return cls.from_columns(value, reader)
         except ValueError:
             return cls.from_rows(value)
 
@@ -249,19 +275,29 @@ class TableValueParser:
     def n_samples(self) -> int:
         return self._label_and_values[0][1].size
 
-    def norm_x_value(self, arr: np.ndarray, same_size: bool = True) -> NamedArray:
+    def norm_x_value(
+        self,
+        arr: np.ndarray,
+        same_size: bool = True,
+        reader: ColumnReader | None = None,
+    ) -> NamedArray:
         # check if the first value is a label
         if self._is_column_vector and arr.shape[1] != 1:
             raise ValueError("The X values must be a 1D column vector.")
         if not self._is_column_vector and arr.shape[0] != 1:
             raise ValueError("The X values must be a 1D row vector.")
         arr = arr.ravel()
+        if reader is None or not self._is_column_vector:
+
+            def reader(i: int, start: int, stop: int):
+                return as_f64(arr[start:stop])
+
         try:
             as_f64(arr[:1])
         except ValueError:
-            label, arr_number = str(arr[0]), as_f64(arr[1:])
+            label, arr_number = str(arr[0]), reader(0, 1, arr.size)
         else:
-            label, arr_number = None, as_f64(arr)
+            label, arr_number = None, reader(0, 0, arr.size)
         if same_size and arr_number.size != self.n_samples:
             raise ValueError("The number of X values must be the same as the Y values.")
         return NamedArray(label, arr_number)
@@ -442,3 +478,81 @@ def as_f64(arr: np.ndarray):
         # string array, convert empty string to nan
         return np.where(arr == "", "nan", arr).astype(np.float64)
     return arr.astype(np.float64)
+
+
+class TypedColumns:
+    """Float64 columns of a 2D string table, parsed at most once per column.
+
+    A column is numeric if all its values, optionally except for the first one (the
+    header), can be converted by `as_f64`. The parsed columns are kept in this
+    object, so the owner of the table must discard it when the table is modified.
+    The spreadsheet widget owns one for its current array, discards it on every
+    write, and passes it to the plotting functions through the model metadata.
+    """
+
+    def __init__(self, value: np.ndarray):
+        self._value = value
+        self._parsed: dict[int, tuple[int, NDArray[np.float64]] | None] = {}
+
+    @property
+    def value(self) -> np.ndarray:
+        """The table whose columns are parsed."""
+        return self._value
+
+    def column_f64(self, index: int, start: int, stop: int) -> NDArray[np.float64]:
+        """Return rows `start:stop` of the column as a new float64 array.
+
+        `ValueError` is raised if the values are not numeric, same as `as_f64`. The
+        returned array is a copy of the parsed column, because callers such as plot
+        models own and may modify it.
+        """
+        if index not in self._parsed and (stop - start) * 4 < self._value.shape[0]:
+            # small selection, parsing the whole column is not worth it
+            return as_f64(self._value[start:stop, index])
+        if (parsed := self._parse(index)) is not None:
+            offset, values = parsed
+            if start >= offset:
+                return values[start - offset : stop - offset].copy()
+        return as_f64(self._value[start:stop, index])
+
+    def _parse(self, index: int) -> tuple[int, NDArray[np.float64]] | None:
+        if index in self._parsed:
+            return self._parsed[index]
+        column = self._value[:, index]
+        out = None
+        for offset in (0, 1):
+            try:
+                out = offset, as_f64(column[offset:])
+            except ValueError:
+                continue
+            break
+        self._parsed[index] = out
+        return out
+
+
+def _typed_columns_of(model: WidgetDataModel) -> TypedColumns | None:
+    """Return the typed columns attached to the table model by its widget."""
+    from himena.standards.model_meta import TableMeta
+
+    if not isinstance(meta := model.metadata, TableMeta):
+        return None
+    typed = meta._typed_columns
+    # metadata may be reused for another value
+    if isinstance(typed, TypedColumns) and typed.value is model.value:
+        return typed
+    return None
+
+
+def _column_reader(
+    typed: TypedColumns | None, value: np.ndarray, sl: tuple[slice, slice]
+) -> ColumnReader | None:
+    """Return a reader of the typed columns for the selection of the table."""
+    if typed is None or typed.value is not value:
+        return None
+    r0 = sl[0].indices(value.shape[0])[0]
+    c0 = sl[1].indices(value.shape[1])[0]
+
+    def reader(i: int, start: int, stop: int) -> NDArray[np.float64]:
+        return typed.column_f64(c0 + i, r0 + start, r0 + stop)
+
+    return reader
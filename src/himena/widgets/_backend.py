@@ -374,6 +374,12 @@ class BackendMainWindow(Generic[_W]):  # pragma: no cover
     def _add_job_progress(self, future: Future, desc: str, total: int = 0) -> None:
         """Add a job to the job stack."""
 
+    def _process_events(self) -> None:
+        """Process the pending GUI events, so that the changes are shown.
+
+        User input events must not be processed here.
+        """
+
     def _add_whats_this(
         self,
         text: str,
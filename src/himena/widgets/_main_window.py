@@ -4,6 +4,7 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 import inspect
 from logging import getLogger
 from pathlib import Path
@@ -15,6 +16,7 @@ from typing import (
     Iterable,
     Sequence,
     Generic,
+    Hashable,
     Iterator,
     Literal,
     TypeVar,
@@ -73,6 +75,7 @@ _T = TypeVar("_T")  # internal data type
 _F = TypeVar("_F")  # function type
 _R = TypeVar("_R")  # return type
 _LOGGER = getLogger(__name__)
+_DEFAULT_CONCURRENT_READS = 4  # number of files that are read at the same time
 
 
 class MainWindowEvents(SignalGroup, Generic[_W]):
@@ -119,12 +122,16 @@ class MainWindow(Generic[_W]):
             self._recent_manager.update_menu()
             self._recent_session_manager.update_menu()
         self._executor = ThreadPoolExecutor(max_workers=5)
+        self._max_concurrent_reads = _DEFAULT_CONCURRENT_READS
+        self._reader_executor = _new_reader_executor(self._max_concurrent_reads)
+        self._add_read_model_lock = threading.Lock()
         self._global_lock = threading.Lock()
         self._object_type_map = ObjectTypeMap()
         self._plugin_install_results: list[PluginInstallResult] = []
         self.theme = theme
         register_defaults(self._object_type_map)
         self._is_window_activating = False
+        self._is_loading_session = False
 
     def __repr__(self) -> str:
         return (
@@ -195,6 +202,20 @@ class MainWindow(Generic[_W]):
         """Get the current application profile object."""
         return load_app_profile(self._model_app.name)
 
+    @property
+    def max_concurrent_reads(self) -> int:
+        """Maximum number of files that are read at the same time."""
+        return self._max_concurrent_reads
+
+    @max_concurrent_reads.setter
+    def max_concurrent_reads(self, value: int) -> None:
+        if (value := int(value)) < 1:
+            raise ValueError(f"max_concurrent_reads must be positive, got {value}.")
+        old = self._reader_executor
+        self._reader_executor = _new_reader_executor(value)
+        self._max_concurrent_reads = value
+        old.shutdown(wait=False)  # files being read are still added
+
     def submit_async_task(
         self,
         func: Callable,
@@ -609,14 +630,13 @@ class MainWindow(Generic[_W]):
         tab: TabArea[_W] | None = None,
         append_history: bool = True,
     ) -> Future:
-        """Read multiple files asynchronously and return a future."""
+        """Read multiple files asynchronously and return a future.
+
+        Files are read concurrently in a thread pool of limited size. Each file is
+        added as a sub-window as soon as it is read, and the returned future will be
+        resolved to the list of all the models after all the files are read.
+        """
         file_paths = norm_paths(file_paths)
-        future = self._executor.submit(
-            self._paths_to_models,
-            file_paths,
-            plugin=plugin,
-            append_history=append_history,
-        )
         if len(file_paths) == 1:
             self.set_status_tip(f"Opening: {file_paths[0].as_posix()}", duration=5)
         else:
@@ -625,8 +645,22 @@ class MainWindow(Generic[_W]):
             tab_hash = tab._hash_value
         else:
             tab_hash = None
+        # if the future is going to be unwrapped, models are added all at once
+        streamed = not self._instructions.unwrap_future
+        read_futures = self._submit_read_tasks(file_paths, plugin=plugin)
+        if streamed:
+            add_model = self._backend_main_window._process_future_done_callback(
+                partial(self._add_read_model, tab_hash=tab_hash), lambda *_: None
+            )
+            for each in read_futures:
+                each.add_done_callback(_if_succeeded(add_model))
+        future = self._gather_read_futures(
+            read_futures, file_paths, append_history=append_history
+        )
         # set info for injection store
-        FutureInfo(list[WidgetDataModel], tab_hash=tab_hash).set(future)
+        FutureInfo(list[WidgetDataModel], tab_hash=tab_hash, streamed=streamed).set(
+            future
+        )
         return future
 
     def run_script(self, file: str | Path) -> Any:
@@ -661,15 +695,32 @@ class MainWindow(Generic[_W]):
 
     def load_session(self, path: str | Path) -> None:
         """Read a session file and update the main window based on the content."""
-        from himena.session import update_from_zip, update_from_directory
+        from himena.session import (
+            BINARY_SESSION_SUFFIX,
+            update_from_binary,
+            update_from_zip,
+            update_from_directory,
+        )
 
         fp = Path(path)
         if fp.suffix == ".zip":
-            update_from_zip(self, fp)
+            update_func = update_from_zip
+        elif fp.suffix == BINARY_SESSION_SUFFIX:
+            update_func = update_from_binary
         elif fp.is_dir():
-            update_from_directory(self, fp)
+            update_func = update_from_directory
         else:
-            raise ValueError(f"Session must be a zip file or a directory, got {fp}.")
+            raise ValueError(
+                "Session must be a zip file, a binary session file or a directory, "
+                f"got {fp}."
+            )
+        if self._is_loading_session:
+            raise RuntimeError("Cannot load a session while loading another session.")
+        self._is_loading_session = True
+        try:
+            update_func(self, fp)
+        finally:
+            self._is_loading_session = False
         # always plugin=None for reading a session file as a session
         self._recent_session_manager.append_recent_files([(fp, None)])
         self.set_status_tip(f"Session loaded: {fp}", duration=5)
@@ -682,13 +733,22 @@ class MainWindow(Generic[_W]):
         allow_calculate: Sequence[str] = (),
     ) -> None:
         """Save the current session to a zip file as a stand-along file."""
-        from himena.session import dump_zip, dump_directory
+        from himena.session import (
+            BINARY_SESSION_SUFFIX,
+            dump_binary,
+            dump_zip,
+            dump_directory,
+        )
 
         path = Path(path)
         if path.suffix == ".zip":
             dump_zip(
                 self, path, save_copies=save_copies, allow_calculate=allow_calculate
             )
+        elif path.suffix == BINARY_SESSION_SUFFIX:
+            dump_binary(
+                self, path, save_copies=save_copies, allow_calculate=allow_calculate
+            )
         else:
             dump_directory(
                 self, path, save_copies=save_copies, allow_calculate=allow_calculate
@@ -1514,20 +1574,106 @@ class MainWindow(Generic[_W]):
         plugin: str | None = None,
         append_history: bool = True,
     ) -> list[WidgetDataModel]:
-        ins = _providers.ReaderStore.instance()
         file_paths = norm_paths(file_paths)
-        reader_path_sets = [
-            (ins.pick(file_path, plugin=plugin), file_path) for file_path in file_paths
-        ]
-        models = [
-            reader.read_and_update_source(file_path)
-            for reader, file_path in reader_path_sets
-        ]
+        if len(file_paths) == 1:
+            results = [_read_one(file_paths[0], plugin)]
+        else:
+            futures = self._submit_read_tasks(file_paths, plugin=plugin)
+            results = [future.result() for future in futures]
         if append_history:
             self._recent_manager.append_recent_files(
-                [(fp, reader.plugin_str) for reader, fp in reader_path_sets]
+                [(fp, plugin_str) for fp, (plugin_str, _) in zip(file_paths, results)]
             )
-        return models
+        return [model for _, model in results]
+
+    def _submit_read_tasks(
+        self,
+        file_paths: list[Path],
+        plugin: str | None = None,
+    ) -> list[Future[tuple[str | None, WidgetDataModel]]]:
+        """Submit reading of each file to the reader thread pool."""
+        return [
+            self._reader_executor.submit(_read_one, file_path, plugin)
+            for file_path in file_paths
+        ]
+
+    def _gather_read_futures(
+        self,
+        futures: list[Future[tuple[str | None, WidgetDataModel]]],
+        file_paths: list[Path],
+        append_history: bool = True,
+    ) -> Future[list[WidgetDataModel]]:
+        """Return a future that will be resolved when all the files are read."""
+        out = Future()
+        out.set_running_or_notify_cancel()
+        lock = threading.Lock()
+        num_remaining = len(futures)
+
+        def _on_done(_: Future):
+            nonlocal num_remaining
+            with lock:
+                num_remaining -= 1
+                if num_remaining > 0:
+                    return
+            history: list[tuple[Path, str | None]] = []
+            models: list[WidgetDataModel] = []
+            error: BaseException | None = None
+            for fp, future in zip(file_paths, futures):
+                if future.cancelled():
+                    continue
+                if (exc := future.exception()) is not None:
+                    error = error or exc
+                    continue
+                plugin_str, model = future.result()
+                history.append((fp, plugin_str))
+                models.append(model)
+            if append_history and history:
+                self._recent_manager.append_recent_files(history)
+            if error is not None:
+                out.set_exception(error)
+            else:
+                out.set_result(models)
+
+        if len(futures) == 0:
+            out.set_result([])
+        for future in futures:
+            future.add_done_callback(_on_done)
+        return out
+
+    def _add_read_model(self, future: Future, tab_hash: Hashable | None = None):
+        _, model = future.result()
+        if not self._instructions.process_model_output:
+            return None
+        # backends without an event loop call this from the reader threads
+        with self._add_read_model_lock:
+            if tab_hash is not None and (tab := self.tabs._get_by_hash(tab_hash)):
+                win = tab.add_data_model(model)
+            else:
+                win = self.add_data_model(model)
+        self.set_status_tip(f"File opened: {win.title}", duration=5)
+
+
+def _new_reader_executor(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="himena-reader"
+    )
+
+
+def _read_one(
+    file_path: Path | list[Path],
+    plugin: str | None = None,
+) -> tuple[str | None, WidgetDataModel]:
+    reader = _providers.ReaderStore.instance().pick(file_path, plugin=plugin)
+    return reader.plugin_str, reader.read_and_update_source(file_path)
+
+
+def _if_succeeded(cb: Callable[[Future], Any]) -> Callable[[Future], None]:
+    # errors are reported by the gathered future, not by each of the reads
+    def _cb(future: Future):
+        if not future.cancelled() and future.exception() is None:
+            cb(future)
+
+    return _cb
 
 
 def _short_repr(obj: Any, *, num_chars_limits: int = 50) -> str:
@@ -1,5 +1,8 @@
 from himena.workflow._base import WorkflowStep
 from himena.workflow._graph import Workflow, compute, WorkflowStepType
+from himena.workflow._scheduler import WorkflowScheduler
+from himena.workflow._cache import WorkflowDiskCache, get_disk_cache, set_disk_cache
+from himena.workflow._incremental import IncrementalWorkflow
 from himena.workflow._caller import as_function, as_function_from_path
 from himena.workflow._command import (
     CommandExecution,
@@ -25,6 +28,11 @@ __all__ = [
     "WorkflowStep",
     "Workflow",
     "compute",
+    "WorkflowScheduler",
+    "IncrementalWorkflow",
+    "WorkflowDiskCache",
+    "get_disk_cache",
+    "set_disk_cache",
     "as_function",
     "as_function_from_path",
     "WorkflowStepType",
@@ -1,4 +1,4 @@
-from typing import Any, Iterator, TYPE_CHECKING
+from typing import Any, ClassVar, Iterator, Mapping, TYPE_CHECKING
 from datetime import datetime as _datetime
 import uuid
 
@@ -26,12 +26,41 @@ class WorkflowStep(BaseModel):
     process_output: bool = Field(default=False)
     """Whether the output of this step should be processed by application."""
 
+    _thread_safe: ClassVar[bool] = False
+    """Whether `_get_model_impl` can be safely called from a non-main thread."""
+
     def iter_parents(self) -> Iterator[uuid.UUID]:
         raise NotImplementedError("This method must be implemented in a subclass.")
 
     def _get_model_impl(self, wf: "Workflow") -> "WidgetDataModel":
         raise NotImplementedError("This method must be implemented in a subclass.")
 
+    def _content_hash(
+        self,
+        parent_hashes: Mapping[uuid.UUID, str | None],
+    ) -> str | None:
+        """Hash of the definition of this step, or None if not reproducible.
+
+        Two steps with the same hash are expected to produce the same output. This
+        hash is used as the key of the persistent cache.
+        """
+        return None
+
+    def _get_model_cached(self, wf: "Workflow") -> "WidgetDataModel":
+        """Get the model using the persistent cache if available."""
+        from himena.workflow._cache import get_disk_cache
+
+        if (cache := get_disk_cache()) is None:
+            return self._get_model_impl(wf)
+        if (key := wf._content_hash(self.id)) is None:
+            return self._get_model_impl(wf)
+        if (model := cache.get(key)) is not None:
+            wf._add_to_cache(self.id, model)
+            return model
+        model = self._get_model_impl(wf)
+        cache.put(key, model)
+        return model
+
     def get_model(
         self,
         wf: "Workflow",
@@ -42,7 +71,20 @@ class WorkflowStep(BaseModel):
         if win := wf._mock_main_window.window_for_id(self.id):
             out = win.to_model()
             return out
-        model = self._get_model_impl(wf)
+        model = self._get_model_cached(wf)
+        return self._finalize_model(
+            model, wf, force_process_output=force_process_output, metadata=metadata
+        )
+
+    def _finalize_model(
+        self,
+        model: "WidgetDataModel",
+        wf: "Workflow",
+        *,
+        force_process_output: bool = False,
+        metadata: Any | None = None,
+    ) -> "WidgetDataModel":
+        """Update the model computed by this step as the output of `wf`."""
         model.workflow = wf
         if metadata is not None:
             model.metadata = metadata
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from logging import getLogger
+import os
+from pathlib import Path
+import pickle
+import threading
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from himena.types import WidgetDataModel
+
+_LOGGER = getLogger(__name__)
+
+# bump this number when the format of the cache key or the stored files changes
+_CACHE_FORMAT_VERSION = "1"
+
+
+def content_hash(*parts: Any) -> str:
+    """Hash the string representation of the parts into a hex digest."""
+    hasher = hashlib.sha256(_CACHE_FORMAT_VERSION.encode())
+    for part in parts:
+        hasher.update(b"\x00")
+        hasher.update(str(part).encode())
+    return hasher.hexdigest()
+
+
+class WorkflowDiskCache:
+    """Persistent, content-addressed cache of the results of workflow steps.
+
+    Each result is pickled into a file named after the hash of the step definition
+    (see `WorkflowStep._content_hash`). When the total size of the cached files
+    exceeds `max_size`, the least recently used files are removed.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Directory to store the cached files. Default is "workflow_cache" in the user
+        data directory.
+    max_size : int, default 1 GB
+        Maximum total size (bytes) of the cached files.
+    """
+
+    def __init__(self, path: str | Path | None = None, max_size: int = 1 << 30):
+        if path is None:
+            from himena.profile import data_dir
+
+            path = data_dir() / "workflow_cache"
+        self._path = Path(path)
+        self._max_size = int(max_size)
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] | None = None  # key -> file size
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self._path!r}, max_size={self._max_size})"
+
+    @property
+    def path(self) -> Path:
+        """Directory of the cached files."""
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        """Maximum total size (bytes) of the cached files."""
+        return self._max_size
+
+    def total_size(self) -> int:
+        """Total size (bytes) of the cached files."""
+        with self._lock:
+            return sum(self._get_index().values())
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._get_index()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._get_index())
+
+    def get(self, key: str) -> WidgetDataModel | None:
+        """Get the cached model for the key, or None if not cached."""
+        with self._lock:
+            index = self._get_index()
+            if key not in index:
+                return None
+            index.move_to_end(key)
+        file = self._file_for_key(key)
+        try:
+            with file.open("rb") as f:
+                model = pickle.load(f)
+            os.utime(file)  # the modified time is used for LRU order in next sessions
+        except Exception as e:
+            _LOGGER.warning("Failed to load cached result %s: %s", key, e)
+            self._discard(key)
+            return None
+        return model
+
+    def put(self, key: str, model: WidgetDataModel) -> bool:
+        """Store the model for the key. Return True if succeeded."""
+        from himena.workflow import Workflow
+
+        file = self._file_for_key(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = file.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with tmp.open("wb") as f:
+                pickle.dump(
+                    model.model_copy(update={"workflow": Workflow()}),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, file)
+        except Exception as e:
+            # value may not be picklable, such as a model of a Qt object
+            _LOGGER.debug("Failed to cache result %s: %s", key, e)
+            tmp.unlink(missing_ok=True)
+            return False
+        with self._lock:
+            index = self._get_index()
+            index[key] = file.stat().st_size
+            index.move_to_end(key)
+            self._evict()
+        return True
+
+    def clear(self) -> None:
+        """Remove all the cached files."""
+        with self._lock:
+            for key in self._get_index():
+                self._file_for_key(key).unlink(missing_ok=True)
+            self._index = OrderedDict()
+
+    def _file_for_key(self, key: str) -> Path:
+        return self._path / key[:2] / f"{key}.pkl"
+
+    def _get_index(self) -> OrderedDict[str, int]:
+        """Load the index from the cache directory (oldest first)."""
+        if self._index is None:
+            entries: list[tuple[float, str, int]] = []
+            if self._path.exists():
+                for file in self._path.glob("*/*.pkl"):
+                    stat = file.stat()
+                    entries.append((stat.st_mtime, file.stem, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+        return self._index
+
+    def _evict(self) -> None:
+        index = self._get_index()
+        total = sum(index.values())
+        while total > self._max_size and len(index) > 0:
+            key, size = index.popitem(last=False)
+            self._file_for_key(key).unlink(missing_ok=True)
+            total -= size
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            self._get_index().pop(key, None)
+        self._file_for_key(key).unlink(missing_ok=True)
+
+
+_CURRENT_CACHE: WorkflowDiskCache | None = None
+
+
+def get_disk_cache() -> WorkflowDiskCache | None:
+    """Get the disk cache used for workflow computation (None if disabled)."""
+    return _CURRENT_CACHE
+
+
+def set_disk_cache(cache: WorkflowDiskCache | None) -> None:
+    """Set the disk cache used for workflow computation (None to disable)."""
+    global _CURRENT_CACHE
+    if cache is not None and not isinstance(cache, WorkflowDiskCache):
+        raise TypeError(f"Expected a WorkflowDiskCache or None, got {cache!r}.")
+    _CURRENT_CACHE = cache
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Any, TYPE_CHECKING
 import uuid
 from himena.workflow._graph import Workflow
+from himena.workflow._incremental import IncrementalWorkflow
 from himena.workflow._reader import LocalReaderMethod, UserInput, RuntimeInputBound
 
 if TYPE_CHECKING:
@@ -35,6 +36,8 @@ def as_function(wf: Workflow):
     fields = workflow_to_input_fields(wf)
     options = {f"arg{i}": val for i, val in enumerate(fields.values())}
     key_to_id = {f"arg{i}": k for i, k in enumerate(fields.keys())}
+    # branches that do not depend on the inputs are reused between calls
+    engine = IncrementalWorkflow(wf)
 
     def func(ui: "MainWindow") -> Parametric:
         @configure_gui(**options)
@@ -54,7 +57,8 @@ def as_function(wf: Workflow):
                     wf_out = wf_out.replace(step_id, v.workflow.model_copy())
                 else:
                     raise NotImplementedError(f"Unsupported type: {type(v)}")
-            out = wf_compute.compute(process_output=True)
+            engine.set_workflow(wf_compute)
+            out = engine.compute(process_output=True)
             if isinstance(out, WidgetDataModel):
                 ui.current_window._update_model_workflow(wf_out)
 
@@ -1,8 +1,10 @@
 from concurrent.futures import Future
-from typing import Iterator, Literal, Any, cast, Union, TYPE_CHECKING
+from typing import Iterator, Literal, Any, Mapping, cast, Union, TYPE_CHECKING
 import uuid
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 from himena.workflow._base import WorkflowStep
+from himena.workflow._cache import content_hash
 
 if TYPE_CHECKING:
     from himena.types import WidgetDataModel
@@ -138,6 +140,31 @@ class CommandExecution(WorkflowStep):
             update["id"] = new_id
         return self.model_copy(update=update)
 
+    def _content_hash(
+        self,
+        parent_hashes: Mapping[uuid.UUID, str | None],
+    ) -> str | None:
+        parts: list[Any] = [self.type, self.command_id, self.parameters is None]
+        for param in self.contexts + (self.parameters or []):
+            if isinstance(param, UserParameter):
+                try:
+                    value = to_json(param.value)
+                except Exception:
+                    return None
+                parts.append((param.type, param.name, value))
+            elif isinstance(param, (ModelParameter, WindowParameter)):
+                if (parent_hash := parent_hashes.get(param.value)) is None:
+                    return None
+                parts.append((param.type, param.name, parent_hash))
+            elif isinstance(param, ListOfModelParameter):
+                hashes = [parent_hashes.get(each) for each in param.value]
+                if None in hashes:
+                    return None
+                parts.append((param.type, param.name, param.is_window, hashes))
+            else:  # pragma: no cover
+                return None
+        return content_hash(*parts)
+
     def _get_model_impl(self, wf: "Workflow") -> "WidgetDataModel":
         from himena.types import WidgetDataModel
         from himena.widgets import current_instance
@@ -164,18 +191,14 @@ class CommandExecution(WorkflowStep):
                 if isinstance(_p, UserParameter):
                     params[_p.name] = _p.value
                 elif isinstance(_p, ModelParameter):
-                    params[_p.name] = wf.filter(_p.value).model_for_id(_p.value)
+                    params[_p.name] = wf.model_for_id(_p.value)
                 elif isinstance(_p, WindowParameter):
-                    params[_p.name] = wf.filter(_p.value).window_for_id(_p.value)
+                    params[_p.name] = wf.window_for_id(_p.value)
                 elif isinstance(_p, ListOfModelParameter):
                     if _p.is_window:
-                        params[_p.name] = [
-                            wf.filter(each).window_for_id(each) for each in _p.value
-                        ]
+                        params[_p.name] = [wf.window_for_id(each) for each in _p.value]
                     else:
-                        params[_p.name] = [
-                            wf.filter(each).model_for_id(each) for each in _p.value
-                        ]
+                        params[_p.name] = [wf.model_for_id(each) for each in _p.value]
                 else:  # pragma: no cover
                     raise ValueError(
                         f"Unknown parameter type: {_p} (command ID: {self.command_id})"
@@ -193,9 +216,7 @@ class CommandExecution(WorkflowStep):
             raise ValueError(
                 f"Expected to return a WidgetDataModel but got {result} (command ID: {self.command_id})"
             )
-        if main := wf._mock_main_window:
-            win = main.add_data_model(result)
-            win._identifier = self.id
+        wf._add_to_cache(self.id, result)
         return result
 
 
@@ -212,6 +233,13 @@ class UserModification(WorkflowStep):
     def iter_parents(self) -> Iterator[uuid.UUID]:
         yield self.original
 
+    def _content_hash(
+        self,
+        parent_hashes: Mapping[uuid.UUID, str | None],
+    ) -> str | None:
+        # modification is skipped, so the output is the same as the original
+        return parent_hashes.get(self.original)
+
     def with_new_id(self, old_id: uuid.UUID, new_id: uuid.UUID) -> "WorkflowStep":
         update = {}
         if self.original == old_id:
@@ -1,5 +1,6 @@
 from contextlib import contextmanager
-from typing import Any, Iterable, TYPE_CHECKING, Union
+import threading
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING, Union
 import uuid
 
 from pydantic import PrivateAttr, BaseModel, Field
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from himena.mock import MainWindowMock
     from himena.mock.widget import MockWidget
     from himena.widgets import SubWindow
+    from himena.workflow._scheduler import ResultCallback
 
 WorkflowStepType = Union[
     ProgrammaticMethod,
@@ -30,6 +32,73 @@ WorkflowStepType = Union[
     UserInput,
 ]
 
+# lock for the cache (mock main window) shared between workflows
+_CACHE_LOCK = threading.Lock()
+
+
+class _WorkflowIndex:
+    """Lookup tables of the workflow graph.
+
+    The index only grows by appending steps, so that the existing entries (including
+    the memoized ancestors) remain valid when a workflow is extended.
+    """
+
+    def __init__(self):
+        self.source: list[WorkflowStep] | None = None  # the list of the workflow
+        self.steps: list[WorkflowStep] = []
+        self.id_to_index: dict[uuid.UUID, int] = {}
+        self.parents: list[list[uuid.UUID]] = []
+        self.children: dict[uuid.UUID, list[uuid.UUID]] = {}
+        self.ancestors: dict[int, frozenset[int]] = {}
+
+    def copy(self) -> "_WorkflowIndex":
+        """Shallow copy (lists of children are copied on write)."""
+        out = _WorkflowIndex()
+        out.steps = self.steps.copy()
+        out.id_to_index = self.id_to_index.copy()
+        out.parents = self.parents.copy()
+        out.children = self.children.copy()
+        out.ancestors = self.ancestors.copy()
+        return out
+
+    def extend(self, steps: Iterable[WorkflowStep]) -> None:
+        for step in steps:
+            index = len(self.steps)
+            self.steps.append(step)
+            self.id_to_index.setdefault(step.id, index)
+            parents = list(step.iter_parents())
+            self.parents.append(parents)
+            for parent in parents:
+                # copy on write, lists may be shared with other indices
+                self.children[parent] = self.children.get(parent, []) + [step.id]
+
+    def is_valid_for(self, steps: list[WorkflowStep]) -> bool:
+        # O(1) check, as this is called for every lookup. Workflow steps are never
+        # replaced in place, so a new list or a different length means that the
+        # steps are changed.
+        return steps is self.source and len(steps) == len(self.steps)
+
+    def get_ancestors(self, index: int) -> frozenset[int]:
+        """Indices of the ancestors of the step at the index (including itself)."""
+        if (out := self.ancestors.get(index)) is not None:
+            return out
+        stack = [index]
+        while stack:
+            current = stack[-1]
+            if current in self.ancestors:
+                stack.pop()
+                continue
+            parent_indices = [self.id_to_index[id_] for id_ in self.parents[current]]
+            if missing := [i for i in parent_indices if i not in self.ancestors]:
+                stack.extend(missing)
+                continue
+            found = {current}
+            for i in parent_indices:
+                found.update(self.ancestors[i])
+            self.ancestors[current] = frozenset(found)
+            stack.pop()
+        return self.ancestors[index]
+
 
 def _make_mock_main_window():
     from himena.mock import MainWindowMock
@@ -50,9 +119,38 @@ class Workflow(BaseModel):
 
     steps: list[WorkflowStepType] = Field(default_factory=list)
     _mock_main_window: "MainWindowMock | None" = PrivateAttr(default=None)
+    _hash_memo: dict[uuid.UUID, str | None] | None = PrivateAttr(default=None)
+    _index: _WorkflowIndex | None = PrivateAttr(default=None)
 
     def id_to_index_map(self) -> dict[uuid.UUID, int]:
-        return {step.id: i for i, step in enumerate(self.steps)}
+        return self._get_index().id_to_index.copy()
+
+    def iter_children(self, id: uuid.UUID) -> Iterator[uuid.UUID]:
+        """Iterate over the IDs of the steps that directly depend on the given ID."""
+        yield from self._get_index().children.get(id, [])
+
+    def _get_index(self) -> _WorkflowIndex:
+        """Get the index of the graph, build it if needed."""
+        if self._index is None or not self._index.is_valid_for(self.steps):
+            index = _WorkflowIndex()
+            index.extend(self.steps)
+            index.source = self.steps
+            self._index = index
+        return self._index
+
+    @classmethod
+    def _from_index(
+        cls,
+        index: _WorkflowIndex,
+        steps: list[WorkflowStep],
+    ) -> "Workflow":
+        """Construct a workflow from an index extended by the new steps."""
+        index = index.copy()
+        index.extend(steps)
+        out = Workflow(steps=index.steps.copy())
+        index.source = out.steps
+        out._index = index
+        return out
 
     def filter(self, step: uuid.UUID) -> "Workflow":
         """Return another workflow that only contains the ancestors of the given ID.
@@ -80,6 +178,7 @@ class Workflow(BaseModel):
         out = Workflow(steps=[self.steps[i] for i in indices])
         # NOTE: do not update, share the reference
         out._mock_main_window = self._mock_main_window
+        out._hash_memo = self._hash_memo
         return out
 
     def __getitem__(self, index: int) -> WorkflowStep:
@@ -101,10 +200,9 @@ class Workflow(BaseModel):
         return Workflow(steps=[step.model_copy() for step in self.steps])
 
     def index_for_id(self, id: uuid.UUID) -> int:
-        for index, step in enumerate(self.steps):
-            if step.id == id:
-                return index
-        raise ValueError(f"Workflow with id {id} not found.")
+        if (index := self._get_index().id_to_index.get(id)) is None:
+            raise ValueError(f"Workflow with id {id} not found.")
+        return index
 
     def step_for_id(self, id: uuid.UUID) -> WorkflowStep:
         return self.steps[self.index_for_id(id)]
@@ -115,9 +213,7 @@ class Workflow(BaseModel):
             return win
         step = self.step_for_id(id)
         model = step.get_model(self)
-        if main := self._mock_main_window:
-            win = main.add_data_model(model)
-            win._identifier = id
+        if win := self._add_to_cache(id, model):
             return win
         raise ValueError("Window input cannot be resolved in this context.")
 
@@ -127,11 +223,22 @@ class Workflow(BaseModel):
             return win.to_model()
         step = self.step_for_id(id)
         model = step.get_model(self)
-        if main := self._mock_main_window:
-            win = main.add_data_model(model)
-            win._identifier = id
+        self._add_to_cache(id, model)
         return model
 
+    def _add_to_cache(
+        self,
+        id: uuid.UUID,
+        model: "WidgetDataModel",
+    ) -> "SubWindow[MockWidget] | None":
+        """Cache the model of the given ID if in the cache context."""
+        if main := self._mock_main_window:
+            with _CACHE_LOCK:
+                win = main.add_data_model(model)
+                win._identifier = id
+            return win
+        return None
+
     def __iter__(self):
         return iter(self.steps)
 
@@ -146,12 +253,15 @@ class Workflow(BaseModel):
         if not isinstance(step, WorkflowStep):
             raise ValueError("Expected a WorkflowStep instance.")
         # The added step is always a unique node.
-        return Workflow(steps=self.steps + [step])
+        return Workflow._from_index(self._get_index(), [step])
 
     def compute(
         self,
         process_output: bool = True,
         metadata: Any | None = None,
+        *,
+        parallel: bool = False,
+        max_workers: int | None = None,
     ) -> "WidgetDataModel":
         """Compute the last node in the workflow.
 
@@ -161,8 +271,20 @@ class Workflow(BaseModel):
             Whether to process the output.
         metadata : Any, optional
             If given, metadata of the output will be overridden by this value.
+        parallel : bool, default False
+            If True, independent steps will be computed concurrently in a thread pool.
+            See `WorkflowScheduler` for details.
+        max_workers : int, optional
+            Maximum number of threads used if `parallel` is True.
         """
         with self._cache_context():
+            if parallel:
+                out = _run_scheduler(self, [self], max_workers)[0]
+                if isinstance(out, Exception):
+                    raise out
+                return self[-1]._finalize_model(
+                    out, self, force_process_output=process_output, metadata=metadata
+                )
             out = self[-1].get_model(
                 self,
                 force_process_output=process_output,
@@ -180,25 +302,57 @@ class Workflow(BaseModel):
         was_none = self._mock_main_window is None
         if was_none:
             self._mock_main_window = _make_mock_main_window()
+            self._hash_memo = {}
         try:
             yield
         finally:
             if was_none:
                 self._mock_main_window.clear()
                 self._mock_main_window = None
+                self._hash_memo = None
+
+    def _content_hash(self, id: uuid.UUID) -> str | None:
+        """Content hash of the step of given ID, or None if not reproducible."""
+        memo = self._hash_memo if self._hash_memo is not None else {}
+        stack = [id]
+        while stack:
+            current = stack[-1]
+            if current in memo:
+                stack.pop()
+                continue
+            try:
+                step = self.step_for_id(current)
+            except ValueError:
+                memo[current] = None
+                continue
+            if missing := [p for p in step.iter_parents() if p not in memo]:
+                stack.extend(missing)
+                continue
+            memo[current] = step._content_hash(memo)
+            stack.pop()
+        return memo[id]
 
     @classmethod
     def concat(cls, workflows: Iterable["Workflow"]) -> "Workflow":
         """Concatenate multiple workflows and drop duplicate nodes based on the ID."""
+        workflows = list(workflows)
+        if len(workflows) == 0:
+            return Workflow()
+        # the index of the first workflow is reused
+        base = workflows[0]
+        base_index = base._get_index()
         nodes: list[WorkflowStep] = []
-        id_found: set[uuid.UUID] = set()
-        for workflow in workflows:
+        id_found = set(base_index.id_to_index)
+        for workflow in workflows[1:]:
             for node in workflow:
                 if node.id in id_found:
                     continue
                 id_found.add(node.id)
                 nodes.append(node)
-        return Workflow(steps=nodes)
+        if len(id_found) != len(base_index.steps) + len(nodes):
+            # base workflow has duplicated IDs
+            return Workflow(steps=_drop_duplicates(base.steps + nodes))
+        return Workflow._from_index(base_index, nodes)
 
     def replace(
         self,
@@ -245,53 +399,145 @@ class Workflow(BaseModel):
         step: uuid.UUID,
         exclude_me: bool = False,
     ) -> tuple[set[int], int]:
-        id_to_index_map = self.id_to_index_map()
-        index = id_to_index_map[step]
-
-        indices = {index}
-        ancestors = [self.steps[index]]
-        while ancestors:
-            current = ancestors.pop()
-            for id_ in current.iter_parents():
-                idx = id_to_index_map[id_]
-                if idx in indices:
-                    continue
-                indices.add(idx)
-                ancestors.append(self.steps[idx])
+        graph_index = self._get_index()
+        index = graph_index.id_to_index[step]
+        indices = set(graph_index.get_ancestors(index))
         if exclude_me:
             indices.remove(index)
         return indices, index
 
 
+def _drop_duplicates(steps: Iterable[WorkflowStep]) -> list[WorkflowStep]:
+    nodes: list[WorkflowStep] = []
+    id_found: set[uuid.UUID] = set()
+    for node in steps:
+        if node.id in id_found:
+            continue
+        id_found.add(node.id)
+        nodes.append(node)
+    return nodes
+
+
 def compute(
     workflows: list[Workflow],
     metadata_overrides: list | None = None,
+    *,
+    parallel: bool = False,
+    max_workers: int | None = None,
+    callback: Callable[[int, "WidgetDataModel | Exception"], None] | None = None,
 ) -> list["WidgetDataModel | Exception"]:
-    """Compute all the workflow with the shared cache."""
+    """Compute all the workflow with the shared cache.
+
+    If `parallel` is True, independent steps of all the workflows will be computed
+    concurrently in a thread pool of at most `max_workers` threads. If `callback` is
+    given, it is called in the calling thread with the index of the workflow and its
+    result as soon as each workflow is computed, in the order of completion.
+    """
     if len(workflows) == 0:
         return []
+    if parallel:
+        return _compute_parallel(workflows, metadata_overrides, max_workers, callback)
     _global_ui = _make_mock_main_window()
+    _global_hash_memo: dict[uuid.UUID, str | None] = {}
     results: list["WidgetDataModel"] = []
     all_workflows = Workflow.concat(workflows)
     # share the cache
     for workflow in workflows:
         workflow._mock_main_window = _global_ui
+        workflow._hash_memo = _global_hash_memo
     # normalize metadata
     if metadata_overrides is None:
         metadata_overrides = [None] * len(workflows)
     with all_workflows._cache_context():
-        for workflow, meta in zip(workflows, metadata_overrides, strict=True):
+        for i, (workflow, meta) in enumerate(
+            zip(workflows, metadata_overrides, strict=True)
+        ):
             try:
                 result = workflow.compute(process_output=False, metadata=meta)
             except Exception as e:
                 result = e
             results.append(result)
+            if callback is not None:
+                callback(i, result)
     _global_ui.clear()
     for workflow in workflows:
         workflow._mock_main_window = None
+        workflow._hash_memo = None
+    return results
+
+
+def _compute_parallel(
+    workflows: list[Workflow],
+    metadata_overrides: list | None,
+    max_workers: int | None,
+    callback: Callable[[int, "WidgetDataModel | Exception"], None] | None = None,
+) -> list["WidgetDataModel | Exception"]:
+    if metadata_overrides is None:
+        metadata_overrides = [None] * len(workflows)
+    all_workflows = Workflow.concat(workflows)
+    results: list["WidgetDataModel | Exception | None"] = [None] * len(workflows)
+    # workflows may share the same last step
+    last_id_to_indices: dict[uuid.UUID, list[int]] = {}
+    for i, workflow in enumerate(workflows):
+        last_id_to_indices.setdefault(workflow.last_id(), []).append(i)
+
+    def _on_computed(id_: uuid.UUID, out: "WidgetDataModel | Exception"):
+        if not isinstance(out, Exception):
+            _override_cached_metadata(
+                all_workflows,
+                id_,
+                [metadata_overrides[i] for i in last_id_to_indices[id_]],
+            )
+        for i in last_id_to_indices[id_]:
+            workflow, result = workflows[i], out
+            if not isinstance(result, Exception):
+                try:
+                    # outputs may be shared between workflows with the same last step
+                    result = workflow[-1]._finalize_model(
+                        result.model_copy(), workflow, metadata=metadata_overrides[i]
+                    )
+                except Exception as e:
+                    result = e
+            results[i] = result
+            if callback is not None:
+                callback(i, result)
+
+    with all_workflows._cache_context():
+        _run_scheduler(all_workflows, workflows, max_workers, _on_computed)
     return results
 
 
+def _override_cached_metadata(wf: Workflow, id_: uuid.UUID, metadata: list) -> None:
+    """Set the metadata override of a target to its cached model.
+
+    Targets may be the inputs of other targets (such as windows that are the inputs
+    of a command). They have to read the model with the overridden metadata, same as
+    when the workflows are computed one by one. This is called before the dependents
+    of the target are computed.
+    """
+    if (meta := next((m for m in metadata if m is not None), None)) is None:
+        return
+    if (main := wf._mock_main_window) and (win := main.window_for_id(id_)):
+        with _CACHE_LOCK:
+            win.widget.update_model(
+                win.to_model().model_copy(update={"metadata": meta})
+            )
+
+
+def _run_scheduler(
+    wf: Workflow,
+    workflows: list[Workflow],
+    max_workers: int | None,
+    callback: "ResultCallback | None" = None,
+) -> list["WidgetDataModel | Exception"]:
+    """Compute the last steps of `workflows` in `wf` using the scheduler."""
+    from himena.workflow._scheduler import WorkflowScheduler
+
+    scheduler = WorkflowScheduler(wf, max_workers=max_workers)
+    computed = scheduler.run((workflow.last_id() for workflow in workflows), callback)
+    return [computed[workflow.last_id()] for workflow in workflows]
+
+
 def is_reproducible(workflows: list[Workflow]) -> list[bool]:
     if len(workflows) == 0:
         return []
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+import uuid
+
+from himena.workflow._base import WorkflowStep
+from himena.workflow._command import CommandExecution, UserParameter
+from himena.workflow._graph import Workflow
+from himena.workflow._reader import ReaderMethod
+
+if TYPE_CHECKING:
+    from himena.types import WidgetDataModel
+
+
+class IncrementalWorkflow:
+    """Workflow wrapper that recomputes only the steps affected by changes.
+
+    Results of the computed steps are kept between `compute` calls. When the
+    workflow is updated (a parameter is changed, a step is replaced, etc.), only the
+    changed steps and their descendants are marked as dirty, so that the next
+    computation reuses the results of the unchanged ancestors. Reader steps are also
+    marked as dirty when their source files are modified on disk.
+
+    >>> engine = IncrementalWorkflow(wf)
+    >>> engine.compute()  # compute all the steps
+    >>> engine.set_parameter(step_id, "sigma", 2.0)
+    >>> engine.compute()  # only `step_id` and its descendants are recomputed
+    """
+
+    def __init__(self, workflow: Workflow):
+        self._workflow = Workflow()
+        self._results: dict[uuid.UUID, WidgetDataModel] = {}
+        # content hash of the source of each reader step when it was computed
+        self._source_hashes: dict[uuid.UUID, str | None] = {}
+        self.set_workflow(workflow)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._workflow!r})"
+
+    @property
+    def workflow(self) -> Workflow:
+        """The current workflow."""
+        return self._workflow
+
+    def set_workflow(self, workflow: Workflow) -> None:
+        """Update the workflow and invalidate the changed steps and descendants."""
+        if not isinstance(workflow, Workflow):
+            raise TypeError(f"Expected a Workflow, got {type(workflow)}.")
+        old_steps = {step.id: step for step in self._workflow}
+        changed = [
+            step.id
+            for step in workflow
+            if (old := old_steps.get(step.id)) is None or not _is_same_step(old, step)
+        ]
+        self._workflow = workflow
+        alive = {step.id for step in workflow}
+        for id_ in list(self._results):
+            if id_ not in alive:
+                self._results.pop(id_)
+        for id_ in self._descendants(changed):
+            self._results.pop(id_, None)
+
+    def set_parameter(self, step_id: uuid.UUID, name: str, value: Any) -> None:
+        """Update the user parameter of a command execution step."""
+        step = self._workflow.step_for_id(step_id)
+        if not isinstance(step, CommandExecution) or step.parameters is None:
+            raise ValueError(f"Step {step_id} is not a parametric command execution.")
+        for i, param in enumerate(step.parameters):
+            if isinstance(param, UserParameter) and param.name == name:
+                break
+        else:
+            raise ValueError(f"User parameter {name!r} not found in step {step_id}.")
+        params = step.parameters.copy()
+        params[i] = param.model_copy(update={"value": value})
+        self.replace_step(step_id, step.model_copy(update={"parameters": params}))
+
+    def replace_step(self, step_id: uuid.UUID, new: WorkflowStep) -> None:
+        """Replace the step of the given ID with a new step of the same ID."""
+        index = self._workflow.index_for_id(step_id)
+        steps = self._workflow.steps.copy()
+        steps[index] = new.model_copy(update={"id": step_id})
+        self.set_workflow(Workflow(steps=steps))
+
+    def invalidate(self, step_id: uuid.UUID | None = None) -> None:
+        """Mark the step and its descendants as dirty (all the steps if not given)."""
+        if step_id is None:
+            self._results.clear()
+        else:
+            for id_ in self._descendants([step_id]):
+                self._results.pop(id_, None)
+
+    def is_dirty(self, step_id: uuid.UUID) -> bool:
+        """True if the step needs to be recomputed."""
+        return step_id not in self._results
+
+    def compute(
+        self,
+        process_output: bool = True,
+        metadata: Any | None = None,
+    ) -> WidgetDataModel:
+        """Compute the last step, reusing the results of the clean steps."""
+        self._invalidate_modified_sources()
+        wf = self._workflow
+        if (last := wf.last_id()) in self._results:
+            return wf[-1]._finalize_model(
+                self._results[last].model_copy(),
+                wf,
+                force_process_output=process_output,
+                metadata=metadata,
+            )
+        with wf._cache_context():
+            for id_, model in self._results.items():
+                wf._add_to_cache(id_, model)
+            try:
+                out = wf.compute(process_output=process_output, metadata=metadata)
+            finally:
+                for win in wf._mock_main_window.iter_windows():
+                    if win._identifier not in self._results:
+                        self._results[win._identifier] = win.to_model()
+        return out
+
+    def _invalidate_modified_sources(self) -> None:
+        """Mark reader steps whose source files are modified as dirty."""
+        hashes: dict[uuid.UUID, str | None] = {}
+        changed: list[uuid.UUID] = []
+        for step in self._workflow:
+            if not isinstance(step, ReaderMethod):
+                continue
+            hashes[step.id] = key = step._content_hash({})
+            # sources that cannot be hashed (remote files, directories) are always
+            # read again
+            if key is None or self._source_hashes.get(step.id) != key:
+                changed.append(step.id)
+        self._source_hashes = hashes
+        for id_ in self._descendants(changed):
+            self._results.pop(id_, None)
+
+    def _descendants(self, ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        """Return the given IDs and all their descendants."""
+        found = set(ids)
+        stack = list(ids)
+        while stack:
+            for child in self._workflow.iter_children(stack.pop()):
+                if child not in found:
+                    found.add(child)
+                    stack.append(child)
+        return found
+
+
+def _is_same_step(old: WorkflowStep, new: WorkflowStep) -> bool:
+    """Check if two steps have the same definition (timestamp is ignored)."""
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    for name in type(new).model_fields:
+        if name == "datetime":
+            continue
+        val_old, val_new = getattr(old, name), getattr(new, name)
+        try:
+            if val_old is not val_new and not bool(val_old == val_new):
+                return False
+        except Exception:  # such as comparison of arrays
+            return False
+    return True
@@ -1,8 +1,9 @@
 from contextlib import contextmanager
 import tempfile
-from typing import Iterator, Literal, Any, TYPE_CHECKING
+from typing import ClassVar, Iterator, Literal, Any, Mapping, TYPE_CHECKING
 from pathlib import Path
 import subprocess
+import uuid
 
 from pydantic import Field
 from himena.consts import StandardType, IS_WSL
@@ -10,6 +11,7 @@ from himena.exceptions import NotExecutable
 from himena.utils.misc import PluginInfo
 from himena.utils.cli import remote_to_local, wsl_to_local, to_wsl_path_from_wsl
 from himena.workflow._base import WorkflowStep
+from himena.workflow._cache import content_hash
 
 if TYPE_CHECKING:
     from himena.types import WidgetDataModel
@@ -21,6 +23,8 @@ class NoParentWorkflow(WorkflowStep):
 
     output_model_type: str | None = Field(default=None)
 
+    _thread_safe: ClassVar[bool] = True
+
     def iter_parents(self) -> Iterator[int]:
         yield from ()
 
@@ -142,11 +146,26 @@ class LocalReaderMethod(ReaderMethod):
 
     def _get_model_impl(self, wf: "Workflow") -> "WidgetDataModel[Any]":
         out = self.run()
-        if main := wf._mock_main_window:
-            win = main.add_data_model(out)
-            win._identifier = self.id
+        wf._add_to_cache(self.id, out)
         return out
 
+    def _content_hash(
+        self,
+        parent_hashes: Mapping[uuid.UUID, str | None],
+    ) -> str | None:
+        paths = [self.path] if isinstance(self.path, Path) else self.path
+        parts: list[Any] = [self.type, self.plugin, repr(self.metadata_override)]
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                return None
+            if path.is_dir():
+                # modification of the content is not reflected in the stat
+                return None
+            parts.append((path.resolve().as_posix(), stat.st_mtime_ns, stat.st_size))
+        return content_hash(*parts)
+
     @property
     def force_directory(self) -> bool:
         # just for compatibility with PathReaderMethod
@@ -229,9 +248,7 @@ class RemoteReaderMethod(PathReaderMethod):
 
     def _get_model_impl(self, wf: "Workflow") -> "WidgetDataModel":
         out = self.run()
-        if main := wf._mock_main_window:
-            win = main.add_data_model(out)
-            win._identifier = self.id
+        wf._add_to_cache(self.id, out)
         return out
 
     def run_command(self, dst_path: Path, stdout=None):
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from logging import getLogger
+import time
+from typing import Callable, Iterable, TYPE_CHECKING
+import uuid
+
+from himena.workflow._base import WorkflowStep
+
+if TYPE_CHECKING:
+    from himena.types import WidgetDataModel
+    from himena.workflow import Workflow
+
+    ResultCallback = Callable[[uuid.UUID, WidgetDataModel | Exception], None]
+
+_LOGGER = getLogger(__name__)
+
+
+class WorkflowScheduler:
+    """Compute the nodes of a workflow DAG in topological order.
+
+    Nodes whose parents are all resolved are computed concurrently on a thread pool,
+    so that independent branches (such as two file readers) do not wait on each other.
+    Steps that are not thread-safe (such as `CommandExecution`, which runs commands
+    of the application) are computed on the calling thread, interleaved with the
+    threaded ones.
+
+    Parameters
+    ----------
+    workflow : Workflow
+        The workflow that contains all the nodes to be computed. This workflow must be
+        in the cache context (see `Workflow._cache_context`).
+    max_workers : int, optional
+        Maximum number of threads used to compute the thread-safe steps.
+    """
+
+    def __init__(self, workflow: Workflow, max_workers: int | None = None):
+        self._workflow = workflow
+        self._max_workers = max_workers
+        self._results: dict[uuid.UUID, WidgetDataModel | Exception] = {}
+        self._timings: dict[uuid.UUID, float] = {}
+
+    @property
+    def timings(self) -> dict[uuid.UUID, float]:
+        """Time (seconds) spent to compute each node."""
+        return self._timings.copy()
+
+    def topological_order(self, targets: Iterable[uuid.UUID]) -> list[uuid.UUID]:
+        """Return the IDs of the targets and their ancestors in topological order."""
+        children, num_parents = self._build_graph(targets)
+        order: list[uuid.UUID] = []
+        ready = deque(id_ for id_, num in num_parents.items() if num == 0)
+        while ready:
+            id_ = ready.popleft()
+            order.append(id_)
+            for child in children[id_]:
+                num_parents[child] -= 1
+                if num_parents[child] == 0:
+                    ready.append(child)
+        if len(order) != len(num_parents):
+            raise ValueError("Workflow contains a cycle.")
+        return order
+
+    def run(
+        self,
+        targets: Iterable[uuid.UUID],
+        callback: ResultCallback | None = None,
+    ) -> dict[uuid.UUID, WidgetDataModel | Exception]:
+        """Compute all the targets and their ancestors.
+
+        Returns a dictionary that maps each computed node ID to its model, or to the
+        exception raised during the computation of the node or one of its ancestors.
+        Models of the targets are not finalized (workflow, metadata and output
+        processing are left to the caller).
+
+        If `callback` is given, it is called in the calling thread with the ID and the
+        result of each target as soon as the target is resolved.
+        """
+        wf = self._workflow
+        targets = set(targets)
+        children, num_parents = self._build_graph(targets)
+        ready_threaded = deque[WorkflowStep]()
+        ready_serial = deque[WorkflowStep]()
+        running: dict[Future, uuid.UUID] = {}
+
+        def _on_resolved(id_: uuid.UUID):
+            if callback is not None and id_ in targets:
+                callback(id_, self._results[id_])
+            for child in children[id_]:
+                num_parents[child] -= 1
+                if num_parents[child] == 0:
+                    _push_ready(wf.step_for_id(child))
+
+        def _push_ready(step: WorkflowStep):
+            if (exc := self._failed_parent(step)) is not None:
+                self._results[step.id] = exc
+                _on_resolved(step.id)
+            elif step._thread_safe:
+                ready_threaded.append(step)
+            else:
+                ready_serial.append(step)
+
+        for id_, num in num_parents.items():
+            if num == 0:
+                _push_ready(wf.step_for_id(id_))
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while ready_threaded or ready_serial or running:
+                while ready_threaded:
+                    step = ready_threaded.popleft()
+                    running[executor.submit(_timed_compute, step, wf)] = step.id
+                if ready_serial:
+                    # Compute one step at a time, so that newly ready thread-safe
+                    # steps are submitted as early as possible.
+                    step = ready_serial.popleft()
+                    self._set_result(step.id, *_timed_compute(step, wf), targets)
+                    _on_resolved(step.id)
+                    done = [fut for fut in running if fut.done()]
+                else:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    id_ = running.pop(fut)
+                    self._set_result(id_, *fut.result(), targets)
+                    _on_resolved(id_)
+        return self._results.copy()
+
+    def _build_graph(
+        self,
+        targets: Iterable[uuid.UUID],
+    ) -> tuple[dict[uuid.UUID, list[uuid.UUID]], dict[uuid.UUID, int]]:
+        """Return the children list and the number of parents for each needed node."""
+        wf = self._workflow
+        needed = set[uuid.UUID]()
+        for target in targets:
+            needed.update(wf[i].id for i in wf._get_ancestors(target)[0])
+        # iterate over the steps to keep the original order among independent nodes
+        steps = [step for step in wf if step.id in needed]
+        children: dict[uuid.UUID, list[uuid.UUID]] = {step.id: [] for step in steps}
+        num_parents: dict[uuid.UUID, int] = {}
+        for step in steps:
+            parents = set(step.iter_parents())
+            num_parents[step.id] = len(parents)
+            for parent in parents:
+                children[parent].append(step.id)
+        return children, num_parents
+
+    def _failed_parent(self, step: WorkflowStep) -> Exception | None:
+        for parent in step.iter_parents():
+            if isinstance(out := self._results.get(parent), Exception):
+                return out
+        return None
+
+    def _set_result(
+        self,
+        id_: uuid.UUID,
+        model: WidgetDataModel | Exception,
+        elapsed: float,
+        targets: set[uuid.UUID],
+    ) -> None:
+        self._timings[id_] = elapsed
+        if not isinstance(model, Exception) and id_ not in targets:
+            step = self._workflow.step_for_id(id_)
+            model.workflow = self._workflow
+            if step.process_output:
+                # processing output may update the GUI, must be in the calling thread
+                try:
+                    step._current_store().process(model)
+                except Exception as e:
+                    model = e
+        self._results[id_] = model
+        _LOGGER.debug("Workflow step %s computed in %.3f sec", id_, elapsed)
+
+
+def _timed_compute(
+    step: WorkflowStep,
+    wf: Workflow,
+) -> tuple[WidgetDataModel | Exception, float]:
+    start = time.perf_counter()
+    try:
+        if win := wf._mock_main_window.window_for_id(step.id):
+            out = win.to_model()
+        else:
+            out = step._get_model_cached(wf)
+    except Exception as e:
+        out = e
+    return out, time.perf_counter() - start
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import importlib
 import csv
+import io
+import itertools
 import json
-from pathlib import Path
-from typing import TYPE_CHECKING, Any
+import math
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, Iterable
 
 import numpy as np
 from himena.types import WidgetDataModel
@@ -14,7 +17,7 @@ from himena.consts import StandardType
 from himena.workflow import Workflow
 
 if TYPE_CHECKING:
-    from openpyxl.worksheet.worksheet import Worksheet
+    import zipfile
     from himena.standards import plotting as hplt
     from himena._providers import ReaderStore
 
@@ -24,27 +27,28 @@ if TYPE_CHECKING:
 
 
 def _infer_encoding(file_path: Path) -> str | None:
+    with file_path.open("rb") as f:
+        return _detect_encoding(f)
+
+
+def _detect_encoding(chunks: Iterable[bytes]) -> str | None:
     import chardet
 
-    with file_path.open("rb") as f:
-        detector = chardet.UniversalDetector()
-        for line in f:
-            detector.feed(line)
-            if detector.done:
-                break
-        detector.close()
+    detector = chardet.UniversalDetector()
+    for chunk in chunks:
+        detector.feed(chunk)
+        if detector.done:
+            break
+    detector.close()
     encoding = detector.result["encoding"]
     if encoding == "ascii":
         encoding = "utf-8"  # ascii is a subset of utf-8
     return encoding
 
 
-def _infer_separator(file_path: Path, encoding: str | None = None) -> str:
+def _separator_of_line(line: str) -> str:
     _seps = ["\t", ";", ","]
-    with file_path.open("r", encoding=encoding) as f:
-        first_line = f.readline()
-
-    _count_table = {sep: first_line.count(sep) for sep in _seps}
+    _count_table = {sep: line.count(sep) for sep in _seps}
     _max_sep: str = max(_count_table, key=_count_table.get)
     if _count_table[_max_sep] == 0:
         return ","
@@ -127,49 +131,87 @@ def default_image_reader(file_path: Path) -> WidgetDataModel:
 
 
 def default_zip_reader(file_path: Path) -> WidgetDataModel:
-    """Read zip file as a model stack."""
+    """Read zip file as a list of lazy models.
+
+    Nothing is extracted until a member is requested. Directories in the archive are
+    read as nested model lists.
+    """
     import zipfile
-    import tempfile
     from himena._providers import ReaderStore
 
     store = ReaderStore.instance()
-    models = []
-    with tempfile.TemporaryDirectory() as tmpdir, zipfile.ZipFile(file_path, "r") as z:
-        tmpdir = Path(tmpdir)
-        z.extractall(tmpdir)
-        for each in tmpdir.glob("*"):
-            model = store.run(each)
-            model.title = each.name
-            models.append(model)
-    return WidgetDataModel(value=models, type=StandardType.MODELS)
+    with zipfile.ZipFile(file_path, "r") as z:
+        value = _zip_members_as_models(store, file_path, zipfile.Path(z))
+    return WidgetDataModel(value=value, type=StandardType.MODELS)
 
 
-def _read_txt_as_numpy(file_path: Path, delimiter: str | None = None):
-    encoding = _infer_encoding(file_path)
-    sep = delimiter or _infer_separator(file_path, encoding)
-    try:
-        if file_path.stat().st_size == 0:
-            arr = np.array([[]], dtype=np.dtypes.StringDType())
+def _zip_members_as_models(
+    store: ReaderStore, file_path: Path, directory: zipfile.Path
+) -> list[WidgetDataModel]:
+    value: list[WidgetDataModel] = []
+    for member in sorted(directory.iterdir(), key=_zip_custom_key):
+        if member.is_dir():
+            model = WidgetDataModel(
+                value=_zip_members_as_models(store, file_path, member),
+                type=StandardType.MODELS,
+                title=member.name,
+            )
         else:
-            arr = np.loadtxt(
-                file_path,
-                dtype=np.dtypes.StringDType(),
-                delimiter=sep,
-                encoding=encoding,
+            model = WidgetDataModel(
+                value=_make_lazy_zip_reader(store, file_path, member.at),
+                type=StandardType.LAZY,
+                title=member.name,
             )
-    except ValueError:
-        # If the file has different number of columns in each row, np.loadtxt fails.
-        with file_path.open("r", encoding=encoding) as f:
-            reader = csv.reader(f, delimiter=sep)
-            ncols = 0
-            rows = []
-            for row in reader:
-                rows.append(row)
-                ncols = max(ncols, len(row))
-            arr = np.zeros((len(rows), ncols), dtype=np.dtypes.StringDType())
-            for i, row in enumerate(rows):
-                arr[i, : len(row)] = row
+        value.append(model)
+    return value
 
+
+def _zip_custom_key(member: zipfile.Path):
+    return f"{'d' if member.is_dir() else 'f'}{member.name}"
+
+
+def _make_lazy_zip_reader(store: ReaderStore, file_path: Path, member: str):
+    def _read() -> WidgetDataModel:
+        import shutil
+        import tempfile
+        import zipfile
+
+        # readers need a real path, so only this member is extracted
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            zipfile.ZipFile(file_path, "r") as z,
+        ):
+            dest = Path(tmpdir, PurePosixPath(member).name)
+            with z.open(member) as src, dest.open("wb") as dst:
+                shutil.copyfileobj(src, dst)
+            model = store.run(dest)
+        model.title = dest.name
+        return model
+
+    return _read
+
+
+# encoding and separator are inferred from the first bytes of a table file
+_TABLE_SAMPLE_BYTES = 1 << 16
+# number of rows parsed at once by `_read_table_chunks`
+_TABLE_CHUNK_ROWS = 1 << 15
+
+
+def _read_txt_as_numpy(file_path: Path, delimiter: str | None = None):
+    with file_path.open("rb") as f:
+        sample = f.read(_TABLE_SAMPLE_BYTES)
+    encoding = _detect_encoding([sample])
+    if delimiter is None:
+        head = sample.decode(encoding or "utf-8", errors="ignore")
+        sep = _separator_of_line(head.split("\n", 1)[0])
+    else:
+        sep = delimiter
+    try:
+        arr = _read_table_chunks(file_path, sep, encoding)
+    except UnicodeDecodeError:
+        # non-ASCII characters may appear after the sample
+        encoding = _infer_encoding(file_path)
+        arr = _read_table_chunks(file_path, sep, encoding)
     return WidgetDataModel(
         value=arr,
         type=StandardType.TABLE,
@@ -178,6 +220,99 @@ def _read_txt_as_numpy(file_path: Path, delimiter: str | None = None):
     )
 
 
+def _read_table_chunks(file_path: Path, sep: str, encoding: str | None) -> np.ndarray:
+    """Read a delimited text file as a 2D string array.
+
+    Rows are parsed by chunks, so that only a limited number of rows are kept as
+    Python objects at the same time. Same as `np.loadtxt`, the text after "#" is a
+    comment and blank lines are skipped. If the rows have different number of
+    columns, or a quoted field is not closed in the line, the file is parsed again
+    as a plain CSV file, where comments are not removed, blank lines are empty rows,
+    and missing cells are empty strings.
+    """
+    try:
+        with file_path.open("r", encoding=encoding, newline="") as f:
+            stripped = (_strip_comment(line, sep) for line in f)
+            lines = (line for line in stripped if line.strip())
+            chunks = _parse_row_chunks(csv.reader(lines, delimiter=sep), strict=True)
+    except _NotUniformTable:
+        # the traceback refers to the chunks parsed so far, so they are released
+        # outside the except clause
+        chunks = None
+    if chunks is None:
+        with file_path.open("r", encoding=encoding, newline="") as f:
+            chunks = _parse_row_chunks(csv.reader(f, delimiter=sep))
+    if len(chunks) == 0:
+        return np.array([[]], dtype=np.dtypes.StringDType())
+    ncols = max(chunk.shape[1] for chunk in chunks)
+    for i, chunk in enumerate(chunks):
+        if chunk.shape[1] < ncols:
+            chunks[i] = np.pad(
+                chunk, [(0, 0), (0, ncols - chunk.shape[1])], constant_values=""
+            )
+    if len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks, axis=0)
+
+
+class _NotUniformTable(Exception):
+    """Raised if a table file cannot be parsed as `np.loadtxt` does."""
+
+
+def _strip_comment(line: str, sep: str) -> str:
+    """Remove the text after "#", unless "#" is in a quoted field."""
+    if '"' not in line:
+        if (pos := line.find("#")) >= 0:
+            return line[:pos]
+        return line
+    quoted = closed = False
+    for pos, char in enumerate(line):
+        if char == '"':
+            if quoted:
+                quoted, closed = False, True
+            elif closed or pos == 0 or line[pos - 1] == sep:
+                # a new quoted field, or an escaped quote ("") in a quoted field
+                quoted, closed = True, False
+            continue
+        closed = False
+        if char == "#" and not quoted:
+            return line[:pos]
+    if quoted:
+        # the quoted field continues in the next line
+        raise _NotUniformTable
+    return line
+
+
+def _parse_row_chunks(
+    reader: Iterable[list[str]], strict: bool = False
+) -> list[np.ndarray]:
+    """Parse rows by chunks.
+
+    If `strict` is true, `_NotUniformTable` is raised as soon as the rows are found
+    to have different number of columns.
+    """
+    str_dtype = np.dtypes.StringDType()
+    chunks: list[np.ndarray] = []
+    while rows := list(itertools.islice(reader, _TABLE_CHUNK_ROWS)):
+        chunk, chunk_uniform = _rows_to_array(rows, str_dtype)
+        if strict and (
+            not chunk_uniform or (chunks and chunk.shape[1] != chunks[0].shape[1])
+        ):
+            raise _NotUniformTable
+        chunks.append(chunk)
+    return chunks
+
+
+def _rows_to_array(rows: list[list[str]], dtype) -> tuple[np.ndarray, bool]:
+    ncols = max(len(row) for row in rows)
+    if all(len(row) == ncols for row in rows):
+        return np.array(rows, dtype=dtype).reshape(len(rows), ncols), True
+    arr = np.zeros((len(rows), ncols), dtype=dtype)
+    for i, row in enumerate(rows):
+        arr[i, : len(row)] = row
+    return arr, False
+
+
 def default_csv_reader(file_path: Path) -> WidgetDataModel:
     """Read CSV file."""
     return _read_txt_as_numpy(file_path)
@@ -215,32 +350,51 @@ def default_roi_reader(file_path: Path) -> WidgetDataModel:
 
 
 def default_excel_reader(file_path: Path) -> WidgetDataModel:
-    """Read Excel file."""
-    import openpyxl
+    """Read Excel file.
 
-    wb = openpyxl.load_workbook(file_path, data_only=False)
-    data = {}
-    for sheet in wb.sheetnames:
-        ws = wb[sheet]
-        sheet_data = []
-        for row in ws.iter_rows():
-            row_input = []
-            for cell in row:
-                if cell.value is None:
-                    row_input.append("")
-                else:
-                    row_input.append(str(cell.value))
-            sheet_data.append(row_input)
-
-        data[sheet] = np.asarray(sheet_data, dtype=np.dtypes.StringDType())
+    Only the sheet names are read here. Each sheet is loaded in the read-only mode
+    when it is accessed for the first time. The file content is kept in memory, as
+    the file may be deleted before the sheets are loaded (such as files extracted
+    to a temporary directory).
+    """
+    import openpyxl
+    from himena.utils.collections import LazyDict
 
+    content = file_path.read_bytes()
+    wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=False)
+    try:
+        sheet_names = wb.sheetnames
+    finally:
+        wb.close()
     return WidgetDataModel(
-        value=data,
+        value=LazyDict(sheet_names, lambda sheet: _read_excel_sheet(content, sheet)),
         type=StandardType.EXCEL,
         extension_default=file_path.suffix,
     )
 
 
+def _read_excel_sheet(content: bytes, sheet: str) -> np.ndarray:
+    import openpyxl
+
+    wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=False)
+    try:
+        rows = list(wb[sheet].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    str_dtype = np.dtypes.StringDType()
+    if len(rows) == 0:
+        return np.asarray([], dtype=str_dtype)
+    ncols = max(len(row) for row in rows)
+    if all(len(row) == ncols for row in rows):
+        arr = np.array(rows, dtype=object).reshape(len(rows), ncols)
+    else:
+        arr = np.full((len(rows), ncols), None, dtype=object)
+        for i, row in enumerate(rows):
+            arr[i, : len(row)] = row
+    arr[np.equal(arr, None)] = ""
+    return arr.astype(str_dtype)
+
+
 def default_email_reader(file_path: Path) -> WidgetDataModel:
     """Read email file."""
     import email
@@ -426,27 +580,36 @@ def default_excel_writer(
     """Write Excel file."""
     import openpyxl
 
-    wb = openpyxl.Workbook()
-    if active_sheet := wb.active:
-        wb.remove(active_sheet)
+    wb = openpyxl.Workbook(write_only=True)
     for sheet_name, table in model.value.items():
-        ws: Worksheet = wb.create_sheet(sheet_name)
-        for r, row in enumerate(table):
-            for c, cell_str in enumerate(row):
-                cell_str: str
-                if cell_str.startswith("="):
-                    cell_data_type = "f"
-                else:
-                    try:
-                        float(cell_str)
-                        cell_data_type = "n"
-                    except ValueError:
-                        cell_data_type = "s"
-                ws.cell(r + 1, c + 1).value = cell_str
-                ws.cell(r + 1, c + 1).data_type = cell_data_type
+        ws = wb.create_sheet(sheet_name)
+        for row in np.atleast_2d(table).tolist():
+            ws.append([_excel_cell_value(cell_str) for cell_str in row])
     wb.save(path)
 
 
+def _excel_cell_value(cell_str: str) -> Any:
+    """Convert a cell string into a value that openpyxl writes with a proper type.
+
+    Strings starting with "=" are written as formulas by openpyxl.
+    """
+    if cell_str == "":
+        return None
+    if cell_str.startswith("="):
+        return cell_str
+    try:
+        return int(cell_str)
+    except ValueError:
+        pass
+    try:
+        value = float(cell_str)
+    except ValueError:
+        return cell_str
+    if math.isfinite(value):
+        return value
+    return cell_str
+
+
 def default_array_writer(
     model: WidgetDataModel[np.ndarray],
     path: Path,
@@ -11,6 +11,7 @@ from himena.testing.subwindow import WidgetTester
 from himena.workflow import CommandExecution
 from himena_builtins.qt.dataframe import QDataFrameView, QDataFramePlotView
 from himena_builtins.qt.widgets.dataframe import select_columns
+from himena_builtins.qt.widgets._table_components import format_table_value
 from himena_builtins.qt.basic import QDictView
 
 _Ctrl = Qt.KeyboardModifier.ControlModifier
@@ -244,3 +245,74 @@ def _data_frame_equal(a: dict, b: dict):
         if not np.all(a[k] == b[k]):
             return False
     return True
+
+
+def test_format_table_values():
+    from himena_builtins.qt.widgets._table_components import (
+        format_table_value,
+        format_table_values,
+    )
+
+    values = np.array([0.0, -0.0, 0.05, 0.1, 1.5, -3.25, 99999.5, 1e6, np.nan, np.inf])
+    for arr, kind in [
+        (values, "f"),
+        (values.astype(np.float32), "f"),
+        (np.array([0, -3, 1 << 40]), "i"),
+        (np.array([1, 2], dtype=np.uint8), "u"),
+        (np.array([True, False]), "b"),
+        (np.array(["a", 1, None], dtype=object), "O"),
+    ]:
+        assert format_table_values(arr, kind) == [
+            format_table_value(v, kind) for v in arr
+        ]
+
+
+@pytest.mark.parametrize("backend", ["dict", "pandas", "polars"])
+def test_dataframe_cell_blocks(himena_ui: MainWindow, qtbot: QtBot, backend: str):
+    nrows = 300
+    data = {"i": np.arange(nrows)[::-1], "f": np.linspace(0, 1, nrows)}
+    if backend == "pandas":
+        data = pd.DataFrame(data)
+    elif backend == "polars":
+        data = pl.DataFrame(data).with_columns(
+            pl.when(pl.col("i") % 7 == 0).then(None).otherwise(pl.col("i")).alias("n")
+        )
+    ss = QDataFrameView(himena_ui)
+    qtbot.addWidget(ss)
+    ss.update_model(create_dataframe_model(data))
+    model = ss.model()
+    df = model.df
+    for r in [0, 1, 127, 128, 299]:
+        for c in range(df.num_columns()):
+            expected = df[r, c]
+            text = model.data(model.index(r, c))
+            if expected is None:
+                assert text == "null"
+            else:
+                assert text == format_table_value(expected, df.get_dtype(c).kind)
+    ss.selection_model.set_ranges([(slice(0, 1), slice(0, 1))])
+    ss._sort_table_by_column()
+    assert model.data(model.index(0, 0)) == "0"
+    assert model.data(model.index(299, 0)) == "299"
+    ss.edit_cell(0, 1, "2.5")
+    assert model.data(model.index(0, 1)) == "2.5000"
+
+
+def test_dataframe_filter(himena_ui: MainWindow, qtbot: QtBot):
+    ss = QDataFrameView(himena_ui)
+    qtbot.addWidget(ss)
+    ss.update_model(create_dataframe_model({"a": [3, 1, 4, 1, 5], "b": list("pqrst")}))
+    model = ss.model()
+    ss.set_row_filter("a", lambda x: x > 1)
+    assert model.rowCount() == 3
+    assert [model.data(model.index(r, 1)) for r in range(3)] == ["p", "r", "t"]
+    ss.selection_model.set_ranges([(slice(0, 1), slice(0, 1))])
+    ss._sort_table_by_column()
+    ss._sort_table_by_column()
+    assert [model.data(model.index(r, 1)) for r in range(3)] == ["t", "r", "p"]
+    ss.edit_cell(0, 0, "0")
+    assert model.rowCount() == 2
+    assert [model.data(model.index(r, 1)) for r in range(2)] == ["r", "p"]
+    assert ss.to_model().value["a"].tolist() == [3, 1, 4, 1, 0]
+    ss.set_row_filter("a", None)
+    assert model.rowCount() == 5
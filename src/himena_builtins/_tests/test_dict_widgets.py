@@ -1,7 +1,9 @@
 import numpy as np
+import pytest
 from pytestqt.qtbot import QtBot
 from himena import MainWindow, StandardType
 from himena.testing import WidgetTester
+from himena.types import WidgetDataModel
 from himena_builtins.qt.stack import QExcelEdit, QDataFrameStack, QArrayStack
 
 def test_excel_widget(qtbot: QtBot, himena_ui: MainWindow):
@@ -51,6 +53,42 @@ def test_excel_widget(qtbot: QtBot, himena_ui: MainWindow):
     excel_edit.setCurrentIndex(0)
     tabbar._make_drag()
 
+def test_excel_widget_lazy_sheets(qtbot: QtBot, himena_ui: MainWindow):
+    from himena.utils.collections import LazyDict
+
+    loaded = []
+
+    def _load(key: str):
+        loaded.append(key)
+        return np.array([[key, "1"]], dtype=np.dtypes.StringDType())
+
+    excel_edit = QExcelEdit(himena_ui)
+    qtbot.addWidget(excel_edit)
+    value = LazyDict(["a", "b", "c"], _load)
+    excel_edit.update_model(WidgetDataModel(value=value, type=StandardType.EXCEL))
+    assert excel_edit.count() == 3
+    assert loaded == ["a"]
+    excel_edit.setCurrentIndex(2)
+    assert loaded == ["a", "c"]
+    model = excel_edit.to_model()
+    assert loaded == ["a", "c", "b"]
+    assert model.value["b"].tolist() == [["b", "1"]]
+
+    # a sheet that failed to load is loaded again, not saved as an empty table
+    fail = {"b"}
+
+    def _load_or_fail(key: str):
+        if key in fail:
+            raise OSError(key)
+        return _load(key)
+
+    value = LazyDict(["a", "b"], _load_or_fail)
+    excel_edit.update_model(WidgetDataModel(value=value, type=StandardType.EXCEL))
+    with pytest.raises(OSError):
+        excel_edit.to_model()
+    fail.clear()
+    assert excel_edit.to_model().value["b"].tolist() == [["b", "1"]]
+
 def test_dataframe_dict(himena_ui: MainWindow, qtbot: QtBot):
     widget = QDataFrameStack(himena_ui)
     with WidgetTester(widget) as tester:
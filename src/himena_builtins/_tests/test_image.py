@@ -18,7 +18,7 @@ from himena.testing import WidgetTester, image, file_dialog_response, choose_one
 from himena.types import WidgetDataModel
 from himena.widgets import SubWindow
 from himena.qt import MainWindowQt
-from himena_builtins.qt.widgets.image import QImageView, QImageLabelView
+from himena_builtins.qt.widgets.image import ImageTuple, QImageView, QImageLabelView
 from himena_builtins.qt.widgets._image_components import _roi_items as _rois
 from himena_builtins.qt.widgets._image_components._control import ComplexMode, QAutoContrastMenu
 from himena_builtins.tools.image import _make_roi_limits_getter, _bbox_list_getter
@@ -947,6 +947,38 @@ def test_split_channels_with_roi(make_himena_ui: Callable[..., MainWindow]):
     assert ui.tabs[0][2].to_model().metadata.unwrap_rois().items[0].start == (2, 1)
     assert len(ui.tabs[0][3].to_model().metadata.unwrap_rois().items) == 0
 
+def test_measure_rois(himena_ui: MainWindow):
+    from himena.utils.image_utils import measure_rois
+    from himena.data_wrappers import wrap_array
+
+    arr = np.random.default_rng(0).normal(size=(3, 2, 20, 20))
+    rois = RoiListModel(
+        items=[
+            RectangleRoi(x=2, y=3, width=5, height=4),
+            LineRoi(start=(1, 1), end=(10, 12)),
+            PointsRoi2D(xs=[2, 15, 8], ys=[1, 3, 19]),
+        ],
+        indices=np.array([[-1, -1], [1, 0], [2, -1]], dtype=np.int32),
+        axis_names=["t", "z"],
+    )
+    out = measure_rois(wrap_array(arr), rois, ["area", "mean", "std", "sum", "min", "max"])
+    # ROI-0 in 6 slices, ROI-1 in 1 slice and ROI-2 in 2 slices
+    assert len(out["roi"]) == 9
+    for t, z, i, area, mean, std, sum_, min_, max_ in zip(*out.values()):
+        values = arr[t, z][rois[i].to_mask((20, 20))]
+        assert area == values.size
+        assert mean == pytest.approx(values.mean())
+        assert std == pytest.approx(values.std())
+        assert sum_ == pytest.approx(values.sum())
+        assert min_ == values.min()
+        assert max_ == values.max()
+
+    himena_ui.add_data_model(create_image_model(arr, axes=["t", "z", "y", "x"], rois=rois))
+    himena_ui.exec_action("builtins:image:measure-rois", with_params={"metrics": ["mean"]})
+    model = himena_ui.current_model
+    assert model.type == StandardType.DATAFRAME
+    assert list(model.value.keys()) == ["t", "z", "roi", "mean"]
+
 def test_scale_bar(himena_ui: MainWindow):
     win = himena_ui.add_data_model(
         create_image_model(
@@ -1216,3 +1248,186 @@ def test_many_dtypes(himena_ui: MainWindow):
         np.float32, np.float64, np.complex64, np.complex128
     ]:
         himena_ui.add_object(np.arange(96).reshape(8, 12).astype(dtype), type=StandardType.IMAGE)
+
+def test_tiled_rendering(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch):
+    from himena_builtins.qt.widgets._image_components import _tiles
+
+    monkeypatch.setattr(_tiles, "TILED_RENDERING_MIN_SIZE", 1000 * 1000)
+    image_view = QImageView()
+    image_view.show()
+    qtbot.addWidget(image_view)
+    with WidgetTester(image_view) as tester:
+        tester.update_model(value=np.arange(1200 * 1300, dtype=np.uint16).reshape(1200, 1300))
+        graphics = image_view._img_view._image_widgets[0]
+        tiled = graphics._tiled
+        assert tiled is not None
+        assert graphics.image_shape() == (1200, 1300)
+        assert tiled.pyramid.nlevels == 2
+        image_view._img_view.auto_range()
+        QApplication.processEvents()
+        image_view._img_view.grab()
+        assert len(tiled._tiles) > 0
+        qimg = graphics.qimage_for_rect(QtCore.QRect(10, 20, 30, 40))
+        assert (qimg.width(), qimg.height()) == (30, 40)
+        # changing the contrast limits reuses the pyramid and only drops the tiles
+        img = image_view._current_image_slices[0].arr
+        assert image_view._image_for_display(img, image_view.current_channel()) is tiled
+        assert len(tiled._tiles) == 0
+        image_view._img_view.select_image()
+        tester.update_model(value=np.zeros((10, 10), dtype=np.uint16))
+        assert image_view._img_view._image_widgets[0]._tiled is None
+
+def test_tiled_image_levels():
+    from himena_builtins.qt.widgets._image_components import ImagePyramid, TiledImage
+
+    arr = np.arange(2048 * 1100).reshape(2048, 1100)
+    pyramid = ImagePyramid.from_array(arr)
+    assert pyramid.nlevels == 2
+    assert pyramid.level_for_scale(2.0) == 0
+    assert pyramid.level_for_scale(0.4) == 1
+    assert pyramid.level_for_scale(0.01) == 1
+    tiled = TiledImage(pyramid, lambda x: (x % 256).astype(np.uint8))
+    rects = [rect for rect, _ in tiled.iter_tiles(0, (0, 0, 1100, 2048))]
+    assert len(rects) == 3 * 4
+    assert rects[-1] == (1024, 1536, 76, 512)
+    rects = [rect for rect, _ in tiled.iter_tiles(1, (0, 0, 1100, 2048))]
+    assert len(rects) == 2 * 2
+
+def test_slice_cache():
+    from himena_builtins.qt.widgets._image_components._slice_cache import SliceCache
+
+    cache = SliceCache(max_bytes=250)
+    calls = []
+
+    def _compute(i):
+        def _func():
+            calls.append(i)
+            return np.full(10, i, dtype=np.uint8)
+        return _func
+
+    for i in range(30):
+        assert cache.get_or_compute(i, _compute(i))[0] == i
+    assert len(calls) == 30
+    assert cache.nbytes <= 250
+    assert 29 in cache and 0 not in cache
+    cache.get_or_compute(29, _compute(29))
+    assert len(calls) == 30
+    cache.set_max_bytes(0)
+    assert len(cache) == 0
+    cache.clear()
+    assert cache.nbytes == 0
+
+def test_slice_prefetch(qtbot: QtBot):
+    import dask.array as da
+
+    image_view = QImageView()
+    qtbot.addWidget(image_view)
+    arr = da.from_array(np.arange(20 * 10 * 10, dtype=np.uint16).reshape(20, 10, 10), chunks=(1, 10, 10))
+    with WidgetTester(image_view) as tester:
+        tester.update_model(value=arr)
+        assert image_view._is_slice_cache_enabled()
+        image_view._dims_slider.setValue((1,))
+        image_view._dims_slider.setValue((2,))
+        for future in image_view._prefetch_futures:
+            future.result()
+        for i in range(3, 7):
+            assert (i,) in image_view._slice_cache
+        assert_equal(image_view._get_image_slice_for_channel((5,)), arr[5].compute())
+        tester.update_model(value=np.zeros((3, 10, 10), dtype=np.uint16))
+        assert not image_view._is_slice_cache_enabled()
+        assert len(image_view._slice_cache) == 0
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.int8, np.int16])
+def test_lut_colormapping(dtype):
+    from cmap import Colormap
+    from himena_builtins.qt.widgets.image import ChannelInfo
+
+    rng = np.random.default_rng(0)
+    info = np.iinfo(dtype)
+    arr = rng.integers(info.min, info.max, size=(20, 30), endpoint=True).astype(dtype)
+    channel = ChannelInfo(name="", clim=(info.min / 2, info.max / 2), colormap=Colormap("viridis"))
+    out = channel.transform_image_2d(arr, np.abs)
+    cmin, cmax = channel.clim
+    expected = channel.colormap((arr - cmin) / (cmax - cmin), bytes=True).astype(np.uint8)
+    assert out.shape == (20, 30, 4)
+    assert out.dtype == np.uint8
+    assert_equal(out, expected)
+    lut = channel._lut_cache[1]
+    channel.transform_image_2d(arr, np.abs)
+    assert channel._lut_cache[1] is lut
+    channel.clim = (0, 10)
+    channel.transform_image_2d(arr, np.abs)
+    assert channel._lut_cache[1] is not lut
+    assert channel.as_gray() is channel.as_gray()
+    assert channel.as_gray().clim == (0, 10)
+
+@pytest.mark.parametrize("dtype", ["uint8", "int8", "uint16", "int16"])
+def test_integer_histogram(dtype):
+    from himena_builtins.qt.widgets._image_components._histogram import compute_histogram
+
+    rng = np.random.default_rng(0)
+    info = np.iinfo(dtype)
+    arr = rng.integers(info.min // 2, info.max // 2, size=(40, 30)).astype(dtype)
+    result = compute_histogram(arr)
+    _min, _max = arr.min(), arr.max()
+    assert result.minmax == (_min, _max)
+    _nbin = 64 if arr.itemsize == 1 else 256
+    _nbin = int(_max - _min) // max(int(np.ceil((_max - _min) / _nbin)), 1)
+    normed = ((arr - _min) / (_max - _min) * (_nbin - 1)).astype(np.uint8)
+    assert_equal(result.hist, np.bincount(normed.ravel(), minlength=_nbin))
+    assert result.hist.sum() == arr.size
+
+def test_histogram_sampling_and_cache(qtbot: QtBot):
+    from himena_builtins.qt.widgets._image_components._histogram import compute_histogram
+
+    arr = np.random.default_rng(0).normal(size=(500, 400)).astype(np.float32)
+    result = compute_histogram(arr, max_pixels=10000)
+    assert result.hist.sum() <= 10000 * 1.1
+    image_view = QImageView()
+    qtbot.addWidget(image_view)
+    image_view.update_model(WidgetDataModel(value=arr[np.newaxis], type="array.image"))
+    hist_view = image_view._control._histogram
+    image_view._dims_slider.setValue((0,))
+    hist_view._wait_histogram()
+    key = next(iter(hist_view._hist_cache))
+    assert key[1] == (0,)
+    # slices read for other indices are cached with the requested indices
+    image_view._set_image_slices([ImageTuple(arr * 3, indices=(1,))])
+    hist_view._wait_histogram()
+    assert image_view._dims_slider.value() == (0,)
+    assert next(reversed(hist_view._hist_cache))[1] == (1,)
+    assert hist_view._hist_items[0]._hist_values.sum() > 0
+    image_view.update_model(WidgetDataModel(value=arr[np.newaxis] * 2, type="array.image"))
+    assert key not in hist_view._hist_cache or len(hist_view._hist_cache) == 1
+
+
+def test_roi_slice_index():
+    from himena_builtins.qt.widgets._image_components._roi_index import RoiSliceIndex
+
+    index = RoiSliceIndex()
+    index.rebuild(np.array([[0, 0], [0, 1], [-1, 1], [1, -1]]))
+    assert index.query((0, 1)).tolist() == [1, 2]
+    assert index.query((1, 1)).tolist() == [2, 3]
+    index.append((0, 1))
+    assert index.query((0, 1)).tolist() == [1, 2, 4]
+    index.remove(1)
+    assert index.query((0, 1)).tolist() == [1, 3]
+    index.set_row(0, (-1, -1))
+    assert index.query((1, 0)).tolist() == [0, 2]
+
+
+def test_roi_grid_index():
+    from himena_builtins.qt.widgets._image_components._roi_index import RoiGridIndex
+
+    grid = RoiGridIndex(cell_size=10)
+    grid.insert("a", QtCore.QRectF(0, 0, 5, 5))
+    grid.insert("b", QtCore.QRectF(3, 3, 30, 30))
+    grid.insert("c", QtCore.QRectF(100, 100, 5, 5))
+    assert grid.query(4, 4) == ["b", "a"]
+    assert grid.query(25, 25) == ["b"]
+    assert grid.query(102, 102) == ["c"]
+    grid.update("a", QtCore.QRectF(20, 20, 5, 5))
+    assert grid.query(22, 22) == ["b", "a"]
+    assert grid.query(-5, -5) == []
+    grid.remove("b")
+    assert grid.query(22, 22) == ["a"]
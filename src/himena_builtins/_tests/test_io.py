@@ -100,3 +100,69 @@ def test_roi_reader(tmpdir):
     )
     write(WidgetDataModel(value=roi_list, type=StandardType.ROIS), file_path)
     read(file_path)
+
+def test_read_table_by_chunks(tmpdir, monkeypatch):
+    from himena_builtins import _io
+
+    monkeypatch.setattr(_io, "_TABLE_CHUNK_ROWS", 3)
+    monkeypatch.setattr(_io, "_TABLE_SAMPLE_BYTES", 16)
+    file_path = Path(tmpdir, "test.csv")
+    lines = ["a,b"] * 4 + ['"x,y",2,3', "", "c"] + ["é,1"]
+    file_path.write_bytes("\n".join(lines).encode("latin-1"))
+    model = read(file_path)
+    assert model.type == StandardType.TABLE
+    # ragged files keep blank lines as empty rows
+    assert model.value.shape == (8, 3)
+    assert model.value[4].tolist() == ["x,y", "2", "3"]
+    assert model.value[5].tolist() == ["", "", ""]
+    assert model.value[6].tolist() == ["c", "", ""]
+    assert model.value[0].tolist() == ["a", "b", ""]
+
+    # uniform files skip comments and blank lines, same as np.loadtxt
+    lines = ["# comment", "a,b", "", "1,2 # note", "3,4"] * 2
+    file_path.write_text("\n".join(lines))
+    model = read(file_path)
+    assert model.value.shape == (6, 2)
+    assert model.value[:3].tolist() == [["a", "b"], ["1", "2 "], ["3", "4"]]
+
+    # "#" in quoted fields is not a comment
+    file_path.write_text('name,val\n"Item #3",5\n"Other",6\n"Last",7 # note')
+    model = read(file_path)
+    assert model.value.tolist() == [
+        ["name", "val"], ["Item #3", "5"], ["Other", "6"], ["Last", "7 "]
+    ]
+
+    # quoted fields over lines are parsed as a plain CSV
+    file_path.write_text('a,b\n"x\n#y",1\n')
+    model = read(file_path)
+    assert model.value.tolist() == [["a", "b"], ["x\n#y", "1"]]
+
+def test_excel_sheets_read_after_file_removed(sample_dir: Path, tmpdir):
+    import shutil
+
+    file_path = Path(tmpdir, "excel.xlsx")
+    shutil.copy(sample_dir / "excel.xlsx", file_path)
+    model = read(file_path)
+    file_path.unlink()
+    for sheet in model.value:
+        assert model.value[sheet].ndim == 2
+
+def test_zip_reader_is_lazy(tmpdir):
+    import zipfile
+    from himena._utils import unwrap_lazy_model
+
+    file_path = Path(tmpdir, "test.zip")
+    with zipfile.ZipFile(file_path, "w") as z:
+        z.writestr("b.txt", "text")
+        z.writestr("sub/a.csv", "a,b\n1,2\n")
+    model = read(file_path)
+    assert model.type == StandardType.MODELS
+    assert [m.title for m in model.value] == ["sub", "b.txt"]
+    assert model.value[0].type == StandardType.MODELS
+    assert model.value[1].type == StandardType.LAZY
+    text = unwrap_lazy_model(model.value[1])
+    assert text.type == StandardType.TEXT
+    assert text.value == "text"
+    table = unwrap_lazy_model(model.value[0].value[0])
+    assert table.type == StandardType.TABLE
+    assert table.title == "a.csv"
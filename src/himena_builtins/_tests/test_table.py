@@ -320,6 +320,24 @@ def test_copy_on_write(himena_ui: MainWindow, qtbot: QtBot):
         assert_equal(ss.to_model().value, [["", ""], ["c", "d"]])
         assert_equal(ss_other.to_model().value, [["a", ""], ["c", "d"]])
 
+def test_typed_columns_discarded_on_edit(himena_ui: MainWindow, qtbot: QtBot):
+    from himena.utils.table_selection import model_to_xy_arrays
+
+    ss = QSpreadsheet(himena_ui)
+    qtbot.addWidget(ss)
+    array_orig = np.array([["x"], ["1"], ["2"]], dtype=np.dtypes.StringDType())
+    ss.update_model(WidgetDataModel(value=array_orig, type=StandardType.TABLE))
+    model = ss.to_model()
+    _, ys = model_to_xy_arrays(model, None, ((0, 3), (0, 1)))
+    assert_equal(ys[0].array, [1, 2])
+    ss.edit_cell(1, 0, "5")
+    model_new = ss.to_model()
+    assert model_new.metadata._typed_columns is not model.metadata._typed_columns
+    _, ys = model_to_xy_arrays(model_new, None, ((0, 3), (0, 1)))
+    assert_equal(ys[0].array, [5, 2])
+    _, ys = model_to_xy_arrays(model, None, ((0, 3), (0, 1)))
+    assert_equal(ys[0].array, [1, 2])
+
 def test_header_view(himena_ui: MainWindow, qtbot: QtBot):
     from himena_builtins.qt.widgets._table_components._header import (
         QHorizontalHeaderView,
@@ -433,3 +451,24 @@ def test_ctrl_move(himena_ui: MainWindow, qtbot: QtBot):
         assert tester.widget.selection_model.current_index == (3, 0)
         qtbot.keyClick(tester.widget, Qt.Key.Key_Up, modifier=_Ctrl)
         assert tester.widget.selection_model.current_index == (0, 0)
+
+def test_table_filter(himena_ui: MainWindow, qtbot: QtBot):
+    ss = QSpreadsheet(himena_ui)
+    qtbot.addWidget(ss)
+    ss.update_model(create_table_model(value=[["b", "x"], ["a", "y"], ["c", "x"]]))
+    ss.set_row_filter(1, lambda col: col == "x")
+    model = ss.model()
+    assert model.data(model.index(0, 0)) == "b"
+    assert model.data(model.index(1, 0)) == "c"
+    assert model.data(model.index(2, 0)) is None
+    ss.selection_model.set_ranges([(slice(0, 1), slice(0, 1))])
+    ss._sort_table_by_column()
+    ss._sort_table_by_column()
+    assert model.data(model.index(0, 0)) == "c"
+    ss.edit_cell(0, 1, "y")  # "c" is filtered out
+    assert model.data(model.index(0, 0)) == "b"
+    assert model.data(model.index(1, 0)) is None
+    assert_equal(ss.to_model().value[:, 1], ["x", "y", "y"])
+    ss.set_row_filter(1, None)
+    assert model.data(model.index(0, 0)) == "c"
+    assert model.data(model.index(2, 0)) == "a"
@@ -308,7 +308,7 @@ def _(file_path: Path) -> str | None:
     return None
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_text(model: WidgetDataModel, path: Path):
     return _io.default_text_writer(model, path)
 
@@ -318,7 +318,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.TEXT) and isinstance(model.value, str)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_table(model: WidgetDataModel, path: Path):
     return _io.default_table_writer(model, path)
 
@@ -328,7 +328,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.TABLE)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_image(model: WidgetDataModel, path: Path):
     return _io.default_image_writer(model, path)
 
@@ -338,7 +338,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.IMAGE)
 
 
-@register_writer_plugin(priority=10)
+@register_writer_plugin(priority=10, thread_safe=True)
 def write_dict(model: WidgetDataModel, path: Path):
     return _io.default_dict_writer(model, path)
 
@@ -348,7 +348,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.DICT)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_excel(model: WidgetDataModel, path: Path):
     return _io.default_excel_writer(model, path)
 
@@ -358,7 +358,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.EXCEL)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_array(model: WidgetDataModel, path: Path):
     return _io.default_array_writer(model, path)
 
@@ -368,7 +368,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.ARRAY)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_plot(model: WidgetDataModel, path: Path):
     return _io.default_plot_writer(model, path)
 
@@ -378,7 +378,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.PLOT)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_roi(model: WidgetDataModel, path: Path):
     return _io.default_roi_writer(model, path)
 
@@ -388,7 +388,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.ROIS)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_dataframe(model: WidgetDataModel, path: Path):
     return _io.default_dataframe_writer(model, path)
 
@@ -408,7 +408,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.MODELS)
 
 
-@register_writer_plugin(priority=50)
+@register_writer_plugin(priority=50, thread_safe=True)
 def write_workflow(model: WidgetDataModel, path: Path):
     return _io.default_workflow_writer(model, path)
 
@@ -418,7 +418,7 @@ def _(model: WidgetDataModel, path: Path) -> bool:
     return model.is_subtype_of(StandardType.WORKFLOW)
 
 
-@register_writer_plugin(priority=-50)
+@register_writer_plugin(priority=-50, thread_safe=True)
 def write_pickle_anyway(model: WidgetDataModel, path: Path):
     return _io.default_pickle_writer(model, path)
 
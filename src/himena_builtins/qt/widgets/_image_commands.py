@@ -211,7 +211,7 @@ class ImageViewCapture:
         for graphics in view._img_view._image_widgets:
             if graphics.isVisible():
                 graphics.initPainter(painter)
-                painter.drawImage(target_rect, graphics._qimage.copy(source_rect))
+                painter.drawImage(target_rect, graphics.qimage_for_rect(source_rect))
 
         # draw scale bars
         painter.setPen(QtCore.Qt.PenStyle.NoPen)
@@ -4,6 +4,7 @@ from ._roi_collection import QSimpleRoiCollection, QRoiCollection, from_standard
 from .._dim_sliders import QDimsSlider
 from ._roi_buttons import QRoiButtons
 from ._histogram import QHistogramView
+from ._tiles import ImagePyramid, TiledImage
 from ._control import (
     QImageViewControl,
     QImageLabelViewControl,
@@ -21,6 +22,8 @@ __all__ = [
     "QDimsSlider",
     "QRoiButtons",
     "QHistogramView",
+    "ImagePyramid",
+    "TiledImage",
     "QImageViewControl",
     "QImageLabelViewControl",
     "QImageViewControlBase",
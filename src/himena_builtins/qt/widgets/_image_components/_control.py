@@ -280,10 +280,9 @@ class QImageViewControl(QImageViewControlBase):
         with QtCore.QSignalBlocker(self._histogram):
             _grays = (RGBMode.GRAY, ChannelMode.GRAY)
             if imtup.visible:
-                arr = ch.transform_image(
-                    view._current_image_slices[idx].arr,
-                    complex_transform=self.complex_transform,
-                    is_rgb=view._is_rgb,
+                arr = view._image_for_display(
+                    imtup.arr,
+                    ch,
                     is_gray=self._chn_mode_combo.currentText() in _grays,
                 )
             else:
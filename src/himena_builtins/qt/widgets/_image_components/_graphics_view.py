@@ -20,6 +20,8 @@ from ._roi_items import (
 )
 from ._handles import QHandleRect, RoiSelectionHandles
 from ._scale_bar import QScaleBarItem
+from ._tiles import TiledImage
+from ._roi_index import RoiGridIndex
 from himena_builtins.qt.widgets._image_components import _mouse_events as _me
 from himena.qt import ndarray_to_qimage
 from himena.widgets import show_tooltip, get_clipboard, set_clipboard, current_instance
@@ -32,16 +34,46 @@ class QImageGraphicsWidget(QtW.QGraphicsWidget):
         super().__init__(parent)
         self._img: np.ndarray = np.zeros((0, 0))
         self._qimage = QtGui.QImage()
+        self._tiled: TiledImage | None = None
         self._smoothing = False
         self.set_additive(additive)
+        # needed to get the exposed rect in the paint method
+        self.setFlag(
+            QtW.QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True
+        )
 
     def set_image(self, img: np.ndarray):
         """Set a (colored) image to display."""
         qimg = ndarray_to_qimage(img)
         self._img = img
         self._qimage = qimg
+        self._tiled = None
+        self.update()
+
+    def set_tiled_image(self, tiled: TiledImage):
+        """Set a tiled image that is rendered only in the visible region."""
+        self._img = np.zeros((0, 0))
+        self._qimage = QtGui.QImage()
+        if tiled is not self._tiled:
+            self._tiled = tiled
+            self.prepareGeometryChange()
         self.update()
 
+    def image_shape(self) -> tuple[int, int]:
+        """Return the (height, width) of the image."""
+        if self._tiled is not None:
+            return self._tiled.shape
+        return self._img.shape[:2]
+
+    def qimage_for_rect(self, rect: QtCore.QRect) -> QtGui.QImage:
+        """Return the full-resolution QImage of the region."""
+        if self._tiled is None:
+            return self._qimage.copy(rect)
+        arr = self._tiled.render_region(
+            rect.left(), rect.top(), rect.width(), rect.height()
+        )
+        return ndarray_to_qimage(arr).copy()
+
     def set_additive(self, additive: bool):
         if additive:
             self._comp_mode = QtGui.QPainter.CompositionMode.CompositionMode_Plus
@@ -59,12 +91,15 @@ class QImageGraphicsWidget(QtW.QGraphicsWidget):
         )
 
     def paint(self, painter, option, widget=None):
-        if self._qimage.isNull():
+        if self._tiled is not None:
+            self.initPainter(painter)
+            self._paint_tiles(painter, option.exposedRect)
+        elif self._qimage.isNull():
             return
-
-        self.initPainter(painter)
+        else:
+            self.initPainter(painter)
+            painter.drawImage(self.boundingRect(), self._qimage)
         bounding_rect = self.boundingRect()
-        painter.drawImage(bounding_rect, self._qimage)
         is_light_bg = (
             self.scene().views()[0].backgroundBrush().color().lightness() > 128
         )
@@ -76,8 +111,17 @@ class QImageGraphicsWidget(QtW.QGraphicsWidget):
         painter.setPen(pen)
         painter.drawRect(bounding_rect)
 
+    def _paint_tiles(self, painter: QtGui.QPainter, exposed: QtCore.QRectF):
+        tiled = self._tiled
+        tr = painter.worldTransform()
+        scale = math.hypot(tr.m11(), tr.m12())
+        ilevel = tiled.pyramid.level_for_scale(scale)
+        rect = (exposed.left(), exposed.top(), exposed.width(), exposed.height())
+        for (x, y, w, h), qimage in tiled.iter_tiles(ilevel, rect):
+            painter.drawImage(QtCore.QRectF(x, y, w, h), qimage)
+
     def boundingRect(self):
-        height, width = self._img.shape[:2]
+        height, width = self.image_shape()
         return QtCore.QRectF(0, 0, width, height)
 
 
@@ -147,6 +191,8 @@ class QImageGraphicsView(QBaseGraphicsView):
         super().__init__()
         ### Attributes ###
         self._roi_items: list[QRoi] = []
+        # spatial index of `_roi_items` for picking
+        self._roi_grid = RoiGridIndex[QRoi]()
         self._current_roi_item: QRoi | None = None
         self._is_current_roi_item_not_registered = False
         self._roi_pen = roi_pen or QtGui.QPen(QtGui.QColor(225, 225, 0), 3)
@@ -199,14 +245,17 @@ class QImageGraphicsView(QBaseGraphicsView):
         self._qroi_labels._show_labels = show
         self._qroi_labels.update()
 
-    def set_array(self, idx: int, img: np.ndarray | None):
-        """Set an image to display."""
-        # NOTE: image must be ready for conversion to QImage (uint8, mono or RGB)
+    def set_array(self, idx: int, img: np.ndarray | TiledImage | None):
+        """Set an image to display.
+
+        The image is either an array ready for conversion to QImage (uint8, mono or
+        RGB), or a `TiledImage` that is transformed tile by tile when painted.
+        """
         self.array_updated.emit(idx, img)
 
     def select_image(self):
         """Add a selection ROI to the entire image."""
-        ny, nx = self._image_widgets[0]._img.shape[:2]
+        ny, nx = self._image_widgets[0].image_shape()
         self.remove_current_item(reason="Ctrl+A")
         self.set_current_roi(QRectangleRoi(0, 0, nx, ny).withPen(self._roi_pen))
         self._selection_handles.connect_rect(self._current_roi_item)
@@ -220,12 +269,15 @@ class QImageGraphicsView(QBaseGraphicsView):
             if not isinstance(item, QHandleRect):
                 yield item
 
-    def _on_array_updated(self, idx: int, img: np.ndarray | None):
+    def _on_array_updated(self, idx: int, img: np.ndarray | TiledImage | None):
         if idx >= len(self._image_widgets):
             return  # this happens when the number of channels decreased
         widget = self._image_widgets[idx]
         if img is None:
             widget.setVisible(False)
+        elif isinstance(img, TiledImage):
+            widget.set_tiled_image(img)
+            widget.setVisible(True)
         else:
             widget.set_image(img)
             widget.setVisible(True)
@@ -252,14 +304,16 @@ class QImageGraphicsView(QBaseGraphicsView):
         for item in self._roi_items:
             scene.removeItem(item)
         self._roi_items.clear()
+        self._roi_grid.clear()
         if not self._is_current_roi_item_not_registered:
             self.remove_current_item(reason="clear all ROIs")
 
     def remove_rois(self, rois: Iterable[QRoi]):
         """Remove Qt ROIs from the view."""
         for roi in rois:
-            if roi in self._roi_items:
+            if roi in self._roi_grid:
                 self._roi_items.remove(roi)
+                self._roi_grid.remove(roi)
                 self.scene().removeItem(roi)
 
     def extend_qrois(self, rois: Iterable[QRoi], current_roi: QRoi | None = None):
@@ -268,6 +322,7 @@ class QImageGraphicsView(QBaseGraphicsView):
             self.scene().addItem(roi)
             roi.setVisible(self._is_rois_visible)
             self._roi_items.append(roi)
+            self._roi_grid.insert(roi, roi.boundingRect())
             if roi is current_roi:
                 self.select_item(
                     roi, is_registered_roi=not self._is_current_roi_item_not_registered
@@ -388,8 +443,7 @@ class QImageGraphicsView(QBaseGraphicsView):
     def scale_and_update_handles(self, factor: float):
         """Scale the view and update the selection handle sizes."""
         if len(self._image_widgets) > 0:
-            image_size = self._image_widgets[0]._qimage.size()
-            length = min(image_size.width(), image_size.height())
+            length = min(self._image_widgets[0].image_shape())
             new_scale = self.transform().m11() * factor
             if length * new_scale < 1 or new_scale > 1000:
                 # too small or too large, do not zoom
@@ -420,6 +474,10 @@ class QImageGraphicsView(QBaseGraphicsView):
             Only used for logging.
         """
         if self._current_roi_item is not None:
+            # the item may have been moved or edited while selected
+            self._roi_grid.update(
+                self._current_roi_item, self._current_roi_item.boundingRect()
+            )
             if not self._is_rois_visible:
                 self._current_roi_item.setVisible(False)
             if remove_from_list:
@@ -444,6 +502,7 @@ class QImageGraphicsView(QBaseGraphicsView):
         ):
             idx = self._roi_items.index(item)
             del self._roi_items[idx]
+            self._roi_grid.remove(item)
             self.roi_removed.emit(idx)
         self._qroi_labels.update()
 
@@ -481,7 +540,8 @@ class QImageGraphicsView(QBaseGraphicsView):
             item_clicked = self._current_roi_item
             is_registered = not self._is_current_roi_item_not_registered
         elif self._is_rois_visible:
-            for item in reversed(self._roi_items):
+            # only the items around the position are tested
+            for item in self._roi_grid.query(pos.x(), pos.y()):
                 if item.contains(pos):
                     item_clicked = item
                     is_registered = True
@@ -598,6 +658,7 @@ class QImageGraphicsView(QBaseGraphicsView):
             _LOGGER.info(f"Added ROI item {item}")
             self._selection_handles.finish_drawing_polygon()
             self._roi_items.append(item)
+            self._roi_grid.insert(item, item.boundingRect())
             self._qroi_labels.update()
             self.roi_added.emit(item)
 
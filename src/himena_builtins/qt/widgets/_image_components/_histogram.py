@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import math
+from typing import TYPE_CHECKING, Hashable, Literal, NamedTuple
 import numpy as np
 from psygnal import Signal
 from qtpy import QtCore, QtGui, QtWidgets as QtW
 from functools import reduce
+from superqt import ensure_main_thread
 from himena.consts import DefaultFontFamily
 from ._base import QBaseGraphicsScene, QBaseGraphicsView
 from himena.qt._qlineedit import QDoubleLineEdit
@@ -19,6 +23,7 @@ class QHistogramView(QBaseGraphicsView):
 
     clim_changed = QtCore.Signal(tuple)
     threshold_changed = QtCore.Signal(float)
+    _executor = ThreadPoolExecutor(max_workers=1)
 
     def __init__(self, mode: Literal["clim", "thresh"] = "clim"):
         super().__init__()
@@ -46,6 +51,10 @@ class QHistogramView(QBaseGraphicsView):
         self._pos_drag_start = QtCore.QPoint()
         self._pos_drag_prev = QtCore.QPoint()
         self._default_hist_scale: Literal["linear", "log"] = "linear"
+        # computed histograms of each key and the task computing the latest one
+        self._hist_cache: OrderedDict[Hashable, list[HistogramResult]] = OrderedDict()
+        self._hist_max_pixels = DEFAULT_HIST_MAX_PIXELS
+        self._last_hist_future: Future | None = None
 
     def set_mode(self, mode: Literal["clim", "thresh"]):
         """Set the mode of the histogram view.
@@ -112,7 +121,15 @@ class QHistogramView(QBaseGraphicsView):
         is_rgb: bool = False,
         color: QtGui.QColor = QtGui.QColor(100, 100, 100),
         minmax: tuple[float, float] | None = None,
+        key: Hashable | None = None,
+        run_async: bool = False,
     ):
+        """Compute and show the histogram of the array.
+
+        If `key` is given, the histogram is cached with the key and will be reused for
+        the same key. If `run_async` is True, the histogram is computed in another
+        thread and shown when it is ready.
+        """
         # coerce the number of histogram items
         n_hist = 3 if is_rgb else 1
         for _ in range(n_hist, len(self._hist_items)):
@@ -122,27 +139,89 @@ class QHistogramView(QBaseGraphicsView):
             hist_item = QHistogramItem().with_hist_scale_func(self._default_hist_scale)
             self._hist_items.append(self.addItem(hist_item))
 
-        minmax_fallback = clim
         if is_rgb:
             brushes = [
                 QtGui.QBrush(QtGui.QColor(255, 0, 0, 128)),
                 QtGui.QBrush(QtGui.QColor(0, 255, 0, 128)),
                 QtGui.QBrush(QtGui.QColor(0, 0, 255, 255)),
             ]  # RGB
-            for i, (item, brush) in enumerate(zip(self._hist_items, brushes)):
-                item.with_brush(brush)
-                item.set_hist_for_array(arr[..., i])
         else:
             brushes = [QtGui.QBrush(color)]
-            self._hist_items[0].with_brush(brushes[0])
-            # this fallback is needed when slider is changed.
-            minmax_fallback = self._hist_items[0].set_hist_for_array(arr)
+        for item, brush in zip(self._hist_items, brushes):
+            item.with_brush(brush)
+
+        if self._last_hist_future is not None:
+            self._last_hist_future.cancel()
+            self._last_hist_future = None
+        if key is not None and (results := self._hist_cache.get(key)) is not None:
+            self._hist_cache.move_to_end(key)
+        elif run_async and self._view_range is not None:
+            future = self._executor.submit(
+                _compute_histograms, arr, is_rgb, self._hist_max_pixels
+            )
+            self._last_hist_future = future
+            self._pending_hist_args = (key, arr.dtype, clim, is_rgb, minmax)
+            future.add_done_callback(self._on_hist_computed)
+            return None
+        else:
+            results = _compute_histograms(arr, is_rgb, self._hist_max_pixels)
+            self._cache_histograms(key, results)
+        self._set_histograms(results, arr.dtype, clim, is_rgb, minmax)
+        return None
+
+    def set_hist_max_pixels(self, max_pixels: int):
+        """Set the number of pixels sampled to compute floating point histograms."""
+        self._hist_max_pixels = max_pixels
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear all the cached histograms."""
+        self._hist_cache.clear()
+
+    def _wait_histogram(self):
+        """Block until the histogram being computed is shown."""
+        if (future := self._last_hist_future) is not None:
+            self._apply_hist_future(future)
+
+    @ensure_main_thread
+    def _on_hist_computed(self, future: Future[list[HistogramResult]]):
+        if future is self._last_hist_future and not future.cancelled():
+            self._apply_hist_future(future)
+        # otherwise, a newer histogram is requested
+
+    def _apply_hist_future(self, future: Future[list[HistogramResult]]):
+        self._last_hist_future = None
+        if future.exception() is not None:
+            return
+        results = future.result()
+        key, dtype, clim, is_rgb, minmax = self._pending_hist_args
+        self._cache_histograms(key, results)
+        self._set_histograms(results, dtype, clim, is_rgb, minmax)
+
+    def _cache_histograms(self, key: Hashable | None, results: list[HistogramResult]):
+        if key is None:
+            return
+        self._hist_cache[key] = results
+        while len(self._hist_cache) > _HIST_CACHE_SIZE:
+            self._hist_cache.popitem(last=False)
 
+    def _set_histograms(
+        self,
+        results: list[HistogramResult],
+        dtype: np.dtype,
+        clim: tuple[float, float],
+        is_rgb: bool,
+        minmax: tuple[float, float] | None,
+    ):
+        for item, result in zip(self._hist_items, results):
+            item.set_histogram(result)
+        # this fallback is needed when slider is changed.
+        minmax_fallback = clim if is_rgb else results[0].minmax
         if minmax is not None:
             self.set_minmax(minmax)
-        elif arr.dtype.kind in "ui":
-            self.set_minmax((np.iinfo(arr.dtype).min, np.iinfo(arr.dtype).max))
-        elif arr.dtype.kind == "b":
+        elif dtype.kind in "ui":
+            self.set_minmax((np.iinfo(dtype).min, np.iinfo(dtype).max))
+        elif dtype.kind == "b":
             self.set_minmax((0, 1))
         else:
             self.set_minmax(minmax_fallback)
@@ -179,6 +258,7 @@ class QHistogramView(QBaseGraphicsView):
         self, qmin: float, qmax: float
     ) -> tuple[float, float] | None:
         """Calculate contrast limits based on the given quantiles."""
+        self._wait_histogram()
         min_new, max_new = float("inf"), -float("inf")
         for item in self._hist_items:
             cum_value = np.cumsum(item._hist_values)
@@ -529,33 +609,14 @@ class QHistogramItem(QtW.QGraphicsPathItem):
         return self
 
     def set_hist_for_array(self, arr: NDArray[np.number]) -> tuple[float, float]:
-        _min, _max = quick_min_max(arr)
-        if arr.dtype in ("int8", "uint8"):
-            _nbin = 64
-        else:
-            _nbin = 256
-        # nbin should not be more than half of the number of pixels
-        _nbin = min(_nbin, int(arr.size) // 2)
-        # draw histogram
-        if arr.dtype.kind == "b":
-            edges = np.array([0, 0.5, 1])
-            frac_true = np.sum(arr) / arr.size
-            hist = np.array([1 - frac_true, frac_true])
-        elif _max > _min:
-            arr = arr.clip(_min, _max)
-            if arr.dtype.kind in "ui":
-                _nbin = int(_max - _min) // max(int(np.ceil((_max - _min) / _nbin)), 1)
-            normed = ((arr - _min) / (_max - _min) * (_nbin - 1)).astype(np.uint8)
-            hist = np.bincount(normed.ravel(), minlength=_nbin)
-            edges = np.linspace(_min, _max, _nbin + 1)
-        else:
-            edges = np.array([_min, _max])
-            hist = np.zeros(1)
-        self._edges = edges
-        self._hist_values = hist
+        result = compute_histogram(arr)
+        self.set_histogram(result)
+        return result.minmax
 
+    def set_histogram(self, result: HistogramResult):
+        self._edges = result.edges
+        self._hist_values = result.hist
         self._update_histogram_path()
-        return _min, _max
 
     def _update_histogram_path(self):
         _path = QtGui.QPainterPath()
@@ -572,6 +633,96 @@ class QHistogramItem(QtW.QGraphicsPathItem):
         self.update()
 
 
+class HistogramResult(NamedTuple):
+    """Histogram of an array."""
+
+    edges: NDArray[np.number]
+    hist: NDArray[np.number]
+    minmax: tuple[float, float]
+
+
+DEFAULT_HIST_MAX_PIXELS = 1048576
+_HIST_CACHE_SIZE = 128
+
+
+def compute_histogram(
+    arr: NDArray[np.number],
+    max_pixels: int = DEFAULT_HIST_MAX_PIXELS,
+) -> HistogramResult:
+    """Compute the histogram of an array.
+
+    8/16-bit integer arrays are exactly counted. Other arrays are down-sampled to
+    about `max_pixels` pixels.
+    """
+    if arr.dtype.kind in "ui" and arr.dtype.itemsize <= 2:
+        return _compute_int_histogram(arr)
+    if arr.size > max_pixels:
+        step = int(math.ceil(math.sqrt(arr.size / max_pixels)))
+        arr = arr[(slice(None, None, step),) * min(arr.ndim, 2)]
+    _min, _max = quick_min_max(arr)
+    _nbin = _num_bins(arr.dtype, arr.size)
+    if arr.dtype.kind == "b":
+        edges = np.array([0, 0.5, 1])
+        frac_true = np.sum(arr) / arr.size
+        hist = np.array([1 - frac_true, frac_true])
+    elif _max > _min:
+        arr = arr.clip(_min, _max)
+        if arr.dtype.kind in "ui":
+            _nbin = int(_max - _min) // max(int(np.ceil((_max - _min) / _nbin)), 1)
+        normed = ((arr - _min) / (_max - _min) * (_nbin - 1)).astype(np.uint8)
+        hist = np.bincount(normed.ravel(), minlength=_nbin)
+        edges = np.linspace(_min, _max, _nbin + 1)
+    else:
+        edges = np.array([_min, _max])
+        hist = np.zeros(1)
+    return HistogramResult(edges, hist, (_min, _max))
+
+
+def _compute_int_histogram(arr: NDArray[np.integer]) -> HistogramResult:
+    # count each value (offset by the dtype minimum) and merge the counts into bins
+    nbits = arr.dtype.itemsize * 8
+    offset = int(np.iinfo(arr.dtype).min)
+    arr_offset = arr.view(f"u{arr.dtype.itemsize}")
+    if offset != 0:
+        arr_offset = arr_offset ^ (1 << (nbits - 1))
+    counts = np.bincount(arr_offset.ravel(), minlength=2**nbits)
+    nonzero = np.flatnonzero(counts)
+    if nonzero.size == 0:
+        return HistogramResult(np.array([0.0, 1.0]), np.zeros(1), (0.0, 1.0))
+    lo, hi = int(nonzero[0]), int(nonzero[-1])
+    _min, _max = float(lo + offset), float(hi + offset)
+    if hi > lo:
+        _nbin = _num_bins(arr.dtype, arr.size)
+        _nbin = int(_max - _min) // max(int(np.ceil((_max - _min) / _nbin)), 1)
+        values = np.arange(lo, hi + 1)
+        bin_index = ((values - lo) / (hi - lo) * (_nbin - 1)).astype(np.intp)
+        hist = np.bincount(bin_index, weights=counts[lo : hi + 1], minlength=_nbin)
+        edges = np.linspace(_min, _max, _nbin + 1)
+    else:
+        edges = np.array([_min, _max])
+        hist = np.zeros(1)
+    return HistogramResult(edges, hist.astype(np.int64), (_min, _max))
+
+
+def _num_bins(dtype: np.dtype, size: int) -> int:
+    if dtype in ("int8", "uint8"):
+        _nbin = 64
+    else:
+        _nbin = 256
+    # nbin should not be more than half of the number of pixels
+    return min(_nbin, int(size) // 2)
+
+
+def _compute_histograms(
+    arr: NDArray[np.number],
+    is_rgb: bool,
+    max_pixels: int,
+) -> list[HistogramResult]:
+    if is_rgb:
+        return [compute_histogram(arr[..., i], max_pixels) for i in range(3)]
+    return [compute_histogram(arr, max_pixels)]
+
+
 def _linear_scale(hist: NDArray[np.number]) -> NDArray[np.number]:
     if hist.size > 0 and (hmax := hist.max()) > 0:
         return hist / hmax
@@ -14,6 +14,7 @@ from himena.qt import drag_command
 from himena.qt.magicgui import get_type_map
 from himena.utils.ndobject import NDObjectCollection
 from himena_builtins.qt.widgets._image_components import _roi_items
+from himena_builtins.qt.widgets._image_components._roi_index import RoiSliceIndex
 from himena_builtins.qt.widgets._dragarea import QDraggableArea
 
 if TYPE_CHECKING:
@@ -106,6 +107,9 @@ class QSimpleRoiCollection(QtW.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._qroi_list = NDObjectCollection[_roi_items.QRoi]()
+        # index of ROIs for each slice, rebuilt if `_qroi_list` is replaced
+        self._slice_index = RoiSliceIndex()
+        self._indexed_list = self._qroi_list
         self._pen = QtGui.QPen(QtGui.QColor(238, 238, 0), 2)
         self._pen.setCosmetic(True)
         layout = QtW.QVBoxLayout(self)
@@ -154,7 +158,9 @@ class QSimpleRoiCollection(QtW.QWidget):
         self._list_view.model().beginInsertRows(
             QtCore.QModelIndex(), len(self._qroi_list), len(self._qroi_list)
         )
+        slice_index = self._get_slice_index()
         self._qroi_list.add_item(indices, roi)
+        slice_index.append(indices)
         self._list_view.model().endInsertRows()
 
     def extend(self, other: NDObjectCollection[_roi_items.QRoi]):
@@ -163,12 +169,16 @@ class QSimpleRoiCollection(QtW.QWidget):
             len(self._qroi_list),
             len(self._qroi_list) + len(other),
         )
+        slice_index = self._get_slice_index()
         self._qroi_list.extend(other)
+        slice_index.extend(other.indices)
         self._list_view.model().endInsertRows()
 
     def clear(self):
         self._list_view.model().beginResetModel()
         self._qroi_list.clear()
+        self._slice_index.rebuild(self._qroi_list.indices)
+        self._indexed_list = self._qroi_list
         self._list_view.model().endResetModel()
 
     def set_selections(self, selections: list[int]):
@@ -197,17 +207,25 @@ class QSimpleRoiCollection(QtW.QWidget):
 
     def get_rois_on_slice(self, indices: tuple[int, ...]) -> Sequence[_roi_items.QRoi]:
         """Return a list of ROIs on the given slice."""
-        out = self._qroi_list.filter_by_indices(indices).items
-        return out
+        return self._qroi_list.items[self._positions_in_slice(indices)]
 
     def index_in_slice(self, indices: Indices, ith: int) -> int:
         """Return the `index`-th ROI in the slice `indices`."""
-        mask = self._qroi_list.mask_by_indices(indices)
-        if mask is None:
-            index_total = ith
-        else:
-            index_total = np.where(mask)[0][ith]
-        return index_total
+        return int(self._positions_in_slice(indices)[ith])
+
+    def _positions_in_slice(self, indices: Indices) -> np.ndarray:
+        if len(self._qroi_list.axis_names) != len(indices):
+            raise ValueError(
+                f"Expected {self._qroi_list.ndim} indices, got {len(indices)}"
+            )
+        return self._get_slice_index().query(indices)
+
+    def _get_slice_index(self) -> RoiSliceIndex:
+        qrois = self._qroi_list
+        if self._indexed_list is not qrois or len(self._slice_index) != len(qrois):
+            self._slice_index.rebuild(qrois.indices)
+            self._indexed_list = qrois
+        return self._slice_index
 
     def pop_roi_in_slice(self, indices: Indices, ith: int) -> _roi_items.QRoi:
         """Pop the `index`-th ROI in the slice `indices`."""
@@ -215,6 +233,7 @@ class QSimpleRoiCollection(QtW.QWidget):
         qindex = self._list_view.model().index(index_total)
         self._list_view.model().beginRemoveRows(qindex, index_total, index_total)
         roi = self._qroi_list.pop(index_total)
+        self._slice_index.remove(index_total)
         self._list_view.model().endRemoveRows()
         self._list_view.update()
         return roi
@@ -230,14 +249,19 @@ class QSimpleRoiCollection(QtW.QWidget):
         return self.flatten_roi_along(indices, slice(None))
 
     def flatten_roi_along(self, indices: int | list[int], axis) -> None:
+        slice_index = self._get_slice_index()
         self._qroi_list.indices[indices, axis] = -1
+        for i in np.atleast_1d(indices):
+            slice_index.set_row(i, self._qroi_list.indices[i])
         return None
 
     def move_roi(self, indices: int | list[int], new_dims: tuple[int, ...]) -> None:
         if not isinstance(indices, list):
             indices = [indices]
+        slice_index = self._get_slice_index()
         for i in indices:
             self._qroi_list.indices[i, :] = new_dims
+            slice_index.set_row(i, self._qroi_list.indices[i])
         self.roi_update_requested.emit()
         return None
 
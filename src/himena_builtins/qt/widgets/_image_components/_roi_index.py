@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from bisect import insort
+import math
+from typing import TYPE_CHECKING, Generic, Hashable, Iterable, TypeVar
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from qtpy import QtCore
+
+_T = TypeVar("_T", bound=Hashable)
+Indices = tuple[int, ...]
+
+
+class RoiSliceIndex:
+    """Positions of ROIs in a collection, bucketed by their slice indices.
+
+    ROIs with the same indices are stored in the same bucket, so that looking up the
+    ROIs on a slice only visits the buckets, not all the ROIs. Negative indices mean
+    that the ROI is shown in all the slices along the axis.
+    """
+
+    def __init__(self):
+        self._rows: list[Indices] = []
+        self._buckets: dict[Indices, list[int]] = {}
+        self._cache: dict[Indices, NDArray[np.intp]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rebuild(self, indices: NDArray[np.integer]) -> None:
+        """Rebuild the index from the (N, ndim) indices of a collection."""
+        self._rows = []
+        self._buckets.clear()
+        self.extend(indices)
+
+    def append(self, row: Iterable[int]) -> None:
+        row = tuple(int(i) for i in row)
+        self._buckets.setdefault(row, []).append(len(self._rows))
+        self._rows.append(row)
+        self._cache.clear()
+
+    def extend(self, indices: NDArray[np.integer]) -> None:
+        start = len(self._rows)
+        rows = [tuple(row) for row in np.asarray(indices).tolist()]
+        for i, row in enumerate(rows, start=start):
+            self._buckets.setdefault(row, []).append(i)
+        self._rows.extend(rows)
+        self._cache.clear()
+
+    def remove(self, pos: int) -> None:
+        """Remove the ROI at the position and shift the following positions."""
+        row = self._rows.pop(pos)
+        bucket = self._buckets[row]
+        bucket.remove(pos)
+        if not bucket:
+            del self._buckets[row]
+        for key, bucket in self._buckets.items():
+            if bucket[-1] > pos:
+                self._buckets[key] = [p - 1 if p > pos else p for p in bucket]
+        self._cache.clear()
+
+    def set_row(self, pos: int, row: Iterable[int]) -> None:
+        """Update the indices of the ROI at the position."""
+        row = tuple(int(i) for i in row)
+        old = self._rows[pos]
+        if old == row:
+            return
+        bucket = self._buckets[old]
+        bucket.remove(pos)
+        if not bucket:
+            del self._buckets[old]
+        insort(self._buckets.setdefault(row, []), pos)
+        self._rows[pos] = row
+        self._cache.clear()
+
+    def query(self, key: Indices) -> NDArray[np.intp]:
+        """Sorted positions of the ROIs that are shown in the slice `key`."""
+        key = tuple(key)
+        if (out := self._cache.get(key)) is not None:
+            return out
+        matched = [
+            bucket
+            for row, bucket in self._buckets.items()
+            if all(r == k or r < 0 for r, k in zip(row, key))
+        ]
+        if len(matched) == 0:
+            out = np.zeros(0, dtype=np.intp)
+        elif len(matched) == 1:
+            out = np.asarray(matched[0], dtype=np.intp)
+        else:
+            out = np.sort(np.concatenate(matched).astype(np.intp, copy=False))
+        self._cache[key] = out
+        return out
+
+
+class RoiGridIndex(Generic[_T]):
+    """Uniform grid over the bounding boxes of items for fast hit-testing.
+
+    Each item is registered to the grid cells that its bounding box overlaps, so
+    that only the items near a point have to be tested. Items are returned in the
+    reversed insertion order (topmost first).
+    """
+
+    def __init__(self, cell_size: float = 64.0, max_cells_per_item: int = 1024):
+        self._cell_size = cell_size
+        self._max_cells = max_cells_per_item
+        self._cells: dict[tuple[int, int], dict[_T, int]] = {}
+        # items that are too large to be registered to cells
+        self._large: dict[_T, int] = {}
+        self._items: dict[_T, tuple[int, list[tuple[int, int]]]] = {}
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: _T) -> bool:
+        return item in self._items
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._large.clear()
+        self._items.clear()
+
+    def insert(self, item: _T, rect: QtCore.QRectF) -> None:
+        """Register the item with its bounding rect."""
+        if item in self._items:
+            return self.update(item, rect)
+        self._register(item, rect, self._counter)
+        self._counter += 1
+        return None
+
+    def update(self, item: _T, rect: QtCore.QRectF) -> None:
+        """Update the bounding rect of the item, keeping its order."""
+        if (info := self._items.get(item)) is None:
+            return None
+        order = info[0]
+        self.remove(item)
+        self._register(item, rect, order)
+        return None
+
+    def remove(self, item: _T) -> None:
+        if (info := self._items.pop(item, None)) is None:
+            return None
+        _, cells = info
+        if not cells:
+            self._large.pop(item, None)
+        for cell in cells:
+            items = self._cells[cell]
+            items.pop(item, None)
+            if not items:
+                del self._cells[cell]
+        return None
+
+    def query(self, x: float, y: float) -> list[_T]:
+        """Items whose bounding boxes may contain (x, y), topmost first."""
+        cell = self._cell_of(x, y)
+        candidates = dict(self._cells.get(cell, {}))
+        candidates.update(self._large)
+        return sorted(candidates, key=candidates.__getitem__, reverse=True)
+
+    def _register(self, item: _T, rect: QtCore.QRectF, order: int) -> None:
+        # margin for the pen width
+        rect = rect.adjusted(-1, -1, 1, 1)
+        edges = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        if not all(math.isfinite(v) for v in edges):
+            self._large[item] = order
+            self._items[item] = (order, [])
+            return None
+        cx0, cy0 = self._cell_of(rect.left(), rect.top())
+        cx1, cy1 = self._cell_of(rect.right(), rect.bottom())
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self._max_cells:
+            self._large[item] = order
+            self._items[item] = (order, [])
+            return None
+        cells = [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+        for cell in cells:
+            self._cells.setdefault(cell, {})[item] = order
+        self._items[item] = (order, cells)
+        return None
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        size = self._cell_size
+        return math.floor(x / size), math.floor(y / size)
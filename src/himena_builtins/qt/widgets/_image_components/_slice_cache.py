@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
+from typing import TYPE_CHECKING, Callable, Hashable
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+class SliceCache:
+    """Thread-safe LRU cache of image slices with a memory budget.
+
+    Slices are computed at most once even if they are requested from several threads
+    at the same time (e.g. by the viewer and by prefetching).
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024**2):
+        self._max_bytes = max_bytes
+        self._slices: OrderedDict[Hashable, NDArray[np.number]] = OrderedDict()
+        self._pending: dict[Hashable, Future] = {}
+        self._nbytes = 0
+        self._generation = 0  # incremented when cleared
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._slices or key in self._pending
+
+    def __len__(self) -> int:
+        return len(self._slices)
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes of the cached slices."""
+        return self._nbytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Update the memory budget and evict slices if needed."""
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        func: Callable[[], NDArray[np.number]],
+    ) -> NDArray[np.number]:
+        """Return the cached slice, or compute and cache it."""
+        with self._lock:
+            if (out := self._slices.get(key)) is not None:
+                self._slices.move_to_end(key)
+                return out
+            if (future := self._pending.get(key)) is not None:
+                is_owner = False
+            else:
+                future = self._pending[key] = Future()
+                is_owner = True
+            generation = self._generation
+        if not is_owner:
+            return future.result()
+        try:
+            out = func()
+        except BaseException as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._pending.pop(key, None)
+            if generation == self._generation:
+                self._slices[key] = out
+                self._nbytes += out.nbytes
+                self._evict()
+        future.set_result(out)
+        return out
+
+    def clear(self) -> None:
+        """Clear all the cached slices."""
+        with self._lock:
+            self._slices.clear()
+            self._pending.clear()
+            self._nbytes = 0
+            self._generation += 1
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and self._slices:
+            _, arr = self._slices.popitem(last=False)
+            self._nbytes -= arr.nbytes
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import math
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+import numpy as np
+from qtpy import QtGui
+
+from himena.qt import ndarray_to_qimage
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    Transform = Callable[[NDArray[np.number]], NDArray[np.uint8]]
+
+TILE_SIZE = 512
+# 2D planes with more pixels than this are rendered as tiles
+TILED_RENDERING_MIN_SIZE = 4096 * 4096
+_TILE_CACHE_BYTES = 256 * 1024**2
+
+
+class ImagePyramid:
+    """Multi-resolution levels of a 2D (or 2D + RGB) image.
+
+    Level `k` is the image down-sampled by `2**k` in both of the y and x directions.
+    Levels are any array-like objects that support 2D slicing (numpy, zarr, dask etc.),
+    so that only the requested region is loaded.
+    """
+
+    def __init__(self, levels: Sequence[Any]):
+        if len(levels) == 0:
+            raise ValueError("At least one level is required.")
+        self._levels = list(levels)
+
+    @classmethod
+    def from_array(cls, arr: Any, min_size: int = TILE_SIZE) -> ImagePyramid:
+        """Build levels by strided (nearest) down-sampling of the array."""
+        levels = [arr]
+        factor = 2
+        while min(arr.shape[0], arr.shape[1]) // factor >= min_size:
+            levels.append(arr[::factor, ::factor])
+            factor *= 2
+        return cls(levels)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape (height, width) of the full-resolution level."""
+        return tuple(self._levels[0].shape[:2])
+
+    @property
+    def nlevels(self) -> int:
+        return len(self._levels)
+
+    def level(self, i: int) -> Any:
+        return self._levels[i]
+
+    def level_for_scale(self, scale: float) -> int:
+        """Return the coarsest level that still has one pixel per screen pixel."""
+        if scale <= 0:
+            return self.nlevels - 1
+        ilevel = int(math.floor(math.log2(1 / scale))) if scale < 1 else 0
+        return min(max(ilevel, 0), self.nlevels - 1)
+
+
+class TiledImage:
+    """A pyramid with a transform to RGBA, rendered and cached as tiles."""
+
+    def __init__(
+        self,
+        pyramid: ImagePyramid,
+        transform: Transform,
+        tile_size: int = TILE_SIZE,
+        cache_bytes: int = _TILE_CACHE_BYTES,
+    ):
+        self._pyramid = pyramid
+        self._transform = transform
+        self._tile_size = tile_size
+        self._cache_bytes = cache_bytes
+        self._nbytes = 0
+        # (level, ty, tx) -> QImage of the tile
+        self._tiles: OrderedDict[tuple[int, int, int], QtGui.QImage] = OrderedDict()
+
+    @property
+    def pyramid(self) -> ImagePyramid:
+        return self._pyramid
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._pyramid.shape
+
+    def set_transform(self, transform: Transform) -> None:
+        """Set a new transform and discard the tiles rendered by the old one."""
+        self._transform = transform
+        self._tiles.clear()
+        self._nbytes = 0
+
+    def iter_tiles(
+        self,
+        ilevel: int,
+        rect: tuple[float, float, float, float],
+    ):
+        """Iterate over (target rect, QImage) of the tiles that overlap the rect.
+
+        `rect` is (left, top, width, height) in the full-resolution coordinates.
+        Target rects are also in the full-resolution coordinates.
+        """
+        height, width = self.shape
+        factor = 2**ilevel
+        span = self._tile_size * factor
+        left, top, rw, rh = rect
+        tx0 = max(int(left // span), 0)
+        ty0 = max(int(top // span), 0)
+        tx1 = min(int(math.ceil((left + rw) / span)), int(math.ceil(width / span)))
+        ty1 = min(int(math.ceil((top + rh) / span)), int(math.ceil(height / span)))
+        for ty in range(ty0, ty1):
+            for tx in range(tx0, tx1):
+                qimage = self._get_tile(ilevel, ty, tx)
+                x0, y0 = tx * span, ty * span
+                x1 = min(x0 + qimage.width() * factor, width)
+                y1 = min(y0 + qimage.height() * factor, height)
+                yield (x0, y0, x1 - x0, y1 - y0), qimage
+
+    def render_region(
+        self, left: int, top: int, width: int, height: int
+    ) -> NDArray[np.uint8]:
+        """Render the full-resolution RGBA image of the region."""
+        level = self._pyramid.level(0)
+        data = np.asarray(level[top : top + height, left : left + width])
+        return self._transform(data)
+
+    def _get_tile(self, ilevel: int, ty: int, tx: int) -> QtGui.QImage:
+        key = (ilevel, ty, tx)
+        if (qimage := self._tiles.get(key)) is not None:
+            self._tiles.move_to_end(key)
+            return qimage
+        size = self._tile_size
+        level = self._pyramid.level(ilevel)
+        ysl = slice(ty * size, (ty + 1) * size)
+        xsl = slice(tx * size, (tx + 1) * size)
+        data = np.asarray(level[ysl, xsl])
+        # copy, because QImage does not own the buffer of the transformed array
+        qimage = ndarray_to_qimage(self._transform(data)).copy()
+        self._tiles[key] = qimage
+        self._nbytes += qimage.sizeInBytes()
+        while self._nbytes > self._cache_bytes and len(self._tiles) > 1:
+            _, qimage_old = self._tiles.popitem(last=False)
+            self._nbytes -= qimage_old.sizeInBytes()
+        return qimage
+
+
+def is_large_image(arr: Any) -> bool:
+    """True if the 2D plane of the array is large enough for tiled rendering."""
+    return arr.shape[0] * arr.shape[1] > TILED_RENDERING_MIN_SIZE
@@ -1,6 +1,6 @@
 from ._selection_range_edit import QSelectionRangeEdit
 from ._base import QTableBase, Editability, FLAGS, parse_string
-from ._formatter import format_table_value
+from ._formatter import format_table_value, format_table_values
 from ._header import (
     QHorizontalHeaderView,
     QVerticalHeaderView,
@@ -16,6 +16,7 @@ __all__ = [
     "parse_string",
     "Editability",
     "format_table_value",
+    "format_table_values",
     "QHorizontalHeaderView",
     "QVerticalHeaderView",
     "QDraggableHorizontalHeader",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Callable, Any
+import numpy as np
 
 
 def _format_float(value, ndigits: int = 4) -> str:
@@ -47,3 +48,23 @@ _DEFAULT_FORMATTERS: dict[int, Callable[[Any], str]] = {
 
 def format_table_value(value: Any, fmt: str) -> str:
     return _DEFAULT_FORMATTERS.get(fmt, str)(value)
+
+
+def _format_float_array(values: np.ndarray, ndigits: int = 4) -> list[str]:
+    absval = np.abs(values)
+    fixed = ((0.1 <= absval) & (absval < 10 ** (ndigits + 1))) | (values == 0)
+    out = np.empty(values.shape, dtype=object)
+    out[fixed] = np.char.mod(f"%.{ndigits}f", values[fixed])
+    out[~fixed] = np.char.mod(f"%.{ndigits - 1}e", values[~fixed])
+    return out.tolist()
+
+
+def format_table_values(values: np.ndarray, fmt: str) -> list[str]:
+    """Format a 1D array of values, same as calling `format_table_value` for each."""
+    kind = values.dtype.kind
+    if fmt in ("i", "u", "b") and kind == fmt:
+        return values.astype(str).tolist()
+    if fmt == "f" and kind == "f":
+        return _format_float_array(values)
+    formatter = _DEFAULT_FORMATTERS.get(fmt, str)
+    return [formatter(value) for value in values]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from io import StringIO
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 from cmap import Color, Colormap
 import numpy as np
@@ -22,7 +23,7 @@ from himena.data_wrappers import wrap_dataframe, DataFrameWrapper
 from himena_builtins.qt.widgets._table_components import (
     QTableBase,
     QSelectionRangeEdit,
-    format_table_value,
+    format_table_values,
     QDraggableHorizontalHeader,
     QToolButtonGroup,
     Editability,
@@ -30,7 +31,7 @@ from himena_builtins.qt.widgets._table_components import (
     parse_string,
 )
 from himena_builtins.qt.widgets._splitter import QSplitterHandle
-from himena_builtins.qt.widgets._shared import spacer_widget, index_contains
+from himena_builtins.qt.widgets._shared import spacer_widget
 
 if TYPE_CHECKING:
     from himena_builtins.qt.widgets._table_components._selection_model import Index
@@ -39,28 +40,62 @@ if TYPE_CHECKING:
 
 
 class QDataFrameModel(QtCore.QAbstractTableModel):
-    """Table model for data frame."""
+    """Table model for data frame.
+
+    Cells are fetched and formatted in blocks of rows per column. Formatted blocks
+    are kept in a LRU cache so that scrolling does not convert the same values again.
+    """
+
+    _BLOCK_SIZE = 128
+    _MAX_BLOCKS = 256
 
     def __init__(self, df: DataFrameWrapper, transpose: bool = False, parent=None):
         super().__init__(parent)
-        self._df = df
         self._transpose = transpose
         self._cfg = DataFrameConfigs()
         self._proxy: proxy.TableProxy = proxy.IdentityProxy()
+        self._blocks: OrderedDict[tuple[int, int], tuple[np.ndarray, list[str]]] = (
+            OrderedDict()
+        )
+        self.set_dataframe(df)
 
     @property
     def df(self) -> DataFrameWrapper:
         return self._df
 
+    def set_dataframe(self, df: DataFrameWrapper) -> None:
+        """Set the data frame and reset the cached column information."""
+        self._df = df
+        self._nrows, self._ncols = df.shape
+        self._nrows_shown = self._proxy.num_rows(self._nrows)
+        self._column_names = df.column_names()
+        self._dtypes = df.dtypes
+        self._blocks.clear()
+
+    def set_proxy(self, prx: proxy.TableProxy) -> None:
+        """Set the row proxy and reset the cached cells."""
+        nrows_shown = prx.num_rows(self._nrows)
+        if reset := nrows_shown != self._nrows_shown:
+            self.beginResetModel()
+        self._proxy = prx
+        self._nrows_shown = nrows_shown
+        self._blocks.clear()
+        if reset:
+            self.endResetModel()
+
+    def column_values(self, index: int) -> np.ndarray:
+        """Return all the values of the column at the given index."""
+        return self._df.column_to_array(self._column_names[index])
+
     def rowCount(self, parent=None):
         if self._transpose:
-            return self.df.num_columns()
-        return self.df.num_rows()
+            return self._ncols
+        return self._nrows_shown
 
     def columnCount(self, parent=None):
         if self._transpose:
-            return self.df.num_rows()
-        return self.df.num_columns()
+            return self._nrows_shown
+        return self._ncols
 
     def data(
         self,
@@ -72,18 +107,33 @@ class QDataFrameModel(QtCore.QAbstractTableModel):
         else:
             r, c = index.row(), index.column()
         if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-            df = self.df
-            if r < df.num_rows() and c < df.num_columns():
-                r1 = self._proxy.map(r)
-                value = df[r1, c]
-                dtype = df.get_dtype(c)
+            if r < self._nrows_shown and c < self._ncols:
+                values, texts = self._get_block(r // self._BLOCK_SIZE, c)
+                i = r % self._BLOCK_SIZE
                 if role == Qt.ItemDataRole.DisplayRole:
-                    text = format_table_value(value, dtype.kind)
-                else:
-                    text = str(value)
-                return text
+                    return texts[i]
+                return str(values[i])
         return None
 
+    def _get_block(self, iblock: int, c: int) -> tuple[np.ndarray, list[str]]:
+        """Get the values and formatted texts of the block of rows in a column."""
+        key = (iblock, c)
+        if (block := self._blocks.get(key)) is not None:
+            self._blocks.move_to_end(key)
+            return block
+        start = iblock * self._BLOCK_SIZE
+        stop = min(start + self._BLOCK_SIZE, self._nrows_shown)
+        if isinstance(self._proxy, proxy.IdentityProxy):
+            rows = slice(start, stop)
+        else:
+            rows = self._proxy.map(np.arange(start, stop))
+        values = self._df.get_column_slice(c, rows)
+        block = values, format_table_values(values, self._dtypes[c].kind)
+        self._blocks[key] = block
+        if len(self._blocks) > self._MAX_BLOCKS:
+            self._blocks.popitem(last=False)
+        return block
+
     def setData(self, index: QtCore.QModelIndex, value: Any, role: int = ...) -> bool:
         if role == Qt.ItemDataRole.EditRole:
             r0, c0 = index.row(), index.column()
@@ -109,11 +159,11 @@ class QDataFrameModel(QtCore.QAbstractTableModel):
             is_header = orientation == Qt.Orientation.Horizontal
         if is_header:
             if role == Qt.ItemDataRole.DisplayRole:
-                if section >= self.df.num_columns():
+                if section >= self._ncols:
                     return None
-                return str(self.df.column_names()[section])
+                return str(self._column_names[section])
             elif role == Qt.ItemDataRole.ToolTipRole:
-                if section < self.df.num_columns():
+                if section < self._ncols:
                     return self._column_tooltip(section)
                 return None
 
@@ -122,8 +172,8 @@ class QDataFrameModel(QtCore.QAbstractTableModel):
                 return str(section)
 
     def _column_tooltip(self, section: int):
-        name = self.df.column_names()[section]
-        dtype = self.df.get_dtype(section)
+        name = self._column_names[section]
+        dtype = self._dtypes[section]
         return f"{name} (dtype: {dtype.name})"
 
     if TYPE_CHECKING:
@@ -377,11 +427,9 @@ class QDataFrameView(QTableBase):
             target[r1] = df.column_to_array(name)
             _df_updated = _df_updated.with_columns({name: target})
         new = _df_updated.get_subset(r1, csl).copy()
-        _model._df = _df_updated
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy) and index_contains(
-            prx.index, c
-        ):
-            self._recalculate_proxy()
+        _model.set_dataframe(_df_updated)
+        if self._table_proxy().depends_on(c):
+            self._recalculate_proxy(rows=r1)
         if record_undo:
             self._undo_stack.push(EditAction(old, new, index))
 
@@ -405,37 +453,57 @@ class QDataFrameView(QTableBase):
         if selected_cols := self._get_selected_cols():
             c = min(selected_cols)
             model = self.model()
-            if isinstance(model._proxy, proxy.IdentityProxy):
-                model._proxy = proxy.SortProxy.from_dataframe(c, model.df)
-            elif isinstance(pxy := model._proxy, proxy.SortProxy):
-                if c != pxy.index:
-                    model._proxy = proxy.SortProxy.from_dataframe(c, model.df)
-                elif pxy._ascending:
-                    model._proxy = pxy.switch_ascending()
-                else:
-                    model._proxy = proxy.IdentityProxy()
-            else:
-                model._proxy = proxy.IdentityProxy()
+            model.set_proxy(proxy.toggle_sort(model._proxy, c, model.column_values))
             self.update()
 
+    def set_row_filter(
+        self,
+        column: int | str,
+        predicate: Callable[[np.ndarray], NDArray[np.bool_]] | None,
+        elementwise: bool = False,
+    ) -> None:
+        """Only show the rows whose values in the column satisfy the predicate.
+
+        The data frame itself is not changed. `predicate` receives all the values of
+        the column as a numpy array and must return a boolean array of the same
+        length. Pass `None` to show all the rows again.
+
+        Set `elementwise=True` if the result of each row only depends on the value of
+        the row, so that only the edited rows are evaluated again after editing.
+
+        >>> view.set_row_filter("score", lambda x: x > 0.5, elementwise=True)
+        """
+        model = self.model()
+        if model._transpose:
+            raise NotImplementedError(
+                "Filtering is not supported for transposed table."
+            )
+        if isinstance(column, str):
+            column = model._column_names.index(column)
+        if predicate is None:
+            filt = None
+        else:
+            filt = proxy.FilterProxy.from_values(
+                column, model.column_values(column), predicate, elementwise
+            )
+        model.set_proxy(proxy.with_filter(model._proxy, filt, model.column_values))
+        self.update()
+
     def _table_proxy(self) -> proxy.TableProxy:
         return self.model()._proxy
 
-    def _recalculate_proxy(self):
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy):
-            self.model()._proxy = prx.from_dataframe(
-                prx.index, self.model().df, ascending=prx.ascending
-            )
+    def _recalculate_proxy(self, rows: _Index | None = None):
+        model = self.model()
+        prx = model._proxy.recalculate(model.column_values, model._nrows, rows)
+        model.set_proxy(prx)
 
     def _map_row_index(self, r: _Index) -> _Index:
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy):
-            if isinstance(r, slice):
-                r1 = prx.map(np.arange(r.start, r.stop))
-            else:
-                r1 = prx.map(r)
-        else:
-            r1 = r
-        return r1
+        prx = self._table_proxy()
+        if isinstance(prx, proxy.IdentityProxy):
+            return r
+        if isinstance(r, slice):
+            return prx.map(np.arange(r.start, r.stop))
+        return prx.map(r)
 
     if TYPE_CHECKING:
 
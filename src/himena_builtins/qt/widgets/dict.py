@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Mapping
+from typing import TYPE_CHECKING, Callable, Mapping
 import weakref
 
 from qtpy import QtWidgets as QtW, QtCore, QtGui
@@ -9,6 +9,7 @@ from himena.qt import drag_command
 from himena.types import DropResult, Parametric, WidgetDataModel
 from himena.consts import DefaultFontFamily, StandardType
 from himena.plugins import validate_protocol, register_hidden_function
+from himena.utils.collections import LazyDict
 
 _CMD_MERGE_TAB = "builtins:QDictOfWidgetEdit:merge-tab"
 _CMD_SELECT_TAB = "builtins:QDictOfWidgetEdit:select-tab"
@@ -79,6 +80,8 @@ class QDictOfWidgetEdit(QtW.QTabWidget):
         self._line_edit.renamed.connect(self._on_tab_renamed)
         self._tab_renamed = False
         self._is_modified = False
+        # tabs whose models are not loaded yet
+        self._pending_models: dict[QtW.QWidget, Callable[[], WidgetDataModel]] = {}
 
         # corner widget for adding new tab
         tb = QtW.QToolButton()
@@ -96,7 +99,23 @@ class QDictOfWidgetEdit(QtW.QTabWidget):
         self._tab_renamed = True
 
     def _on_tab_changed(self, index: int):
-        self.control_widget().update_for_component(self.widget(index))
+        widget = self.widget(index)
+        self._ensure_loaded(widget)
+        self.control_widget().update_for_component(widget)
+
+    def _ensure_loaded(self, widget: QtW.QWidget | None):
+        """Update the widget with its model if it is not loaded yet.
+
+        The loader is kept if it fails, so that the error is raised again, instead of
+        the widget being converted to an empty model.
+        """
+        if (get_model := self._pending_models.get(widget)) is not None:
+            widget.update_model(get_model())
+            self._pending_models.pop(widget)
+
+    def _ensure_all_loaded(self):
+        for i in range(self.count()):
+            self._ensure_loaded(self.widget(i))
 
     def _tabbar_right_clicked(self, index: int):
         if index < 0:  # Clicked on the empty space
@@ -127,16 +146,16 @@ class QDictOfWidgetEdit(QtW.QTabWidget):
         if isinstance(model.metadata, DictMeta):
             metadata = model.metadata
         self.clear()
-        for tab_name, each in value.items():
+        self._pending_models.clear()
+        for tab_name in value.keys():
             table = self._default_widget()
             child_meta = metadata.child_meta.get(tab_name, None)
-            table.update_model(
-                WidgetDataModel(
-                    value=each,
-                    type=self._model_type_component,
-                    metadata=child_meta,
-                )
-            )
+            get_model = self._child_model_getter(value, tab_name, child_meta)
+            if isinstance(value, LazyDict) and not value.is_loaded(tab_name):
+                # loaded when the tab is shown for the first time
+                self._pending_models[table] = get_model
+            else:
+                table.update_model(get_model())
             self.addTab(table, str(tab_name))
         if self.count() > 0:
             if (tname := metadata.current_tab) is not None:
@@ -149,8 +168,21 @@ class QDictOfWidgetEdit(QtW.QTabWidget):
         self._model_type = model.type
         self._extension_default = model.extension_default
 
+    def _child_model_getter(
+        self, value: Mapping, key, child_meta
+    ) -> Callable[[], WidgetDataModel]:
+        def _get_model() -> WidgetDataModel:
+            return WidgetDataModel(
+                value=value[key],
+                type=self._model_type_component,
+                metadata=child_meta,
+            )
+
+        return _get_model
+
     @validate_protocol
     def to_model(self) -> WidgetDataModel:
+        self._ensure_all_loaded()
         index = self.currentIndex()
         models: dict[str, WidgetDataModel] = {
             self.tabText(i): self.widget(i).to_model() for i in range(self.count())
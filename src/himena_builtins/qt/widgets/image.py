@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 import math
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 import warnings
@@ -21,6 +22,8 @@ from himena.widgets import set_status_tip, current_instance, show_tooltip
 from himena.data_wrappers import ArrayWrapper, wrap_array
 from himena_builtins.qt.widgets._image_components import (
     QImageGraphicsView,
+    ImagePyramid,
+    TiledImage,
     QRoi,
     QRoiButtons,
     QImageViewControl,
@@ -31,6 +34,8 @@ from himena_builtins.qt.widgets._image_components import (
     MouseMode,
     ChannelMode,
 )
+from himena_builtins.qt.widgets._image_components._tiles import is_large_image
+from himena_builtins.qt.widgets._image_components._slice_cache import SliceCache
 from himena_builtins.qt.widgets._dim_sliders import QDimsSlider
 from himena_builtins.qt.widgets._splitter import QSplitterHandle
 from himena_builtins.qt.widgets._shared import quick_min_max
@@ -44,6 +49,7 @@ if TYPE_CHECKING:
 
 class QImageViewBase(QtW.QSplitter):
     _executor = ThreadPoolExecutor(max_workers=1)
+    _prefetch_executor = ThreadPoolExecutor(max_workers=2)
     images_changed = QtCore.Signal(list)
     current_roi_updated = QtCore.Signal(object)
     """Emit current QRoi or None if no ROI is active."""
@@ -93,6 +99,8 @@ class QImageViewBase(QtW.QSplitter):
         self._is_editable = True
         # cached ImageTuples for display
         self._current_image_slices: list[ImageTuple] | None = None
+        # tiled images of the large slices for each channel
+        self._tiled_images: dict[int, TiledImage] = {}
         self._is_rgb = False  # whether the image is RGB
         self._channel_axis: int | None = None
         self._channels: list[ChannelInfo] = [ChannelInfo(name="")]
@@ -101,6 +109,10 @@ class QImageViewBase(QtW.QSplitter):
         self._extension_default: str = ".png"
         self._original_title: str | None = None
         self._last_slice_future: Future | None = None
+        # cache of the slices of lazy arrays, and the neighbors being prefetched
+        self._slice_cache = SliceCache()
+        self._prefetch_futures: list[Future] = []
+        self._last_slider_value: tuple[int, ...] | None = None
         self._cfg = ImageViewConfigs()
 
     def createHandle(self):
@@ -133,6 +145,7 @@ class QImageViewBase(QtW.QSplitter):
             unit="a.u.",
         )
         self._arr = arr
+        self._clear_slice_cache()
         if isinstance(meta := model.metadata, model_meta.ImageMeta):
             _update_meta(meta0, meta)
             if meta.is_rgb:
@@ -153,6 +166,7 @@ class QImageViewBase(QtW.QSplitter):
             self._dims_slider.set_axis_names([axis.name for axis in meta0.axes])
         with QtCore.QSignalBlocker(self._dims_slider):
             self._dims_slider.setValue(sl_0)
+        self._last_slider_value = sl_0
         axis_names = [meta0.axes[i].name for i in range(self._dims_slider.count())]
         self._roi_col._qroi_list = self._roi_col._qroi_list.coerce_dimensions(
             axis_names
@@ -232,6 +246,7 @@ class QImageViewBase(QtW.QSplitter):
                 "Please use `update_model` with `WidgetDataModel` instead."
             )
         self._arr = arr
+        self._clear_slice_cache()
         self._reset_image()
         self.set_hover_info(self._default_hover_info())
 
@@ -241,7 +256,7 @@ class QImageViewBase(QtW.QSplitter):
         nchannels: int,
     ) -> list[ImageTuple]:
         """Get numpy arrays for each channel (None mean hide the channel)."""
-        return [ImageTuple(self._get_image_slice_for_channel(value))]
+        return [ImageTuple(self._get_image_slice_for_channel(value), indices=value)]
 
     def _set_image_slice(self, img: NDArray[np.number], channel: ChannelInfo):
         raise NotImplementedError
@@ -256,7 +271,7 @@ class QImageViewBase(QtW.QSplitter):
         raise NotImplementedError
 
     def _clim_for_ith_channel(self, img_slices: list[ImageTuple], ith: int):
-        ar0, _ = img_slices[ith]
+        ar0 = img_slices[ith].arr
         return quick_min_max(ar0)
 
     def _init_channels(self, meta: model_meta.ImageMeta, nchannels: int, dtype):
@@ -471,14 +486,69 @@ class QImageViewBase(QtW.QSplitter):
             return
         for i, vis in enumerate(visible):
             if i < len(slices):
-                slices[i] = ImageTuple(slices[i].arr, vis)
+                slices[i] = slices[i]._replace(visible=vis)
         self._set_image_slices(slices)
 
     def _get_image_slice_for_channel(
         self, value: tuple[int, ...]
     ) -> NDArray[np.number]:
         """Get numpy array for current channel."""
-        return self._arr.get_slice(tuple(value))
+        sl = tuple(value)
+        arr = self._arr
+        if not self._is_slice_cache_enabled():
+            return arr.get_slice(sl)
+        return self._slice_cache.get_or_compute(sl, lambda: arr.get_slice(sl))
+
+    def _is_slice_cache_enabled(self) -> bool:
+        # slicing numpy arrays is free, only lazy arrays need caching
+        return (
+            self._arr is not None
+            and not isinstance(self._arr.arr, np.ndarray)
+            and self._slice_cache.max_bytes > 0
+        )
+
+    def _clear_slice_cache(self):
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures.clear()
+        self._slice_cache.clear()
+        self._last_slider_value = None
+
+    def _prefetch_neighbors(self, value: tuple[int, ...]):
+        """Load the next slices along the axis that is moving or playing."""
+        last, self._last_slider_value = self._last_slider_value, value
+        if (
+            last is None
+            or len(last) != len(value)
+            or not self._is_slice_cache_enabled()
+        ):
+            return
+        changed = [i for i, (v0, v1) in enumerate(zip(last, value)) if v0 != v1]
+        if len(changed) != 1 or changed[0] == self._channel_axis:
+            return
+        axis = changed[0]
+        slider = self._dims_slider._sliders[axis]
+        is_playing = slider._play_btn.isChecked()
+        if is_playing:
+            step = slider._play_increment
+        else:
+            step = 1 if value[axis] > last[axis] else -1
+        size = slider._slider.maximum() + 1
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures.clear()
+        nchannels = len(self._channels)
+        for n in range(1, _PREFETCH_COUNT + 1):
+            index = value[axis] + step * n
+            if is_playing and slider._play_back_mode == "loop":
+                index %= size
+            elif not 0 <= index < size:
+                break
+            next_value = value[:axis] + (index,) + value[axis + 1 :]
+            future = self._prefetch_executor.submit(
+                self._get_image_slices, next_value, nchannels
+            )
+            self._prefetch_futures.append(future)
 
     def _slider_changed(self, value: tuple[int, ...], *, force_sync: bool = False):
         """Callback for slider value change."""
@@ -495,6 +565,7 @@ class QImageViewBase(QtW.QSplitter):
                 self._get_image_slices, value, len(self._channels)
             )
             self._last_slice_future.add_done_callback(self._set_image_slices_async)
+        self._prefetch_neighbors(value)
 
     def _update_rois(self):
         cur_item = self._img_view._current_roi_item
@@ -781,10 +852,16 @@ class QImageView(QImageViewBase):
         self._img_view.set_show_rois(cfg.default_show_all)
         self._img_view.set_show_labels(cfg.default_show_labels)
         self._img_view._selection_handles._handle_size = cfg.roi_handle_size
+        self._slice_cache.set_max_bytes(cfg.slice_cache_size * 1024**2)
+        self._control._histogram.set_hist_max_pixels(cfg.histogram_max_pixels)
 
     def _make_control_widget(self) -> QImageViewControl:
         return QImageViewControl(self)
 
+    def _clear_slice_cache(self):
+        super()._clear_slice_cache()
+        self._control._histogram.clear_cache()
+
     def _default_colormap(self) -> Colormap:
         return Colormap("gray")
 
@@ -811,21 +888,15 @@ class QImageView(QImageViewBase):
             vis = i >= len(check_states) or check_states[i]
             sl = list(value)
             sl[self._channel_axis] = i
-            img_slices.append(ImageTuple(self._get_image_slice_for_channel(sl), vis))
+            img_slices.append(
+                ImageTuple(self._get_image_slice_for_channel(sl), vis, tuple(sl))
+            )
         return img_slices
 
     def _set_image_slice(self, img: NDArray[np.number], channel: ChannelInfo):
         idx = channel.channel_index or 0
         with QtCore.QSignalBlocker(self._control._histogram):
-            self._img_view.set_array(
-                idx,
-                channel.transform_image(
-                    img,
-                    complex_transform=self._control.complex_transform,
-                    is_rgb=self._is_rgb,
-                    is_gray=self._composite_state() == "Gray",
-                ),
-            )
+            self._img_view.set_array(idx, self._image_for_display(img, channel))
             self._img_view.clear_rois()
             self._control._histogram.set_hist_for_array(
                 img,
@@ -858,23 +929,29 @@ class QImageView(QImageViewBase):
                 else:
                     img = None
                 images.append(img)
-                img_tr = ch.transform_image(
-                    img,
-                    complex_transform=self._control.complex_transform,
-                    is_rgb=self._is_rgb,
-                    is_gray=self._composite_state() == "Gray",
-                )
-                self._img_view.set_array(i, img_tr)
+                self._img_view.set_array(i, self._image_for_display(img, ch))
             ch_cur = self.current_channel()
             idx = ch_cur.channel_index or 0
             hist_arr_ref = imgs[idx].arr
+            complex_mode = None
             if hist_arr_ref.dtype.kind == "c":
                 hist_arr_ref = self._control.complex_transform(hist_arr_ref)
+                complex_mode = self._control._cmp_mode_combo.currentText()
+            if (indices := imgs[idx].indices) is not None:
+                hist_key = (id(self._arr), indices, idx, complex_mode)
+            else:
+                hist_key = None
+            # histogram of the same slice is reused, and if the contrast limits do not
+            # depend on the histogram, it is computed in another thread. The key is the
+            # indices the slice was requested with, as the slider may have been moved
+            # while the slice was being read.
             self._control._histogram.set_hist_for_array(
                 hist_arr_ref,
                 clim=ch_cur.clim,
                 is_rgb=self._is_rgb,
                 color=color_for_colormap(ch_cur.colormap),
+                key=hist_key,
+                run_async=not self._control._auto_cont_btn.live,
             )
             self._update_rois()
             self._img_view.set_image_blending([im.visible for im in imgs])
@@ -884,8 +961,39 @@ class QImageView(QImageViewBase):
                 self._control._auto_contrast()
         self.images_changed.emit(images)
 
+    def _image_for_display(
+        self,
+        img: NDArray[np.number] | None,
+        channel: ChannelInfo,
+        is_gray: bool | None = None,
+    ) -> NDArray[np.uint8] | TiledImage | None:
+        """Transform the image slice to RGBA, or to tiles if the slice is large."""
+        if is_gray is None:
+            is_gray = self._composite_state() == "Gray"
+        transform = partial(
+            channel.transform_image,
+            complex_transform=self._control.complex_transform,
+            is_rgb=self._is_rgb,
+            is_gray=is_gray,
+        )
+        if img is None:
+            return None
+        idx = channel.channel_index or 0
+        if not is_large_image(img):
+            self._tiled_images.pop(idx, None)
+            return transform(img)
+        # only the visible tiles at the current zoom will be transformed. If the slice
+        # is not changed (such as when contrast limits changed), the pyramid is reused.
+        tiled = self._tiled_images.get(idx)
+        if tiled is not None and tiled.pyramid.level(0) is img:
+            tiled.set_transform(transform)
+        else:
+            tiled = TiledImage(ImagePyramid.from_array(img), transform)
+            self._tiled_images[idx] = tiled
+        return tiled
+
     def _clim_for_ith_channel(self, img_slices: list[ImageTuple], ith: int):
-        ar0, _ = img_slices[ith]
+        ar0 = img_slices[ith].arr
         if ar0.dtype.kind == "c":
             ar0 = self._control.complex_transform(ar0)
         return quick_min_max(ar0)
@@ -988,6 +1096,16 @@ class ChannelInfo:
     clim: tuple[float, float] = dataclasses.field(default=(0.0, 1.0))
     colormap: Colormap = dataclasses.field(default_factory=lambda: Colormap("gray"))
     channel_index: int | None = None
+    # ((colormap, clim, dtype), lookup table) for 8/16-bit integer images
+    _lut_cache: tuple[tuple, NDArray[np.uint32]] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _out_buffer: NDArray[np.uint32] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _gray: ChannelInfo | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def transform_image(
         self,
@@ -1044,6 +1162,8 @@ class ChannelInfo:
             false_color = (np.array(self.colormap(0.0).rgba) * 255).astype(np.uint8)
             true_color = (np.array(self.colormap(1.0).rgba) * 255).astype(np.uint8)
             arr_normed = np.where(arr[..., np.newaxis], true_color, false_color)
+        elif cmax > cmin and arr.dtype.kind in "ui" and arr.dtype.itemsize <= 2:
+            return self._apply_lut(arr)
         elif cmax > cmin:
             arr_ = (arr - cmin) / (cmax - cmin)
             arr_normed = (self.colormap(arr_, bytes=True)).astype(np.uint8)
@@ -1055,6 +1175,25 @@ class ChannelInfo:
         assert out.dtype == np.uint8
         return out
 
+    def _apply_lut(self, arr: NDArray[np.integer]) -> NDArray[np.uint8]:
+        """Colormap an 8/16-bit integer image by a lookup table."""
+        key = (self.colormap, self.clim, arr.dtype)
+        if self._lut_cache is None or not _lut_key_equal(self._lut_cache[0], key):
+            cmin, cmax = self.clim
+            # all the possible values, ordered so that value v is at index v % nvalues
+            nvalues = 2 ** (arr.dtype.itemsize * 8)
+            values = np.arange(nvalues, dtype=f"u{arr.dtype.itemsize}").view(arr.dtype)
+            lut = self.colormap((values - cmin) / (cmax - cmin), bytes=True)
+            # one RGBA pixel as one uint32, so that np.take is a 1D lookup
+            lut32 = np.ascontiguousarray(lut, dtype=np.uint8).view(np.uint32).ravel()
+            self._lut_cache = (key, lut32)
+        lut32 = self._lut_cache[1]
+        if self._out_buffer is None or self._out_buffer.shape != arr.shape:
+            self._out_buffer = np.empty(arr.shape, dtype=np.uint32)
+        mode = "wrap" if arr.dtype.kind == "i" else "clip"
+        np.take(lut32, arr, out=self._out_buffer, mode=mode)
+        return self._out_buffer.view(np.uint8).reshape(arr.shape + (4,))
+
     def transform_image_rgb(
         self,
         arr: NDArray[np.number] | None,
@@ -1092,12 +1231,13 @@ class ChannelInfo:
         return arr_normed
 
     def as_gray(self) -> ChannelInfo:
-        return ChannelInfo(
-            name=self.name,
-            clim=self.clim,
-            colormap=Colormap("gray"),
-            channel_index=self.channel_index,
-        )
+        # reuse the gray channel so that its lookup table is also reused
+        if self._gray is None:
+            self._gray = ChannelInfo(name=self.name, colormap=Colormap("gray"))
+        self._gray.name = self.name
+        self._gray.clim = self.clim
+        self._gray.channel_index = self.channel_index
+        return self._gray
 
     @classmethod
     def from_channel(
@@ -1122,13 +1262,21 @@ class ChannelInfo:
 
 
 class ImageTuple(NamedTuple):
-    """A layer of image and its visibility."""
+    """A layer of image, its visibility and the slider indices it was sliced with."""
 
     arr: NDArray[np.number]
     visible: bool = True
+    indices: tuple[int, ...] | None = None
 
 
 _DEFAULT_COLORMAPS = ["green", "magenta", "cyan", "yellow", "red", "blue"]
+_PREFETCH_COUNT = 4  # number of slices to prefetch along the moving axis
+
+
+def _lut_key_equal(key0: tuple, key1: tuple) -> bool:
+    cmap0, clim0, dtype0 = key0
+    cmap1, clim1, dtype1 = key1
+    return cmap0 is cmap1 and tuple(clim0) == tuple(clim1) and dtype0 == dtype1
 
 
 def color_for_colormap(cmap: Colormap) -> QtGui.QColor:
@@ -1226,6 +1374,22 @@ class ImageViewConfigs:
     roi_handle_size: int = dataclasses.field(default=5, metadata={"min": 1, "max": 10})
     default_show_all: bool = dataclasses.field(default=True)
     default_show_labels: bool = dataclasses.field(default=True)
+    slice_cache_size: int = dataclasses.field(
+        default=512,
+        metadata={
+            "min": 0,
+            "max": 65536,
+            "tooltip": "Memory (MB) used to cache the slices of lazy arrays.",
+        },
+    )
+    histogram_max_pixels: int = dataclasses.field(
+        default=1048576,
+        metadata={
+            "min": 1024,
+            "max": 1073741824,
+            "tooltip": "Number of pixels sampled to compute histograms of float images.",
+        },
+    )
 
 
 _INCREMENT_MAP = {
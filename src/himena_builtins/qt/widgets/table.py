@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum, auto
 from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, Literal, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Mapping
 from dataclasses import dataclass
 import numpy as np
 from numpy.typing import NDArray
@@ -25,9 +25,10 @@ from himena_builtins.qt.widgets._table_components import (
     Editability,
     QToolButtonGroup,
 )
-from himena_builtins.qt.widgets._shared import spacer_widget, index_contains
+from himena_builtins.qt.widgets._shared import spacer_widget
 from himena.utils.collections import UndoRedoStack
 from himena.utils import proxy
+from himena.utils.table_selection import TypedColumns
 
 if TYPE_CHECKING:
     from himena.widgets import MainWindow
@@ -143,6 +144,7 @@ class QStringArrayModel(QtCore.QAbstractTableModel):
             raise ValueError("Only string array is supported.")
         self._nrows, self._ncols = arr.shape
         self._is_original_array = True
+        self._typed_columns: TypedColumns | None = None
         self._header_format = HeaderFormat.NumberZeroIndexed
         self._proxy: proxy.TableProxy = proxy.IdentityProxy()
 
@@ -155,7 +157,7 @@ class QStringArrayModel(QtCore.QAbstractTableModel):
         def parent(self) -> QSpreadsheet: ...  # fmt: skip
 
     def rowCount(self, parent=None):
-        return max(self._nrows + 1, self.MIN_ROW_COUNT)
+        return max(self._proxy.num_rows(self._nrows) + 1, self.MIN_ROW_COUNT)
 
     def columnCount(self, parent=None):
         return max(self._ncols + 1, self.MIN_COLUMN_COUNT)
@@ -166,6 +168,7 @@ class QStringArrayModel(QtCore.QAbstractTableModel):
         nr, nc = arr.shape
         nr0, nc0 = self.rowCount(), self.columnCount()
         self._arr = arr
+        self._typed_columns = None
         self._nrows, self._ncols = arr.shape
 
         # adjust the model size to fit the new array.
@@ -192,6 +195,32 @@ class QStringArrayModel(QtCore.QAbstractTableModel):
             # no need for further copy-on-write
             self._is_original_array = False
 
+    def writable_array(self) -> np.ndarray:
+        """Return the array that can be modified in place.
+
+        The array is copied if it may be shared with other models (copy-on-write).
+        The parsed columns are discarded, as the array is going to be modified.
+        """
+        if self._is_original_array:
+            self._arr = self._arr.copy()
+            self._is_original_array = False
+        self._typed_columns = None
+        return self._arr
+
+    def typed_columns(self) -> TypedColumns:
+        """Return the parsed columns of the current array."""
+        if self._typed_columns is None:
+            self._typed_columns = TypedColumns(self._arr)
+        return self._typed_columns
+
+    def set_proxy(self, prx: proxy.TableProxy) -> None:
+        """Set the row proxy, resetting the model if the row count changes."""
+        if reset := prx.num_rows(self._nrows) != self._proxy.num_rows(self._nrows):
+            self.beginResetModel()
+        self._proxy = prx
+        if reset:
+            self.endResetModel()
+
     def flags(self, index: QtCore.QModelIndex) -> Qt.ItemFlag:
         return FLAGS
 
@@ -203,9 +232,9 @@ class QStringArrayModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return None
         r, c = index.row(), index.column()
-        if r >= self._arr.shape[0] or c >= self._arr.shape[1]:
-            return None
         r1 = self._proxy.map(r)
+        if r1 >= self._arr.shape[0] or c >= self._arr.shape[1]:
+            return None
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
         if role == Qt.ItemDataRole.ToolTipRole:
@@ -313,6 +342,8 @@ class QSpreadsheet(QTableBase):
             self.setModel(QStringArrayModel(table, self))
         else:
             self.model().set_array(table)
+            # the new array may be shared with the model, so it must be copied on write
+            self.model()._is_original_array = True
 
         # if the model has a source, set the relative path checker
         if isinstance(model.source, Path):
@@ -357,6 +388,7 @@ class QSpreadsheet(QTableBase):
         meta = self._prep_table_meta()
         if sep := self._control._separator:
             meta.separator = sep
+        meta._typed_columns = self.model().typed_columns()
         # NOTE: if this model is passed to another widget and modified in this widget,
         # the other array will be modified as well. To avoid this, we need to reset the
         # copy-on-write state of this array.
@@ -443,14 +475,11 @@ class QSpreadsheet(QTableBase):
             if isinstance(_ud_old_data, np.ndarray):
                 _ud_old_data = _ud_old_data.copy()
             _action_reshape = None
-        if self.model()._is_original_array:
-            self.model()._arr = arr = arr.copy()
+        arr = self.model().writable_array()
         arr[r1, c] = value
-        # recalculate order
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy) and index_contains(
-            prx.index, c
-        ):
-            self._recalculate_proxy()
+        # recalculate order and filter
+        if self._table_proxy().depends_on(c):
+            self._recalculate_proxy(rows=r1)
         _ud_new_data = arr[r1, c]
         _action = EditAction(_ud_old_data, _ud_new_data, (r1, c))
         if _action_reshape is not None:
@@ -478,16 +507,16 @@ class QSpreadsheet(QTableBase):
 
     def array_shrink(self, nr: int, nc: int):
         """Shrink the array to the given shape."""
+        nc0 = self.model()._arr.shape[1]
         # slicing returns the view of the array, so it should be marked as original.
         self.model().set_array(self.model()._arr[:nr, :nc], is_original=True)
         self._control.update_for_table(self)
-        # process sort proxy
-        if isinstance(prx := self._table_proxy, proxy.SortProxy):
-            if prx.index >= nc:
-                # the column on which sorting is based is removed, reset proxy
-                self.model()._proxy = proxy.IdentityProxy()
-            else:
-                self._recalculate_proxy()
+        # process sort/filter proxy
+        if self._table_proxy().depends_on(slice(nc, nc0)):
+            # the column on which sorting is based is removed, reset proxy
+            self.model().set_proxy(proxy.IdentityProxy())
+        else:
+            self._recalculate_proxy()
         self.update()
 
     def array_insert(
@@ -512,11 +541,8 @@ class QSpreadsheet(QTableBase):
         )
         if axis == 0:
             self._recalculate_proxy()
-        elif (
-            isinstance(prx := self._table_proxy(), proxy.SortProxy)
-            and index <= prx.index
-        ):
-            prx._index += 1
+        else:
+            self._table_proxy().remap_columns(lambda i: i + 1 if index <= i else i)
         if record_undo:
             self._undo_stack.push(InsertAction(index, axis, values))
         self.update()
@@ -549,13 +575,11 @@ class QSpreadsheet(QTableBase):
         )
         if axis == 0:
             self._recalculate_proxy()
-        if axis == 1 and isinstance(prx := self._table_proxy(), proxy.SortProxy):
-            if prx.index in indices:
-                # the column on which sorting is based is removed, reset proxy
-                self.model()._proxy = proxy.IdentityProxy()
-            else:
-                n_removed_before = sum(1 for i in indices if i < prx.index)
-                prx._index -= n_removed_before
+        elif (prx := self._table_proxy()).depends_on(np.asarray(indices)):
+            # the column on which sorting is based is removed, reset proxy
+            self.model().set_proxy(proxy.IdentityProxy())
+        else:
+            prx.remap_columns(lambda i: i - sum(1 for j in indices if j < i))
         self.update()
         # Record the action if necessary.
         if record_undo:
@@ -685,10 +709,10 @@ class QSpreadsheet(QTableBase):
         self.model().set_array(arr, is_original=False)
 
         # update proxy length and/or recalculate order
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy) and (
-            r_expanded or index_contains(prx.index, target_c)
-        ):
+        if r_expanded:
             self._recalculate_proxy()
+        elif self._table_proxy().depends_on(target_c):
+            self._recalculate_proxy(rows=target_r1)
 
         # select what was just pasted
         self._selection_model.set_ranges([(target_r, target_c)])
@@ -698,7 +722,7 @@ class QSpreadsheet(QTableBase):
     def _delete_selection(self):
         _actions = []
         _maybe_empty_edges = False
-        arr = self.model()._arr
+        arr = self.model().writable_array()
         # replace all the selected cells with empty strings.
         for sel in self._selection_model.ranges:
             r, c = sel
@@ -720,21 +744,19 @@ class QSpreadsheet(QTableBase):
         self.update()
         self._undo_stack.push(ActionGroup(_actions))
 
-    def _recalculate_proxy(self):
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy):
-            self.model()._proxy = prx.from_array(
-                prx.index, self.model()._arr, ascending=prx.ascending
-            )
+    def _recalculate_proxy(self, rows: _Index | None = None):
+        model = self.model()
+        arr = model._arr
+        prx = model._proxy.recalculate(lambda i: arr[:, i], arr.shape[0], rows)
+        model.set_proxy(prx)
 
     def _map_row_index(self, r: _Index):
-        if isinstance(prx := self._table_proxy(), proxy.SortProxy):
-            if isinstance(r, slice):
-                r1 = prx.map(np.arange(r.start, r.stop))
-            else:
-                r1 = prx.map(r)
-        else:
-            r1 = r
-        return r1
+        prx = self._table_proxy()
+        if isinstance(prx, proxy.IdentityProxy):
+            return r
+        if isinstance(r, slice):
+            return prx.map(np.arange(r.start, r.stop))
+        return prx.map(r)
 
     def _auto_resize_columns(self):
         """Only resize columns relevant to the array to fit their contents."""
@@ -746,19 +768,36 @@ class QSpreadsheet(QTableBase):
         if selected_cols := self._get_selected_cols():
             c = min(selected_cols)
             model = self.model()
-            if isinstance(model._proxy, proxy.IdentityProxy):
-                model._proxy = proxy.SortProxy.from_array(c, model._arr)
-            elif isinstance(pxy := model._proxy, proxy.SortProxy):
-                if c != pxy.index:
-                    model._proxy = proxy.SortProxy.from_array(c, model._arr)
-                elif pxy._ascending:
-                    model._proxy = pxy.switch_ascending()
-                else:
-                    model._proxy = proxy.IdentityProxy()
-            else:
-                model._proxy = proxy.IdentityProxy()
+            arr = model._arr
+            model.set_proxy(proxy.toggle_sort(model._proxy, c, lambda i: arr[:, i]))
             self.update()
 
+    def set_row_filter(
+        self,
+        column: int,
+        predicate: Callable[[np.ndarray], NDArray[np.bool_]] | None,
+        elementwise: bool = False,
+    ) -> None:
+        """Only show the rows whose values in the column satisfy the predicate.
+
+        The array itself is not changed. `predicate` receives the string array of
+        the column and must return a boolean array of the same length. Pass `None`
+        to show all the rows again.
+
+        Set `elementwise=True` if the result of each row only depends on the value of
+        the row, so that only the edited rows are evaluated again after editing.
+
+        >>> sheet.set_row_filter(0, lambda x: x != "", elementwise=True)
+        """
+        model = self.model()
+        arr = model._arr
+        if predicate is None:
+            filt = None
+        else:
+            filt = proxy.FilterProxy.from_array(column, arr, predicate, elementwise)
+        model.set_proxy(proxy.with_filter(model._proxy, filt, lambda i: arr[:, i]))
+        self.update()
+
     def _insert_row_below(self):
         """Insert a row below the current selection."""
         self.array_insert(self._selection_model.current_index.row + 1, 0)
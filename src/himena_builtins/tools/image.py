@@ -333,6 +333,46 @@ def point_rois_to_dataframe(model: WidgetDataModel) -> WidgetDataModel:
     )
 
 
+@register_function(
+    title="Measure ROIs ...",
+    types=StandardType.IMAGE,
+    menus=[MenuId.TOOLS_IMAGE_ROI, "/model_menu/roi"],
+    command_id="builtins:image:measure-rois",
+)
+def measure_rois(model: WidgetDataModel) -> Parametric:
+    """Measure the pixel values inside all the ROIs in all the slices."""
+    meta = _cast_meta(model, ImageMeta)
+    if meta.is_rgb:
+        raise ValueError("Measurement of RGB images is not supported.")
+    arr = wrap_array(model.value)
+    rois = meta.unwrap_rois()
+
+    @configure_gui(
+        metrics={
+            "choices": image_utils.MEASUREMENTS,
+            "widget_type": "Select",
+            "value": ["area", "mean", "std"],
+        }
+    )
+    def run_measure_rois(metrics: list[str]) -> WidgetDataModel:
+        if len(rois) == 0:
+            raise ValueError("No ROIs to measure.")
+        out = image_utils.measure_rois(arr, rois, metrics)
+        if meta.axes is not None and len(meta.axes) == arr.ndim:
+            # use the axis names of the image for the index columns
+            out = {
+                (meta.axes[i].name if i < arr.ndim - 2 else key): value
+                for i, (key, value) in enumerate(out.items())
+            }
+        return WidgetDataModel(
+            value=out,
+            type=StandardType.DATAFRAME,
+            title=f"Measurement of {model.title}",
+        )
+
+    return run_measure_rois
+
+
 @register_function(
     title="Set Colormap ...",
     types=StandardType.IMAGE,
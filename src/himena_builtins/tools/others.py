@@ -336,8 +336,8 @@ def show_statistics(model: WidgetDataModel) -> WidgetDataModel:
             out = f"<b>Shape:</b> {value.shape}<br><b>Min:</b> {value.min()}<br><b>Max:</b> {value.max()}<br><b>Mean:</b> {value.mean()}<br><b>Std:</b> {value.std(ddof=1)}"
     elif model.is_subtype_of(StandardType.EXCEL):
         value = model.value
-        if not isinstance(value, dict):
-            raise ValueError(f"Expected a dict but got {type(out)}")
+        if not isinstance(value, Mapping):
+            raise ValueError(f"Expected a dict but got {type(value)}")
         out = []
         for key, val in value.items():
             out.append(f"<h3><u>{key}</u></h3>{_statistics_table(val)}")
@@ -169,7 +169,7 @@ def insert_incrementing_numbers(win: SubWindow["QSpreadsheet"]) -> Parametric:
         nr, nc = widget.model()._arr.shape
         if nr < r1 or nc < c1:
             widget.array_expand(r1, c1)
-        target = widget.model()._arr
+        target = widget.model().writable_array()
         if r1 - r0 == 1:
             target[r0:r1, c0:c1] = np.array(values, dtype=target.dtype).reshape(1, -1)
         else:
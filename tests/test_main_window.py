@@ -81,6 +81,25 @@ def test_command_palette_events(himena_ui: MainWindowQt, qtbot: QtBot):
     dlg.set_title_message("Title", "Message")
     qtbot.keyClick(dlg._line, Qt.Key.Key_C)
 
+def test_command_palette_index():
+    from app_model.types import CommandRule
+    from himena.qt._qcommand_palette import _CommandIndex
+
+    titles = ["Open File", "Open Folder", "Save File", "Close Window", "Copy Path"]
+    commands = [CommandRule(id=title, title=title) for title in titles]
+    index = _CommandIndex(commands, lambda cmd: cmd.title)
+    assert [c.title for c in index.search("")] == titles
+    assert [c.title for c in index.search("o")] == [
+        "Open File", "Open Folder", "Close Window", "Copy Path"
+    ]
+    assert [c.title for c in index.search("op")] == ["Open File", "Open Folder", "Copy Path"]
+    assert [c.title for c in index.search("ope")] == ["Open File", "Open Folder"]
+    assert [c.title for c in index.search("open f")] == ["Open File", "Open Folder"]
+    assert [c.title for c in index.search("open fo")] == ["Open Folder"]
+    assert [c.title for c in index.search("file")] == ["Open File", "Save File"]
+    assert [c.title for c in index.search("fl")] == ["Open File", "Open Folder", "Save File"]
+    assert index.search("xyz") == []
+
 def test_goto_widget(himena_ui: MainWindowQt, qtbot: QtBot):
     himena_ui.show()
     tab0 = himena_ui.add_tab(title="Tab 0")
@@ -546,6 +565,30 @@ def test_process_future(make_himena_ui):
     FutureInfo(type_hint=WidgetDataModel, top_left=(10, 10)).set(future)
     himena_ui.model_app._future_done_callback(future)
 
+def test_read_files_async(make_himena_ui, sample_dir: Path):
+    himena_ui: MainWindow = make_himena_ui("mock")
+    paths = [sample_dir / "text.txt", sample_dir / "table.csv", sample_dir / "json.json"]
+    future = himena_ui.read_files_async(paths)
+    models = future.result()
+    assert [m.source for m in models] == paths
+    assert FutureInfo.get(future).streamed
+    assert len(himena_ui.tabs[0]) == 3
+    # already added, processing the future must not add them again
+    himena_ui.model_app._future_done_callback(future)
+    assert len(himena_ui.tabs[0]) == 3
+
+    future = himena_ui.read_files_async([sample_dir / "not-exist.txt"])
+    with pytest.raises(Exception):
+        future.result()
+    assert himena_ui.read_files_async([]).result() == []
+
+    himena_ui.max_concurrent_reads = 1
+    assert himena_ui.max_concurrent_reads == 1
+    models = himena_ui.read_files_async(paths).result()
+    assert [m.source for m in models] == paths
+    with pytest.raises(ValueError):
+        himena_ui.max_concurrent_reads = 0
+
 def test_dialog(himena_ui: MainWindowQt, qtbot: QtBot):
     himena_ui.show()
     himena_ui._backend_main_window._add_widget_to_dialog_no_exec(QtW.QWidget(), "title")
@@ -677,3 +720,69 @@ def test_file_delete(himena_ui: MainWindowQt, tmpdir):
         file_path.unlink()
         himena_ui._window_activated()
     assert len(himena_ui.windows) == 0
+
+_LAZY_PLUGIN_SOURCE = """
+from pathlib import Path
+from himena.plugins import register_function
+from himena.types import WidgetDataModel
+
+Path({marker!r}).write_text("imported")
+
+@register_function(menus="tools", title="Lazy Plugin Command", command_id="pytest:lazy")
+def lazy_command() -> WidgetDataModel:
+    return WidgetDataModel(value="lazy", type="text")
+"""
+
+def test_plugin_imported_lazily(tmpdir, make_himena_ui, monkeypatch: pytest.MonkeyPatch):
+    from app_model import Application
+    from himena._app_model import get_model_app
+    from himena.plugins import AppActionRegistry, install_plugins
+    from himena.profile import load_app_profile
+
+    himena_ui: MainWindow = make_himena_ui("mock")
+    plugin_path = Path(tmpdir) / "lazy_plugin.py"
+    marker = Path(tmpdir) / "marker.txt"
+    plugin_path.write_text(_LAZY_PLUGIN_SOURCE.format(marker=marker.as_posix()))
+
+    # first launch: the plugin is imported and the manifest is cached
+    load_app_profile("pytest-lazy", create_default=True)
+    app = get_model_app("pytest-lazy")
+    monkeypatch.setattr(AppActionRegistry, "_global_instance", AppActionRegistry())
+    try:
+        install_plugins(app, [str(plugin_path)])
+    finally:
+        Application.destroy("pytest-lazy")
+    assert marker.read_text() == "imported"
+    marker.unlink()
+
+    # next launch: commands are registered without importing the plugin
+    monkeypatch.setattr(AppActionRegistry, "_global_instance", AppActionRegistry())
+    install_plugins(himena_ui.model_app, [str(plugin_path)])
+    assert not marker.exists()
+    assert himena_ui.model_app.registered_actions["pytest:lazy"].title == "Lazy Plugin Command"
+    himena_ui.exec_action("pytest:lazy")
+    assert marker.exists()
+    assert himena_ui.current_model.value == "lazy"
+    himena_ui.exec_action("pytest:lazy")
+    assert len(himena_ui.tabs.current()) == 2
+
+def test_plugin_key_depends_on_package_sources(tmpdir, monkeypatch: pytest.MonkeyPatch):
+    import os
+    from himena.plugins._manifest import _package_sources_stamp, plugin_key
+
+    package = Path(tmpdir) / "pytest_key_plugin"
+    package.mkdir()
+    package.joinpath("__init__.py").write_text("")
+    package.joinpath("plugin.py").write_text("from ._impl import func\n")
+    impl = package / "_impl.py"
+    impl.write_text("def func(): pass\n")
+    monkeypatch.syspath_prepend(str(tmpdir))
+    key = plugin_key("pytest_key_plugin.plugin")
+    assert key is not None
+    assert plugin_key("pytest_key_plugin.missing") is None
+
+    # edit the module imported by the plugin module, not the plugin module itself
+    impl.write_text("def func(): return 1\n")
+    os.utime(impl, ns=(impl.stat().st_atime_ns, impl.stat().st_mtime_ns + 10**9))
+    _package_sources_stamp.cache_clear()  # sources are stamped once per launch
+    assert plugin_key("pytest_key_plugin.plugin") != key
@@ -261,3 +261,146 @@ def test_list_of_subwindows_input(
     himena_ui.load_session(tmpdir / "test.session.zip")
     assert len(himena_ui.tabs) == 1
     assert len(himena_ui.tabs.current()) == 3
+
+def test_session_workflow_steps_are_shared(
+    tmpdir,
+    make_himena_ui: Callable[..., MainWindow],
+    sample_dir,
+):
+    import yaml
+
+    himena_ui = make_himena_ui("mock")
+    tab0 = himena_ui.add_tab()
+    tab0.read_file(sample_dir / "image.png")
+    himena_ui.exec_action("builtins:image:crop-image", with_params={"y": (1, 3), "x": (1, 3)})
+    tab0.current_index = 0
+    himena_ui.exec_action("builtins:image:crop-image", with_params={"y": (0, 2), "x": (0, 2)})
+    assert len(tab0) == 3
+    workflows = [win.to_model().workflow for win in tab0]
+    session_dir = Path(tmpdir) / "session"
+    himena_ui.save_session(session_dir, allow_calculate=["builtins:image:crop-image"])
+    with session_dir.joinpath("session.yaml").open() as f:
+        yml = yaml.load(f, Loader=yaml.Loader)
+    windows = yml["tabs"][0]["windows"]
+    assert all(isinstance(win["workflow"], list) for win in windows)
+    # the reader step is stored only once
+    assert len(yml["workflow_steps"]) == 3
+    assert yml["session_format"] == 2
+
+    himena_ui.clear()
+    himena_ui.load_session(session_dir)
+    assert len(himena_ui.tabs[0]) == 3
+    for win, wf in zip(himena_ui.tabs[0], workflows):
+        assert [step.id for step in win.to_model().workflow] == [step.id for step in wf]
+
+def test_session_format_version(tmpdir, make_himena_ui: Callable[..., MainWindow]):
+    import pytest
+    import yaml
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.add_object("text", type=StandardType.TEXT)
+    session_dir = Path(tmpdir) / "session"
+    himena_ui.save_session(session_dir)
+    yaml_path = session_dir.joinpath("session.yaml")
+    yml = yaml.load(yaml_path.read_text(), Loader=yaml.Loader)
+    yml["session_format"] = 100
+    yaml_path.write_text(yaml.dump(yml, sort_keys=False))
+    with pytest.raises(ValueError, match="format 100"):
+        himena_ui.load_session(session_dir)
+
+def test_session_cannot_be_loaded_while_loading(
+    tmpdir, make_himena_ui: Callable[..., MainWindow], monkeypatch
+):
+    import pytest
+    import himena.session
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.add_object("text", type=StandardType.TEXT)
+    session_dir = Path(tmpdir) / "session"
+    himena_ui.save_session(session_dir)
+    update_from_directory = himena.session.update_from_directory
+    errors = []
+
+    def _update(ui: MainWindow, path):
+        with pytest.raises(RuntimeError) as e:
+            ui.load_session(path)
+        errors.append(e.value)
+        update_from_directory(ui, path)
+
+    monkeypatch.setattr(himena.session, "update_from_directory", _update)
+    himena_ui.clear()
+    himena_ui.load_session(session_dir)
+    assert len(errors) == 1
+    assert len(himena_ui.tabs) == 1
+    himena_ui.load_session(session_dir)  # loadable again after loading
+
+def test_session_runs_unsafe_writers_in_main_thread(
+    tmpdir, make_himena_ui: Callable[..., MainWindow]
+):
+    import threading
+    from himena.plugins import register_writer_plugin
+
+    threads = []
+
+    @register_writer_plugin(priority=1000)
+    def _write(model: WidgetDataModel, path: Path):
+        threads.append(threading.current_thread())
+        path.write_text(model.value)
+
+    @_write.define_matcher
+    def _(model: WidgetDataModel, path: Path):
+        return model.type == "text.main-thread"
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.add_object("text", type="text.main-thread", title="x.txt")
+    himena_ui.save_session(Path(tmpdir) / "session.zip")
+    assert threads == [threading.main_thread()]
+
+def test_binary_session_memmaps_arrays(
+    tmpdir,
+    make_himena_ui: Callable[..., MainWindow],
+    sample_dir,
+):
+    import numpy as np
+
+    himena_ui = make_himena_ui("mock")
+    tab0 = himena_ui.add_tab()
+    tab0.read_file(sample_dir / "image.png").update(title="Im")
+    himena_ui.exec_action("builtins:image:crop-image", with_params={"y": (1, 3), "x": (1, 3)})
+    tab1 = himena_ui.add_tab()
+    tab1.read_file(sample_dir / "text.txt")
+    arrays = [win.to_model().value for win in tab0]
+    session_path = Path(tmpdir) / "test.himena-session"
+    himena_ui.save_session(session_path, save_copies=True)
+    himena_ui.clear()
+    himena_ui.load_session(session_path)
+    tab0 = himena_ui.tabs[0]
+    assert len(tab0) == 2
+    assert tab0[0].title == "Im"
+    for win, arr in zip(tab0, arrays):
+        value = win.to_model().value
+        assert isinstance(value, np.memmap)
+        np.testing.assert_array_equal(value, arr)
+    assert himena_ui.tabs[1][0].model_type() == StandardType.TEXT
+
+def test_binary_session_save_to_mapped_file(
+    tmpdir,
+    make_himena_ui: Callable[..., MainWindow],
+    sample_dir,
+):
+    import numpy as np
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.add_tab().read_file(sample_dir / "image.png")
+    arr = np.asarray(himena_ui.tabs[0][0].to_model().value)
+    session_path = Path(tmpdir) / "test.himena-session"
+    himena_ui.save_session(session_path, save_copies=True)
+    himena_ui.clear()
+    himena_ui.load_session(session_path)
+    assert isinstance(himena_ui.tabs[0][0].to_model().value, np.memmap)
+    # the arrays to save are mapped from the file to be overwritten
+    himena_ui.save_session(session_path, save_copies=True)
+    himena_ui.clear()
+    himena_ui.load_session(session_path)
+    np.testing.assert_array_equal(himena_ui.tabs[0][0].to_model().value, arr)
+    assert [p.name for p in Path(tmpdir).iterdir()] == [session_path.name]
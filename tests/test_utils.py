@@ -90,6 +90,37 @@ def test_ndobject_collection():
     assert ndo_proj.axis_names == ["slice"]
     ndo.simplified()
 
+def test_ndobject_collection_append():
+    ndo = NDObjectCollection(axis_names=["t", "z"])
+    for i in range(100):
+        ndo.add_item([i // 10, i % 10], i)
+    assert len(ndo) == 100
+    assert ndo.items.tolist() == list(range(100))
+    assert ndo.indices.tolist() == [[i // 10, i % 10] for i in range(100)]
+    ndo_filt = ndo.filter_by_indices((3, 4))
+    assert ndo_filt.items.tolist() == [34]
+    assert ndo.mask_by_indices((0, 1)).sum() == 1
+
+    # appending to a collection sharing the same buffer must not affect the other
+    ndo_shared = NDObjectCollection(
+        items=ndo.items, indices=ndo.indices, axis_names=ndo.axis_names
+    )
+    ndo_shared.add_item([-1, -1], "x")
+    ndo.add_item([0, 0], "y")
+    assert ndo_shared[-1] == "x"
+    assert ndo[-1] == "y"
+
+    ndo.extend_from_arrays(["p", "q"], [[5, 5], [6, 6]])
+    assert len(ndo) == 103
+    assert ndo.items[-2:].tolist() == ["p", "q"]
+    assert ndo.indices[-2:].tolist() == [[5, 5], [6, 6]]
+    with pytest.raises(ValueError):
+        ndo.extend_from_arrays(["r"], [[1, 2, 3]])
+    ndo.items = ndo.items[:10]
+    ndo.indices = ndo.indices[:10]
+    ndo.add_item([9, 9], "z")
+    assert ndo.items.tolist() == list(range(10)) + ["z"]
+
 @pytest.mark.parametrize(
     "input_type, super_type, expected",
     [
@@ -290,3 +321,92 @@ def test_plugin_data_dir():
     p = plugin_data_dir("mypugin")
     assert p.exists()
     assert p.is_dir()
+
+def test_filter_proxy():
+    from himena.utils import proxy
+
+    arr = np.array([[3, 0], [1, 1], [4, 0], [1, 1], [5, 0]])
+    get_column = lambda i: arr[:, i]
+    filt = proxy.FilterProxy.from_array(1, arr, lambda x: x == 0)
+    assert filt.num_rows(5) == 3
+    assert [filt.map(i) for i in range(5)] == [0, 2, 4, 5, 6]
+    assert_equal(filt.map(np.arange(5)), [0, 2, 4, 5, 6])
+    prx = proxy.toggle_sort(filt, 0, get_column)
+    assert isinstance(prx, proxy.SortFilterProxy)
+    assert_equal(prx.map(np.arange(4)), [0, 2, 4, 5])
+    prx = proxy.toggle_sort(prx, 0, get_column)
+    assert_equal(prx.map(np.arange(4)), [4, 2, 0, 5])
+    assert proxy.toggle_sort(prx, 0, get_column) is filt
+
+    # update after editing a value
+    arr[1, 1] = 0
+    prx = prx.recalculate(get_column, 5, rows=1)
+    assert prx.num_rows(5) == 4
+    assert_equal(prx.map(np.arange(4)), [4, 2, 0, 1])
+    assert prx.depends_on(slice(0, 1)) and prx.depends_on(1)
+    prx.remap_columns(lambda i: i + 1)
+    assert prx.index == 1 and prx.filter.index == 2
+    assert isinstance(proxy.with_filter(prx, None, lambda i: arr[:, i - 1]), proxy.SortProxy)
+
+    # predicates are not always elementwise, so the whole mask is recomputed
+    arr = np.array([[1], [2], [3], [4]])
+    filt = proxy.FilterProxy.from_array(0, arr, lambda x: x > x.mean())
+    assert_equal(filt.rows, [2, 3])
+    arr[0, 0] = 10
+    filt = filt.recalculate(lambda i: arr[:, i], 4, rows=0)
+    assert_equal(filt.rows, [0])
+
+    # elementwise predicates are only evaluated for the edited rows
+    calls = []
+
+    def _predicate(x):
+        calls.append(x.size)
+        return x > 2
+
+    filt = proxy.FilterProxy.from_array(0, arr, _predicate, elementwise=True)
+    assert_equal(filt.rows, [0, 2, 3])
+    arr[1:3, 0] = [5, 0]
+    filt = filt.recalculate(lambda i: arr[:, i], 4, rows=slice(1, 3))
+    assert_equal(filt.rows, [0, 1, 3])
+    filt = filt.recalculate(lambda i: arr[:, i], 4, rows=np.array([2]))
+    assert calls == [4, 2, 1]
+    arr = np.array([[1], [2], [3], [4], [5]])
+    filt = filt.recalculate(lambda i: arr[:, i], 5, rows=0)
+    assert_equal(filt.rows, [2, 3, 4])
+    assert calls[-1] == 5
+
+def test_typed_columns():
+    from himena.standards.model_meta import TableMeta
+    from himena.types import WidgetDataModel
+    from himena.utils.table_selection import (
+        TypedColumns, model_to_xy_arrays, table_to_xy_arrays
+    )
+
+    table = _str_array(
+        [["x", "y", "label"]] + [[i, i * 2 if i != 3 else "", "a"] for i in range(8)]
+    )
+    x, ys = table_to_xy_arrays(table, ((0, 9), (0, 1)), ((0, 9), (1, 2)))
+    assert x.name == "x" and ys[0].name == "y"
+    assert_equal(x.array, np.arange(8))
+    assert_equal(ys[0].array, [0, 2, 4, np.nan, 8, 10, 12, 14])
+
+    typed = TypedColumns(table)
+    assert_equal(typed.column_f64(0, 1, 9), np.arange(8))  # header row is skipped
+    ys[0].array[0] = -1  # returned arrays are copies
+    assert_equal(typed.column_f64(1, 2, 5), [2, 4, np.nan])
+    with pytest.raises(ValueError):
+        typed.column_f64(2, 1, 9)  # not numeric
+    with pytest.raises(ValueError):
+        typed.column_f64(0, 0, 9)
+
+    # typed columns are only used for the table they are parsed from
+    meta = TableMeta()
+    meta._typed_columns = typed
+    model = WidgetDataModel(value=table, type="table", metadata=meta)
+    x, ys = model_to_xy_arrays(model, ((0, 9), (0, 1)), ((0, 9), (1, 2)))
+    assert_equal(ys[0].array, [0, 2, 4, np.nan, 8, 10, 12, 14])
+    other = table.copy()
+    other[1, 1] = "100"
+    model = WidgetDataModel(value=other, type="table", metadata=meta)
+    x, ys = model_to_xy_arrays(model, ((0, 9), (0, 1)), ((0, 9), (1, 2)))
+    assert_equal(ys[0].array, [100, 2, 4, np.nan, 8, 10, 12, 14])
@@ -1,11 +1,13 @@
 from typing import Callable
 
+import pytest
+
 from himena import MainWindow
 from pathlib import Path
 
 from himena.consts import StandardType
 from himena.testing import file_dialog_response
-from himena.workflow import LocalReaderMethod, CommandExecution, RemoteReaderMethod, WslReaderMethod
+from himena.workflow import LocalReaderMethod, CommandExecution, RemoteReaderMethod, WslReaderMethod, Workflow
 
 def test_compute_workflow(make_himena_ui: Callable[..., MainWindow], sample_dir: Path, tmpdir):
     himena_ui = make_himena_ui("mock")
@@ -112,3 +114,192 @@ def test_reader_methods():
     meth = WslReaderMethod.from_str("/path/to/file1;/path/to/file2")
     assert meth.path == [Path("/path/to/file1"), Path("/path/to/file2")]
     assert meth.to_str() == "/path/to/file1;/path/to/file2"
+
+def test_compute_parallel(make_himena_ui: Callable[..., MainWindow], sample_dir: Path):
+    from himena.workflow import WorkflowScheduler, compute
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.read_file(sample_dir / "table.csv")
+    win0 = himena_ui.current_window
+    himena_ui.read_file(sample_dir / "text.txt")
+    win1 = himena_ui.current_window
+    himena_ui.exec_action("builtins:table-to-text", with_params={}, window_context=win0)
+    win2 = himena_ui.current_window
+    himena_ui.exec_action("builtins:table-to-dataframe", window_context=win0)
+    win3 = himena_ui.current_window
+
+    wfs = [win.to_model().workflow for win in [win1, win2, win3]]
+    results_serial = compute(wfs)
+    results_parallel = compute(wfs, parallel=True, max_workers=2)
+    for r0, r1 in zip(results_serial, results_parallel):
+        assert r0.type == r1.type
+        assert r1.workflow is not None
+    assert results_parallel[0].value == win1.to_model().value
+    assert results_parallel[1].value == win2.to_model().value
+    model = wfs[1].compute(process_output=False, parallel=True)
+    assert model.value == win2.to_model().value
+    computed = []
+    compute(wfs, parallel=True, callback=lambda i, out: computed.append((i, out.type)))
+    assert sorted(computed) == [(i, r.type) for i, r in enumerate(results_serial)]
+
+    wf_all = Workflow.concat(wfs)
+    scheduler = WorkflowScheduler(wf_all)
+    order = scheduler.topological_order([wfs[1].last_id(), wfs[2].last_id()])
+    assert len(order) == 3
+    assert order[0] == wfs[1].steps[0].id
+    with wf_all._cache_context():
+        out = scheduler.run([wfs[1].last_id(), wfs[2].last_id()])
+    assert set(out) == set(order)
+    assert set(scheduler.timings) == set(order)
+
+def test_compute_parallel_error(make_himena_ui: Callable[..., MainWindow], tmpdir):
+    from himena.workflow import compute
+
+    himena_ui = make_himena_ui("mock")
+    path = Path(tmpdir) / "test.txt"
+    path.write_text("abc")
+    himena_ui.read_file(path)
+    himena_ui.exec_action("builtins:text:change-separator", with_params={"old": "a", "new": "b"})
+    wf = himena_ui.current_model.workflow
+    path.unlink()
+    computed = []
+    results = compute([wf, wf], parallel=True, callback=lambda i, _: computed.append(i))
+    assert all(isinstance(r, Exception) for r in results)
+    assert sorted(computed) == [0, 1]
+
+def test_disk_cache(make_himena_ui: Callable[..., MainWindow], sample_dir: Path, tmpdir, monkeypatch):
+    from himena.workflow import WorkflowDiskCache, set_disk_cache
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.read_file(sample_dir / "table.csv")
+    himena_ui.exec_action("builtins:table-to-text", with_params={})
+    wf = himena_ui.current_model.workflow
+    cache = WorkflowDiskCache(Path(tmpdir) / "cache")
+    set_disk_cache(cache)
+    try:
+        model0 = wf.compute(process_output=False)
+        assert len(cache) == 2
+        n_called = 0
+        _old = CommandExecution._get_model_impl
+
+        def _get_model_impl(self, wf):
+            nonlocal n_called
+            n_called += 1
+            return _old(self, wf)
+
+        monkeypatch.setattr(CommandExecution, "_get_model_impl", _get_model_impl)
+        model1 = wf.compute(process_output=False)
+        assert n_called == 0
+        assert model1.value == model0.value
+        assert model1.workflow is wf
+
+        # different command gives a different key
+        step = wf[-1].model_copy(update={"command_id": "builtins:table-to-dataframe"})
+        wf2 = Workflow(steps=[wf[0], step])
+        assert wf2._content_hash(wf2[0].id) == wf._content_hash(wf[0].id)
+        assert wf2._content_hash(step.id) != wf._content_hash(wf.last_id())
+
+        # LRU eviction
+        small_cache = WorkflowDiskCache(Path(tmpdir) / "cache2", max_size=1)
+        set_disk_cache(small_cache)
+        wf.compute(process_output=False)
+        assert len(small_cache) == 0
+    finally:
+        set_disk_cache(None)
+
+def test_incremental_workflow(make_himena_ui: Callable[..., MainWindow], sample_dir: Path, monkeypatch):
+    from himena.workflow import IncrementalWorkflow
+
+    himena_ui = make_himena_ui("mock")
+    himena_ui.read_file(sample_dir / "table.csv")
+    himena_ui.exec_action("builtins:table-to-text", with_params={})
+    himena_ui.exec_action(
+        "builtins:text:change-separator", with_params={"old": ",", "new": ";"}
+    )
+    wf = himena_ui.current_model.workflow
+    assert len(wf) == 3
+    n_read = 0
+    _old = LocalReaderMethod._get_model_impl
+
+    def _get_model_impl(self, wf):
+        nonlocal n_read
+        n_read += 1
+        return _old(self, wf)
+
+    monkeypatch.setattr(LocalReaderMethod, "_get_model_impl", _get_model_impl)
+    engine = IncrementalWorkflow(wf)
+    out0 = engine.compute(process_output=False)
+    assert ";" in out0.value
+    assert n_read == 1
+    assert not any(engine.is_dirty(step.id) for step in wf)
+
+    engine.set_parameter(wf.last_id(), "new", "|")
+    assert not engine.is_dirty(wf[0].id)
+    assert not engine.is_dirty(wf[1].id)
+    assert engine.is_dirty(wf.last_id())
+    out1 = engine.compute(process_output=False)
+    assert "|" in out1.value
+    assert n_read == 1
+    assert out1.workflow is engine.workflow
+
+    engine.invalidate(wf[0].id)
+    assert all(engine.is_dirty(step.id) for step in wf)
+    engine.compute(process_output=False)
+    assert n_read == 2
+
+def test_incremental_workflow_reads_modified_file(
+    make_himena_ui: Callable[..., MainWindow],
+    tmpdir,
+):
+    from himena.workflow import IncrementalWorkflow
+
+    himena_ui = make_himena_ui("mock")
+    path = Path(tmpdir) / "text.txt"
+    path.write_text("old")
+    himena_ui.read_file(path)
+    engine = IncrementalWorkflow(himena_ui.current_model.workflow)
+    assert engine.compute(process_output=False).value == "old"
+    assert engine.compute(process_output=False).value == "old"
+    path.write_text("new content")
+    assert engine.compute(process_output=False).value == "new content"
+
+def test_workflow_index():
+    from himena.workflow import ModelParameter, ProgrammaticMethod
+
+    root = ProgrammaticMethod()
+    wf = Workflow(steps=[root])
+    for _ in range(500):
+        step = CommandExecution(
+            command_id="cmd",
+            contexts=[ModelParameter(name="x", value=wf.last_id(), model_type="any")],
+        )
+        wf = wf.with_step(step)
+    assert len(wf) == 501
+    assert wf.index_for_id(wf.last_id()) == 500
+    assert wf.step_for_id(wf[250].id) is wf[250]
+    assert list(wf.iter_children(root.id)) == [wf[1].id]
+    assert list(wf.iter_children(wf.last_id())) == []
+    assert len(wf.filter(wf[300].id)) == 301
+    assert wf.id_to_index_map() == {step.id: i for i, step in enumerate(wf)}
+
+    branch = CommandExecution(
+        command_id="cmd",
+        contexts=[ModelParameter(name="x", value=root.id, model_type="any")],
+    )
+    wf_branch = Workflow(steps=[root]).with_step(branch)
+    wf_all = Workflow.concat([wf, wf_branch])
+    assert len(wf_all) == 502
+    assert set(wf_all.iter_children(root.id)) == {wf[1].id, branch.id}
+    assert list(wf.iter_children(root.id)) == [wf[1].id]  # not affected
+    assert len(wf_all.filter(branch.id)) == 2
+    with pytest.raises(ValueError):
+        wf.index_for_id(branch.id)
+
+    # assigning new steps or appending a step invalidates the index
+    replaced = ProgrammaticMethod()
+    wf.steps = wf.steps[:100] + [replaced] + wf.steps[101:]
+    assert wf.index_for_id(replaced.id) == 100
+    assert list(wf.iter_children(replaced.id)) == []
+    appended = ProgrammaticMethod()
+    wf.steps.append(appended)
+    assert wf.index_for_id(appended.id) == 501